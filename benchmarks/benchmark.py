@@ -0,0 +1,375 @@
+'''
+Benchmarks for the hot paths of greprep.py
+
+Every run builds synthetic datasets that are 1x, 10x, 100x ... the size of the current
+vocabulary from the real word lists, with a fixed seed, in a temporary folder. greprep.py is
+pointed at each dataset in turn and the results are printed (or saved) as JSON.
+
+    python benchmarks/benchmark.py --output results.json
+    python benchmarks/benchmark.py --scales 1 10 100 1000 --output results.json
+    python benchmarks/benchmark.py --compare old.json --output new.json
+'''
+import argparse
+import csv
+import datetime
+import importlib.util
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BenchmarkFolder = Path(__file__).parent.resolve()
+FixturesFolder = BenchmarkFolder / "fixtures"
+RepositoryFolder = BenchmarkFolder.parent
+sys.path.insert(0, str(RepositoryFolder))
+
+import greprep
+
+Seed = 1234
+Letters = "abcdefghijklmnopqrstuvwxyz"
+
+def SyntheticWord(word, Copy):
+    # Copy 0 is the real word, the others get a letter suffix so they still look like words
+    Suffix = ""
+    while Copy > 0:
+        Copy, Letter = divmod(Copy - 1, 26)
+        Suffix = Letters[Letter] + Suffix
+    return word + Suffix
+
+def BuildDataset(Folder, Scale, Rng):
+    '''
+    Write GREWordList.json, vocabulary.json, TestedWords.json, TestScores.csv and answers.log
+    Scale times the size of the real files into Folder, progress.db is imported from them
+    '''
+    with open(RepositoryFolder / "GREWordList.json", 'r') as f:
+        WordLists = json.load(f)
+    with open(RepositoryFolder / "vocabulary.json", 'r') as f:
+        Vocabulary = json.load(f)
+
+    ScaledLists = {}
+    for ListName, Words in WordLists.items():
+        for Copy in range(Scale):
+            Name = ListName if Copy == 0 else "{} {}".format(ListName, Copy)
+            ScaledLists[Name] = [{'word': SyntheticWord(Item['word'], Copy), 'Definition': Item['Definition']} for Item in Words]
+    with open(Folder / "GREWordList.json", 'w') as f:
+        json.dump(ScaledLists, f)
+
+    # Written entry by entry so the 1000x vocabulary never has to be held in memory twice
+    with open(Folder / "vocabulary.json", 'w') as f:
+        f.write("{")
+        First = True
+        for Copy in range(Scale):
+            for word, Entry in Vocabulary.items():
+                f.write(("" if First else ",") + json.dumps(SyntheticWord(word, Copy)) + ":" + json.dumps(Entry))
+                First = False
+        f.write("}")
+
+    AllWords = [Item for Words in ScaledLists.values() for Item in Words]
+    Learnt = Rng.sample(AllWords, min(len(AllWords), 150 * Scale))
+    with open(Folder / "TestedWords.json", 'w') as f:
+        json.dump({Item['word']: Item['Definition'] for Item in Learnt}, f)
+
+    TestTypes = ["MCQ (Learnt Words)", "MCQ (Random Words)", "Written Test (Learnt Words)", "Written Test (Random Words)"]
+    Day = datetime.datetime(2022, 8, 15)
+    with open(Folder / "TestScores.csv", 'w') as f, open(Folder / "answers.log", 'wb') as Log:
+        writer = csv.writer(f)
+        for i in range(100 * Scale):
+            Total = Rng.randint(5, 30)
+            TestType = Rng.choice(TestTypes)
+            TimeStamp = (Day + datetime.timedelta(hours=8 * i))
+            writer.writerow([TestType, "{}/{}".format(Rng.randint(0, Total), Total), "00:{:02d}:{:02d}".format(Rng.randint(0, 20), Rng.randint(0, 59)), TimeStamp.strftime("%d/%m/%Y %I:%M %p")])
+            # Every answer of the test, for the "default" profile that progress.db is imported into
+            for Item in Rng.sample(Learnt, min(Total, len(Learnt))):
+                word = Item['word'].encode('utf-8')
+                Written = TestType.startswith("Written")
+                Log.write(greprep.AnswerRecord.pack(int(TimeStamp.timestamp()), Rng.uniform(1, 20), 1, TestTypes.index(TestType), 2 if Written else Rng.randint(0, 1),
+                                                 0 if Written else Rng.randint(1, 4), Rng.random() < 0.7, len(word)) + word)
+
+    with open(Folder / "Stats.txt", 'w') as f:
+        f.write('StartDate = "15/08/2022"\nCount = 1\nToday = "15/08/2022"\nStreak = 1\nMaxStreak = 1\nStreakDays = 15')
+
+def UseDataset(Folder):
+    # Point greprep.py at the dataset and drop everything it built for the previous one
+    greprep.DataFolder = Folder
+    greprep.GREWordList = Folder / "GREWordList.json"
+    greprep.VocabularyList = Folder / "vocabulary.json"
+    greprep.TestedWordsList = Folder / "TestedWords.json"
+    greprep.StatsFile = Folder / "Stats.txt"
+    greprep.TestScoresFile = Folder / "TestScores.csv"
+    greprep.VocabularyIndexFile = Folder / "vocabulary.idx"
+    greprep.VocabularyDataFile = Folder / "vocabulary.dat"
+    greprep.VocabularyJournalFile = Folder / "vocabulary.journal"
+    greprep.TestedWordsJournalFile = Folder / "TestedWords.journal"
+    greprep.FullTextIndexFile = Folder / "vocabulary.fts.json"
+    greprep.DistractorIndexFile = Folder / "distractors.json"
+    greprep.ReviewScheduleFile = Folder / "ReviewSchedule.json"
+    greprep.ReviewScheduleJournalFile = Folder / "ReviewSchedule.journal"
+    greprep.ProgressDatabaseFile = Folder / "progress.db"
+    greprep.EventLogFile = Folder / "events.jsonl"
+    greprep.AnswerLogFile = Folder / "answers.log"
+    if greprep.ProgressConnection is not None:
+        greprep.ProgressConnection.close()
+    greprep.ProgressConnection = None
+    greprep.ProfileId = None
+    greprep.GlobalDictionary = greprep.LazyDictionary(greprep.LoadWordLists)
+    greprep.VocabDictionary = greprep.LazyDictionary(greprep.LoadVocabulary)
+    greprep.Bank = None
+    greprep.VocabularySearchIndex = None
+    greprep.VocabularyFullTextIndex = None
+
+def Measure(Function, Repeat, Setup=None):
+    Times = []
+    for _ in range(Repeat):
+        if Setup is not None:
+            Setup()
+        StartTime = time.perf_counter()
+        Function()
+        Times.append(time.perf_counter() - StartTime)
+    return Times
+
+def Result(Name, Scale, Times, Operations=1):
+    # Times are for Operations operations each, the per operation time is reported too
+    return {
+        'name': Name,
+        'scale': Scale,
+        'repeat': len(Times),
+        'operations': Operations,
+        'min_ms': round(min(Times) * 1000, 4),
+        'median_ms': round(statistics.median(Times) * 1000, 4),
+        'mean_ms': round(statistics.mean(Times) * 1000, 4),
+        'per_operation_us': round(statistics.median(Times) / Operations * 1e6, 4),
+    }
+
+def JSONLoad(FilePath):
+    with open(FilePath, 'r') as f:
+        return json.load(f)
+
+def MemoryResult(Name, Scale, Loader):
+    # Memory held by what Loader returns, and the most used while it ran
+    tracemalloc.start()
+    Value = Loader()
+    Current, Peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Held until it is measured, so Current counts it
+    del Value
+    return {'name': Name, 'scale': Scale, 'bytes': Current, 'peak_bytes': Peak}
+
+def BenchmarkLoad(Folder, Scale, Repeat):
+    Results = []
+    Results.append(Result("load.json.GREWordList", Scale, Measure(lambda: JSONLoad(Folder / "GREWordList.json"), Repeat)))
+    Results.append(Result("load.word_lists", Scale, Measure(greprep.LoadWordLists, Repeat)))
+    Results.append(MemoryResult("memory.word_lists.json", Scale, lambda: JSONLoad(Folder / "GREWordList.json")))
+    Results.append(MemoryResult("memory.word_lists.store", Scale, greprep.LoadWordLists))
+    Results.append(Result("load.json.vocabulary", Scale, Measure(lambda: JSONLoad(Folder / "vocabulary.json"), Repeat)))
+
+    def RemoveStore():
+        for FilePath in (greprep.VocabularyIndexFile, greprep.VocabularyDataFile):
+            if FilePath.exists():
+                FilePath.unlink()
+    Results.append(Result("load.store.build", Scale, Measure(lambda: greprep.LoadVocabulary().Close(), Repeat, RemoveStore)))
+    Results.append(Result("load.store.open", Scale, Measure(lambda: greprep.LoadVocabulary().Close(), Repeat)))
+    return Results
+
+def BenchmarkSearch(Folder, Scale, Repeat, Rng):
+    Results = []
+    Words = list(greprep.VocabDictionary.keys())
+    Queries = Rng.sample(Words, min(1000, len(Words)))
+
+    def ExactLookups():
+        Index = greprep.GetSearchIndex()
+        for word in Queries:
+            greprep.VocabDictionary[Index.Get(word)]
+    greprep.GetSearchIndex()
+    Results.append(Result("search.exact", Scale, Measure(ExactLookups, Repeat), len(Queries)))
+
+    # One letter dropped from every query
+    Misspelt = [word[:len(word) // 2] + word[len(word) // 2 + 1:] for word in Queries[:200]]
+    def FuzzyLookups():
+        Index = greprep.GetSearchIndex()
+        for word in Misspelt:
+            Index.Suggest(word)
+    Results.append(Result("search.fuzzy", Scale, Measure(FuzzyLookups, Repeat), len(Misspelt)))
+
+    def BuildIndex():
+        greprep.VocabularySearchIndex = None
+        greprep.VocabDictionary.Listeners.clear()
+        greprep.GetSearchIndex()
+    Results.append(Result("search.index_build", Scale, Measure(BuildIndex, min(Repeat, 3))))
+    return Results
+
+def BenchmarkTests(Folder, Scale, Repeat, Rng):
+    Results = []
+    Results.append(Result("tests.bank_build", Scale, Measure(lambda: greprep.QuestionBank(greprep.GlobalDictionary), Repeat)))
+    Bank = greprep.GetQuestionBank()
+    NoOfQuestions = 100
+
+    def MCQForm():
+        FormRng = random.Random(Seed)
+        Bank.BuildTestForm(Bank.Sample(NoOfQuestions, FormRng), greprep.NoOfChoices, FormRng)
+    Results.append(Result("tests.mcq_form", Scale, Measure(MCQForm, Repeat), NoOfQuestions))
+
+    def WrittenForm():
+        FormRng = random.Random(Seed)
+        Bank.BuildTestForm(Bank.Sample(NoOfQuestions, FormRng), 0, FormRng)
+    Results.append(Result("tests.written_form", Scale, Measure(WrittenForm, Repeat), NoOfQuestions))
+
+    Results.append(Result("tests.grader_build", Scale, Measure(lambda: greprep.AnswerGrader(Bank.Words), Repeat)))
+    Grader = greprep.AnswerGrader(Bank.Words)
+    # Right answers, inflections, typos and unrelated words in equal parts
+    Answers = []
+    for word in Rng.sample(Bank.Words, min(1000, len(Bank))):
+        Answers.append((word, Rng.choice([word, word + "s", word[:-1] + "x", Rng.choice(Bank.Words)])))
+    def GradeAnswers():
+        for word, Answer in Answers:
+            Grader.Grade(word, Answer)
+    Results.append(Result("tests.grade_answers", Scale, Measure(GradeAnswers, Repeat), len(Answers)))
+
+    if importlib.util.find_spec("numpy") is None:
+        return Results
+    if len(Bank) <= 50000:
+        Results.append(Result("tests.distractor_index_build", Scale, Measure(lambda: greprep.BuildDistractorIndex(Bank), 1)))
+        Bank.LoadNeighbours()
+        def HardForm():
+            FormRng = random.Random(Seed)
+            Bank.BuildTestForm(Bank.Sample(NoOfQuestions, FormRng), greprep.NoOfChoices, FormRng, True)
+        Results.append(Result("tests.mcq_form_hard", Scale, Measure(HardForm, Repeat), NoOfQuestions))
+    return Results
+
+def BenchmarkStats(Folder, Scale, Repeat):
+    Results = []
+
+    def RemoveProgressStore():
+        if greprep.ProgressConnection is not None:
+            greprep.ProgressConnection.close()
+        greprep.ProgressConnection = None
+        greprep.ProfileId = None
+        for Suffix in ("", "-wal", "-shm"):
+            Path(str(greprep.ProgressDatabaseFile) + Suffix).unlink(missing_ok=True)
+    Results.append(Result("stats.import_progress_files", Scale, Measure(greprep.GetProgressStore, Repeat, RemoveProgressStore)))
+
+    Results.append(Result("stats.read_scores", Scale, Measure(greprep.ReadScores, Repeat)))
+    Results.append(Result("stats.read_scores_tail", Scale, Measure(lambda: greprep.ReadScores(greprep.StatsTableLength), Repeat)))
+    Results.append(Result("stats.aggregates_load", Scale, Measure(greprep.LoadAggregates, Repeat)))
+    Results.append(Result("stats.streaks", Scale, Measure(lambda: greprep.StreakInfo(datetime.date(2022, 8, 15)), Repeat)))
+    Results.append(Result("stats.due_words", Scale, Measure(lambda: greprep.ReviewScheduler(datetime.date(2022, 8, 15)).DueWords(20), Repeat)))
+
+    def ForgetWordStats():
+        with greprep.ProgressConnection:
+            greprep.ProgressConnection.execute("DELETE FROM WordStats")
+            greprep.ProgressConnection.execute("DELETE FROM AnswerLogState")
+    Results.append(Result("stats.compact_answer_log", Scale, Measure(lambda: greprep.CompactAnswerLog(greprep.ProgressConnection), Repeat, ForgetWordStats)))
+    Results.append(Result("stats.hardest_words", Scale, Measure(lambda: greprep.HardestWords(50), Repeat)))
+    Results.append(Result("stats.adaptive_sampler_build", Scale, Measure(greprep.AdaptiveSampler, Repeat)))
+    Sampler = greprep.AdaptiveSampler()
+    Results.append(Result("stats.adaptive_draw", Scale, Measure(lambda: Sampler.Draw(100, random.Random(Seed)), Repeat), 100))
+
+    if importlib.util.find_spec("numpy") is None:
+        return Results
+    Aggregates = greprep.LoadAggregates()
+    Results.append(Result("stats.rolling_average", Scale, Measure(lambda: greprep.RollingAverages(Aggregates), Repeat)))
+    return Results
+
+def ScaledListPage(NoOfEntries):
+    # The saved list page with its entries repeated until it has NoOfEntries entries
+    with open(FixturesFolder / "list.html", 'r') as f:
+        Lines = f.read().split("\n")
+    Entries = [line for line in Lines if line.startswith("<li ")]
+    Before = Lines[:Lines.index(Entries[0])]
+    After = Lines[Lines.index(Entries[-1]) + 1:]
+    Scaled = []
+    for i in range(NoOfEntries):
+        Entry = Entries[i % len(Entries)]
+        Scaled.append(Entry.replace('id="entry{}"'.format(i % len(Entries)), 'id="entry{}"'.format(i), 1))
+    return "\n".join(Before + Scaled + After)
+
+def BenchmarkParsing(Scale, Repeat):
+    Results = []
+    NoOfEntries = 100 * Scale
+    Page = ScaledListPage(NoOfEntries)
+    Results.append(Result("parse.list_page.html_parser", Scale, Measure(lambda: greprep.ParseListPage(Page, "html.parser"), Repeat), NoOfEntries))
+    if importlib.util.find_spec("lxml") is not None:
+        Results.append(Result("parse.list_page.lxml", Scale, Measure(lambda: greprep.ParseListPage(Page, "lxml"), Repeat), NoOfEntries))
+
+    with open(FixturesFolder / "word.html", 'r') as f:
+        WordPage = f.read()
+    Results.append(Result("parse.word_page", Scale, Measure(lambda: greprep.ParseWordMeaning("abase", WordPage), Repeat * 10)))
+    return Results
+
+def GitRevision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RepositoryFolder, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+def Compare(OldPath, Report):
+    with open(OldPath, 'r') as f:
+        Old = {(Item['name'], Item['scale']): Item for Item in json.load(f)['results']}
+    print("{:<32} {:>6} {:>12} {:>12} {:>8}".format("benchmark", "scale", "old ms", "new ms", "ratio"), file=sys.stderr)
+    for Item in Report['results']:
+        Previous = Old.get((Item['name'], Item['scale']))
+        if Previous is None:
+            continue
+        if 'bytes' in Item:
+            Ratio = Item['bytes'] / Previous['bytes'] if Previous['bytes'] > 0 else float('inf')
+            print("{:<32} {:>6} {:>12} {:>12} {:>7.2f}x".format(Item['name'], Item['scale'], Previous['bytes'], Item['bytes'], Ratio), file=sys.stderr)
+            continue
+        Ratio = Item['median_ms'] / Previous['median_ms'] if Previous['median_ms'] > 0 else float('inf')
+        print("{:<32} {:>6} {:>12.3f} {:>12.3f} {:>7.2f}x".format(Item['name'], Item['scale'], Previous['median_ms'], Item['median_ms'], Ratio), file=sys.stderr)
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Benchmark the hot paths of greprep.py on synthetic datasets")
+    Parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="dataset sizes as multiples of the current vocabulary (1000 needs several GB of memory)")
+    Parser.add_argument("--repeat", type=int, default=5, help="number of timed runs of every benchmark")
+    Parser.add_argument("--only", nargs="+", choices=["load", "search", "tests", "stats", "parse"], help="run only these groups")
+    Parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    Parser.add_argument("--compare", help="JSON report of an earlier run to compare with")
+    Arguments = Parser.parse_args()
+    Groups = set(Arguments.only or ["load", "search", "tests", "stats", "parse"])
+
+    Report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'revision': GitRevision(),
+            'time': datetime.datetime.now().isoformat(timespec='seconds'),
+            'seed': Seed,
+            'repeat': Arguments.repeat,
+        },
+        'results': [],
+    }
+    for Scale in Arguments.scales:
+        print("Scale {}x".format(Scale), file=sys.stderr)
+        with tempfile.TemporaryDirectory() as Temp:
+            Folder = Path(Temp)
+            Rng = random.Random(Seed)
+            BuildDataset(Folder, Scale, Rng)
+            UseDataset(Folder)
+            if "load" in Groups:
+                Report['results'].extend(BenchmarkLoad(Folder, Scale, Arguments.repeat))
+            if "search" in Groups:
+                Report['results'].extend(BenchmarkSearch(Folder, Scale, Arguments.repeat, Rng))
+            if "tests" in Groups:
+                Report['results'].extend(BenchmarkTests(Folder, Scale, Arguments.repeat, Rng))
+            if "stats" in Groups:
+                Report['results'].extend(BenchmarkStats(Folder, Scale, Arguments.repeat))
+            if "parse" in Groups:
+                Report['results'].extend(BenchmarkParsing(Scale, Arguments.repeat))
+            greprep.VocabDictionary.Close()
+
+    Output = json.dumps(Report, indent=2)
+    if Arguments.output:
+        with open(Arguments.output, 'w') as f:
+            f.write(Output + "\n")
+    else:
+        print(Output)
+    if Arguments.compare:
+        Compare(Arguments.compare, Report)
+
+if __name__ == '__main__':
+    Main()
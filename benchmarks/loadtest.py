@@ -0,0 +1,144 @@
+'''
+Load test for the HTTP server (python main.py serve)
+
+Opens --connections keep-alive connections at the same time and sends about --requests requests
+in total: word searches, list pages, searches by meaning and whole MCQ tests (start and every
+answer). The latency percentiles of every route and the throughput are printed as JSON.
+Tests are taken as the "loadtest" profile, so their scores stay out of everyone else's stats.
+
+    python main.py serve &
+    python benchmarks/loadtest.py --connections 200 --requests 20000
+    python benchmarks/loadtest.py --spawn --output load.json
+'''
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+RepositoryFolder = Path(__file__).parent.resolve().parent
+Seed = 1234
+
+# Share of the requests of every kind
+Mix = [("search", 0.5), ("list", 0.2), ("meaning", 0.2), ("test", 0.1)]
+
+async def Send(Reader, Writer, Method, Target, Body=None):
+    Content = json.dumps(Body).encode('utf-8') if Body is not None else b""
+    Writer.write("{} {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n".format(Method, Target, len(Content)).encode('latin-1') + Content)
+    await Writer.drain()
+    Status = int((await Reader.readline()).split()[1])
+    Length = 0
+    while True:
+        line = await Reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        Name, _, Value = line.decode('latin-1').partition(":")
+        if Name.lower() == "content-length":
+            Length = int(Value)
+    Data = json.loads(await Reader.readexactly(Length))
+    if Status != 200:
+        raise RuntimeError("{} {} returned {}: {}".format(Method, Target, Status, Data))
+    return Data
+
+async def Client(Host, Port, NoOfRequests, Words, ListNames, Rng, Latencies):
+    Reader, Writer = await asyncio.open_connection(Host, Port)
+
+    async def Timed(Route, Method, Target, Body=None):
+        StartTime = time.perf_counter()
+        Data = await Send(Reader, Writer, Method, Target, Body)
+        Latencies.setdefault(Route, []).append(time.perf_counter() - StartTime)
+        return Data
+
+    Sent = 0
+    while Sent < NoOfRequests:
+        Kind = Rng.choices([Name for Name, _ in Mix], [Weight for _, Weight in Mix])[0]
+        if Kind == "search":
+            # Every fourth search has a typo so the suggestions are exercised too
+            word = Rng.choice(Words)
+            if Sent % 4 == 0 and len(word) > 3:
+                word = word[:2] + word[3:]
+            await Timed("GET /search", "GET", "/search?word=" + quote(word))
+            Sent += 1
+        elif Kind == "list":
+            await Timed("GET /lists/<name>", "GET", "/lists/{}?start={}&n=20".format(quote(Rng.choice(ListNames)), Rng.randint(1, 100)))
+            Sent += 1
+        elif Kind == "meaning":
+            await Timed("GET /meaning", "GET", "/meaning?q=" + quote(" ".join(Rng.sample(Words, 2))))
+            Sent += 1
+        else:
+            Test = await Timed("POST /tests", "POST", "/tests", {'type': "mcq-random", 'n': 5, 'profile': "loadtest"})
+            Sent += 1
+            for Question in Test['questions']:
+                await Timed("POST /tests/<id>/answer", "POST", "/tests/{}/answer".format(Test['session']), {'answer': Rng.randint(1, len(Question['choices']))})
+                Sent += 1
+    Writer.close()
+
+def Summary(Times, Duration):
+    Quantiles = statistics.quantiles(Times, n=100) if len(Times) > 1 else Times * 99
+    return {
+        'requests': len(Times),
+        'per_second': round(len(Times) / Duration, 1),
+        'mean_ms': round(statistics.mean(Times) * 1000, 3),
+        'p50_ms': round(Quantiles[49] * 1000, 3),
+        'p95_ms': round(Quantiles[94] * 1000, 3),
+        'p99_ms': round(Quantiles[98] * 1000, 3),
+        'max_ms': round(max(Times) * 1000, 3),
+    }
+
+async def Run(Arguments, Words, ListNames):
+    Rng = random.Random(Seed)
+    Latencies = {}
+    PerClient = max(1, Arguments.requests // Arguments.connections)
+    StartTime = time.perf_counter()
+    await asyncio.gather(*[Client(Arguments.host, Arguments.port, PerClient, Words, ListNames, random.Random(Rng.random()), Latencies) for _ in range(Arguments.connections)])
+    Duration = time.perf_counter() - StartTime
+
+    AllTimes = [Latency for Times in Latencies.values() for Latency in Times]
+    return {
+        'connections': Arguments.connections,
+        'seconds': round(Duration, 3),
+        'all': Summary(AllTimes, Duration),
+        'routes': {Route: Summary(Times, Duration) for Route, Times in sorted(Latencies.items())},
+    }
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Load test the HTTP server of main.py")
+    Parser.add_argument("--host", default="127.0.0.1")
+    Parser.add_argument("--port", type=int, default=8080)
+    Parser.add_argument("--connections", type=int, default=100, help="clients sending requests at the same time")
+    Parser.add_argument("--requests", type=int, default=10000, help="requests sent in total")
+    Parser.add_argument("--spawn", action="store_true", help="start python main.py serve on --port for the test")
+    Parser.add_argument("--output", help="also save the results to this file")
+    Arguments = Parser.parse_args()
+
+    with open(RepositoryFolder / "GREWordList.json", 'r') as f:
+        WordLists = json.load(f)
+    Words = sorted({Item['word'] for Items in WordLists.values() for Item in Items})
+    ListNames = list(WordLists.keys())
+
+    Server = None
+    if Arguments.spawn:
+        Server = subprocess.Popen([sys.executable, str(RepositoryFolder / "main.py"), "serve", "--host", Arguments.host, "--port", str(Arguments.port)],
+                                  stdout=subprocess.PIPE, text=True)
+        # The server prints its address once everything is loaded
+        Server.stdout.readline()
+    try:
+        Report = asyncio.run(Run(Arguments, Words, ListNames))
+    finally:
+        if Server is not None:
+            Server.terminate()
+            Server.wait()
+
+    Output = json.dumps(Report, indent=2)
+    if Arguments.output:
+        with open(Arguments.output, 'w') as f:
+            f.write(Output + "\n")
+    print(Output)
+
+if __name__ == '__main__':
+    Main()
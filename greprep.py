@@ -0,0 +1,4155 @@
+import time
+ModuleStartTime = time.perf_counter() # Used by --startup-profile
+# Set by Start to the time main.py began, before greprep was loaded
+ProgramStartTime = ModuleStartTime
+import random
+import json
+import argparse
+import sys
+import os
+import platform
+import datetime
+from pathlib import Path
+import csv
+import re
+import math
+import mmap
+import struct
+import bisect
+import threading
+from array import array
+from collections.abc import MutableMapping, Sequence
+from html.parser import HTMLParser
+# requests, bs4, plotext, tabulate, pytz and numpy are imported by the functions that need them, so startup stays fast
+ImportsDoneTime = time.perf_counter()
+
+#! REMEMBER TO CHANGE THIS DATE TO START USING THIS PROGRAM
+StartDate = "15/08/2022" # The day you start using this program in dd/mm/yyyy format, used when there is no Stats.txt to import
+
+DataFolder = Path(__file__).parent.resolve()
+GREWordList = DataFolder / "GREWordList.json"
+VocabularyList = DataFolder / "vocabulary.json"
+TestedWordsList = DataFolder / "TestedWords.json"
+StatsFile = DataFolder / "Stats.txt"
+TestScoresFile = DataFolder / "TestScores.csv"
+VocabularyIndexFile = DataFolder / "vocabulary.idx"
+VocabularyDataFile = DataFolder / "vocabulary.dat"
+VocabularyJournalFile = DataFolder / "vocabulary.journal"
+TestedWordsJournalFile = DataFolder / "TestedWords.journal"
+FullTextIndexFile = DataFolder / "vocabulary.fts.json"
+DistractorIndexFile = DataFolder / "distractors.json"
+ReviewScheduleFile = DataFolder / "ReviewSchedule.json"
+ReviewScheduleJournalFile = DataFolder / "ReviewSchedule.journal"
+ProgressDatabaseFile = DataFolder / "progress.db"
+EventLogFile = DataFolder / "events.jsonl"
+AnswerLogFile = DataFolder / "answers.log"
+
+# Profile whose progress is shown and saved, chosen with --profile, GRE_PROFILE or the Switch profile menu
+ProfileName = os.environ.get("GRE_PROFILE", "default")
+
+# A journal is folded back into its JSON file once it grows past this fraction of the JSON file (and at least 64 KB)
+JournalCompactionRatio = 0.25
+JournalCompactionMinimum = 64 * 1024
+
+# Scraper settings. Point GRE_VOCABULARY_URL at a local server to scrape saved pages instead of vocabulary.com
+ScrapeBaseURL = os.environ.get("GRE_VOCABULARY_URL", "https://www.vocabulary.com/dictionary/")
+ScrapeWorkers = 8           # Number of pages fetched at the same time
+ScrapeRequestsPerSecond = 4 # Upper limit on requests sent to the server
+ScrapeRetries = 3           # Attempts after the first failed request
+ScrapeBackoff = 1.0         # Seconds to wait before the first retry, doubled after every attempt
+
+# Every fetched page is kept in the response cache. Pages younger than CacheMaxAge are used without asking the server,
+# older ones are revalidated with their ETag / Last-Modified. In offline mode (--offline or GRE_OFFLINE=1) only the cache is used.
+CacheFolder = DataFolder / "cache"
+CacheMaxBytes = int(os.environ.get("GRE_CACHE_SIZE", 200 * 1024 * 1024))
+CacheMaxAge = 7 * 24 * 3600
+OfflineMode = os.environ.get("GRE_OFFLINE", "") not in ("", "0")
+
+class Screen():
+    '''
+    Builds a screen in memory and writes it to the terminal at once, so screens do not flicker over SSH or on slow terminals.
+    Clear() starts the frame on a cleared screen with ANSI escapes (no shell is started), Print() adds to the frame like
+    print() and Show() writes the whole frame with a single write. Ask() shows the frame and reads an answer below it.
+    Code that prints directly must Show() the frame first, otherwise its output comes before the frame.
+    '''
+    # Cursor home, clear the screen and the scrollback like the clear command
+    ClearCode = "\x1b[H\x1b[2J\x1b[3J"
+
+    def __init__(self):
+        self.Buffer = []
+        self.EscapesEnabled = False
+
+    def Clear(self):
+        # Whatever was not shown yet would be wiped straight away, so it is dropped
+        if not sys.stdout.isatty():
+            return
+        if not self.EscapesEnabled:
+            # The Windows console only handles escape codes after this
+            if platform.system() == "Windows":
+                os.system("")
+            self.EscapesEnabled = True
+        self.Buffer = [self.ClearCode]
+
+    def Print(self, *Values, Sep=" ", End="\n"):
+        self.Buffer.append(Sep.join(map(str, Values)) + End)
+
+    def Show(self):
+        if len(self.Buffer) > 0:
+            sys.stdout.write("".join(self.Buffer))
+            sys.stdout.flush()
+            self.Buffer = []
+
+    def Ask(self, Prompt=""):
+        self.Print(Prompt, End="")
+        self.Show()
+        return input()
+
+Terminal = Screen()
+
+def ClearOutput():
+    Terminal.Clear()
+    Terminal.Show()
+
+def Heading(heading):
+    # A new screen starting with the heading
+    Terminal.Clear()
+    Terminal.Print("\n-----------------------------------")
+    Terminal.Print("\n        {}".format(heading))
+    Terminal.Print("\n-----------------------------------")
+    Terminal.Print("\nPress Enter to continue or Q to quit at any time")
+    Terminal.Show()
+
+class LazyDictionary(MutableMapping):
+    '''
+    Stands in for a dictionary that is only loaded the first time it is used.
+    Loader is called once and its result is used for every access afterwards,
+    other attributes (e.g. VocabDictionary.Commit) are passed through to it.
+    '''
+    def __init__(self, Loader):
+        self.Loader = Loader
+        self.Value = None
+
+    def Load(self):
+        if self.Value is None:
+            self.Value = self.Loader()
+        return self.Value
+
+    def __getattr__(self, Name):
+        if Name in ('Loader', 'Value'):
+            raise AttributeError(Name)
+        return getattr(self.Load(), Name)
+
+    def __getitem__(self, key):
+        return self.Load()[key]
+
+    def __setitem__(self, key, value):
+        self.Load()[key] = value
+
+    def __delitem__(self, key):
+        del self.Load()[key]
+
+    def __contains__(self, key):
+        return key in self.Load()
+
+    def __iter__(self):
+        return iter(self.Load())
+
+    def __len__(self):
+        return len(self.Load())
+
+    def keys(self):
+        return self.Load().keys()
+
+class WordList(Sequence):
+    '''
+    One list of a WordListStore, read like the list of {'word', 'Definition'} dicts it replaces.
+    It only holds indexes into the store, the dicts are made when an entry is read.
+    Extras has the other fields (e.g. an example sentence) of the few entries that have them, by position.
+    '''
+    def __init__(self, Store, WordIds, DefinitionIds, Extras):
+        self.Store = Store
+        self.WordIds = WordIds
+        self.DefinitionIds = DefinitionIds
+        self.Extras = Extras
+
+    def __len__(self):
+        return len(self.WordIds)
+
+    def __getitem__(self, Index):
+        if isinstance(Index, slice):
+            return [self[i] for i in range(*Index.indices(len(self.WordIds)))]
+        Entry = {'word': self.Store.Words[self.WordIds[Index]], 'Definition': self.Store.Definitions[self.DefinitionIds[Index]]}
+        if self.Extras:
+            Entry.update(self.Extras.get(Index % len(self.WordIds), ()))
+        return Entry
+
+class WordListStore(MutableMapping):
+    '''
+    The word lists of GREWordList.json with every distinct word and definition stored once.
+    A list is an array of word indexes and an array of definition indexes into the shared tables.
+    Members holds a bitset per list (bit i is set when word i is in the list) and ListMasks a bitset per word
+    (bit j is set when the word is in list j), so set operations between lists are integer operations.
+    '''
+    def __init__(self, WordLists=None):
+        self.Words = []
+        self.WordIds = {}
+        self.Definitions = []
+        self.DefinitionIds = {}
+        self.ListMasks = []
+        self.Lists = {}
+        self.Members = {}
+        self.ListBits = {}
+        for ListName, Items in (WordLists or {}).items():
+            self[ListName] = Items
+        # Only needed to add lists, which is rare, so it is rebuilt then instead of being kept
+        self.DefinitionIds = None
+
+    def Intern(self, Table, Ids, String):
+        Id = Ids.get(String)
+        if Id is None:
+            String = sys.intern(String)
+            Id = Ids[String] = len(Table)
+            Table.append(String)
+        return Id
+
+    def __setitem__(self, ListName, Items):
+        # Words of a replaced list stay in the tables until the lists are loaded again
+        if ListName in self.Lists:
+            del self[ListName]
+        if self.DefinitionIds is None:
+            self.DefinitionIds = {Definition: i for i, Definition in enumerate(self.Definitions)}
+        Bit = 1 << min(set(range(len(self.ListBits) + 1)) - set(self.ListBits.values()))
+        WordIds = array('I')
+        DefinitionIds = array('I')
+        Extras = {}
+        for Item in Items:
+            if len(Item) > 2:
+                Extras[len(WordIds)] = {key: value for key, value in Item.items() if key not in ('word', 'Definition')}
+            WordId = self.Intern(self.Words, self.WordIds, Item['word'])
+            if WordId == len(self.ListMasks):
+                self.ListMasks.append(0)
+            self.ListMasks[WordId] |= Bit
+            WordIds.append(WordId)
+            DefinitionIds.append(self.Intern(self.Definitions, self.DefinitionIds, Item['Definition']))
+        # Built as bytes, setting the bits of a growing integer one at a time is quadratic
+        Bytes = bytearray((len(self.Words) + 7) // 8)
+        for WordId in WordIds:
+            Bytes[WordId >> 3] |= 1 << (WordId & 7)
+        self.Lists[ListName] = (WordIds, DefinitionIds, Extras)
+        self.Members[ListName] = int.from_bytes(Bytes, 'little')
+        self.ListBits[ListName] = Bit.bit_length() - 1
+
+    def __getitem__(self, ListName):
+        return WordList(self, *self.Lists[ListName])
+
+    def __delitem__(self, ListName):
+        Mask = ~(1 << self.ListBits.pop(ListName))
+        for WordId in set(self.Lists.pop(ListName)[0]):
+            self.ListMasks[WordId] &= Mask
+        del self.Members[ListName]
+
+    def __contains__(self, ListName):
+        return ListName in self.Lists
+
+    def __iter__(self):
+        return iter(self.Lists)
+
+    def __len__(self):
+        return len(self.Lists)
+
+    def ListsContaining(self, word):
+        WordId = self.WordIds.get(word)
+        if WordId is None:
+            return []
+        return [ListName for ListName, Bit in self.ListBits.items() if self.ListMasks[WordId] >> Bit & 1]
+
+    def WordsOf(self, Bits):
+        # Words whose bit is set, in table order
+        Words = []
+        for ByteIndex, Byte in enumerate(Bits.to_bytes((Bits.bit_length() + 7) // 8, 'little')):
+            while Byte:
+                Lowest = Byte & -Byte
+                Words.append(self.Words[ByteIndex * 8 + Lowest.bit_length() - 1])
+                Byte ^= Lowest
+        return Words
+
+    def WordsIn(self, Lists, Without=()):
+        # Words in any of Lists and in none of Without
+        Bits = 0
+        for ListName in Lists:
+            Bits |= self.Members[ListName]
+        for ListName in Without:
+            Bits &= ~self.Members[ListName]
+        return self.WordsOf(Bits)
+
+    def Dump(self):
+        # The lists in the format of GREWordList.json
+        return {ListName: list(self[ListName]) for ListName in self.Lists}
+
+def LoadWordLists():
+    try:
+        f = open(GREWordList, 'r')
+        WordLists = json.load(f)
+        f.close()
+    except:
+        print("\nUnable to find GREWordList.json file. Please check the address again")
+        WordLists = {}
+    return WordListStore(WordLists)
+
+def SaveWordLists():
+    WriteFileAtomically(GREWordList, json.dumps(GlobalDictionary.Dump()))
+
+GlobalDictionary = LazyDictionary(LoadWordLists)
+
+def WriteFileAtomically(FilePath, Content):
+    # Write to a temporary file and swap it in, so a crash never leaves a half written file behind
+    TempPath = str(FilePath) + ".tmp"
+    with open(TempPath, 'w') as f:
+        f.write(Content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(TempPath, FilePath)
+
+def JournalAppend(JournalPath, Changes):
+    '''
+    Append changes to a journal. Changes is a list of (key, value) pairs, a value of None deletes the key.
+    Every change is one JSON line and the journal is synced to disk before returning.
+    '''
+    if len(Changes) == 0:
+        return
+    Lines = []
+    for key, value in Changes:
+        if value is None:
+            Lines.append(json.dumps({'op': 'del', 'key': key}))
+        else:
+            Lines.append(json.dumps({'op': 'put', 'key': key, 'value': value}))
+
+    with open(JournalPath, 'ab+') as f:
+        # Drop a record that was only half written when the program was killed
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.seek(0)
+                Content = f.read()
+                f.truncate(Content.rfind(b"\n") + 1)
+        f.write(("\n".join(Lines) + "\n").encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
+
+def ReadJournal(JournalPath):
+    # Yields (key, value) pairs in the order they were written, value is None for deletes
+    try:
+        f = open(JournalPath, 'r')
+    except FileNotFoundError:
+        return
+    for line in f:
+        try:
+            Record = json.loads(line)
+        except ValueError:
+            # Incomplete last record of a crashed write
+            continue
+        yield Record['key'], Record.get('value') if Record['op'] == 'put' else None
+    f.close()
+
+def JournalNeedsCompaction(BasePath, JournalPath):
+    try:
+        JournalSize = os.path.getsize(JournalPath)
+    except FileNotFoundError:
+        return False
+    try:
+        BaseSize = os.path.getsize(BasePath)
+    except FileNotFoundError:
+        BaseSize = 0
+    return JournalSize > max(JournalCompactionMinimum, JournalCompactionRatio * BaseSize)
+
+def LoadJSONWithJournal(BasePath, JournalPath):
+    try:
+        f = open(BasePath, 'r')
+        Data = json.load(f)
+        f.close()
+    except (FileNotFoundError, ValueError):
+        Data = {}
+    for key, value in ReadJournal(JournalPath):
+        if value is None:
+            Data.pop(key, None)
+        else:
+            Data[key] = value
+    return Data
+
+ProgressSchema = """
+CREATE TABLE IF NOT EXISTS Profiles (
+    Id INTEGER PRIMARY KEY,
+    Name TEXT NOT NULL UNIQUE,
+    StartDate TEXT NOT NULL,
+    MaxStreak INTEGER NOT NULL DEFAULT 0,
+    Activity BLOB NOT NULL DEFAULT x'',
+    LastActive TEXT,
+    Streak INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS LearntWords (
+    Profile INTEGER NOT NULL REFERENCES Profiles (Id) ON DELETE CASCADE,
+    Word TEXT NOT NULL,
+    Definition TEXT NOT NULL,
+    Ease REAL NOT NULL DEFAULT 2.5,
+    Interval INTEGER NOT NULL DEFAULT 0,
+    Repetitions INTEGER NOT NULL DEFAULT 0,
+    Due TEXT NOT NULL,
+    PRIMARY KEY (Profile, Word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS LearntWordsDue ON LearntWords (Profile, Due);
+CREATE TABLE IF NOT EXISTS TestResults (
+    Id INTEGER PRIMARY KEY,
+    Profile INTEGER NOT NULL REFERENCES Profiles (Id) ON DELETE CASCADE,
+    TestName TEXT NOT NULL,
+    Correct INTEGER NOT NULL,
+    Total INTEGER NOT NULL,
+    Seconds INTEGER NOT NULL,
+    TakenAt TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS TestResultsTakenAt ON TestResults (Profile, TakenAt);
+CREATE TABLE IF NOT EXISTS TestAggregates (
+    Profile INTEGER NOT NULL REFERENCES Profiles (Id) ON DELETE CASCADE,
+    Scope TEXT NOT NULL,
+    Key TEXT NOT NULL,
+    Count INTEGER NOT NULL,
+    Sum REAL NOT NULL,
+    Min REAL NOT NULL,
+    Max REAL NOT NULL,
+    Seconds INTEGER NOT NULL,
+    PRIMARY KEY (Profile, Scope, Key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS WordStats (
+    Profile INTEGER NOT NULL REFERENCES Profiles (Id) ON DELETE CASCADE,
+    Word TEXT NOT NULL,
+    Answers INTEGER NOT NULL,
+    Correct INTEGER NOT NULL,
+    LastAnswered INTEGER NOT NULL,
+    PRIMARY KEY (Profile, Word)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS AnswerLogState (
+    Id INTEGER PRIMARY KEY CHECK (Id = 0),
+    Offset INTEGER NOT NULL
+);
+"""
+
+ProgressConnection = None
+ProfileId = None
+
+def TodayDate():
+    from pytz import timezone
+
+    return datetime.datetime.now(timezone('Asia/Kolkata')).date()
+
+def OpenProgressStore():
+    '''
+    Open progress.db and create its tables.
+    The first time, the progress kept in the old files is imported into the "default" profile.
+    '''
+    import sqlite3
+
+    Connection = sqlite3.connect(str(ProgressDatabaseFile), timeout=10)
+    # WAL lets one profile read while another one is saving
+    Connection.execute("PRAGMA journal_mode = WAL")
+    Connection.execute("PRAGMA synchronous = NORMAL")
+    Connection.execute("PRAGMA foreign_keys = ON")
+    Columns = [Row[1] for Row in Connection.execute("PRAGMA table_info(Profiles)")]
+    if Columns and 'Activity' not in Columns:
+        UpgradeActivityDays(Connection)
+    Connection.executescript(ProgressSchema)
+    with Connection:
+        # Take the write lock first so two programs started together do not both import
+        Connection.execute("BEGIN IMMEDIATE")
+        if Connection.execute("SELECT COUNT(*) FROM Profiles").fetchone()[0] == 0:
+            ImportProgressFiles(Connection)
+            RebuildTestAggregates(Connection)
+        elif Connection.execute("SELECT EXISTS (SELECT 1 FROM TestResults) AND NOT EXISTS (SELECT 1 FROM TestAggregates)").fetchone()[0]:
+            # progress.db from before the aggregates were kept
+            RebuildTestAggregates(Connection)
+    return Connection
+
+def ImportProgressFiles(Connection):
+    '''
+    Copy TestedWords.json, ReviewSchedule.json, TestScores.csv and Stats.txt (with their journals) into the "default" profile.
+    The files are left as they are, they are not read again afterwards.
+    '''
+    try:
+        StatsStartDate, _, StatsTodayDateString, StatsStreak, StatsMaxStreak, _ = ReadValues()
+        ProfileStart = datetime.datetime.strptime(StatsStartDate, '%d/%m/%Y').date()
+        LastDay = datetime.datetime.strptime(StatsTodayDateString, '%d/%m/%Y').date()
+    except (FileNotFoundError, ValueError):
+        ProfileStart = datetime.datetime.strptime(StartDate, '%d/%m/%Y').date()
+        LastDay, StatsStreak, StatsMaxStreak = None, 0, 0
+    Id = Connection.execute("INSERT INTO Profiles (Name, StartDate, MaxStreak) VALUES (?, ?, ?)", ("default", ProfileStart.isoformat(), StatsMaxStreak)).lastrowid
+
+    TestedWords = LoadJSONWithJournal(TestedWordsList, TestedWordsJournalFile)
+    Schedule = LoadJSONWithJournal(ReviewScheduleFile, ReviewScheduleJournalFile)
+    Today = datetime.date.today().isoformat()
+    Rows = []
+    for word, definition in TestedWords.items():
+        Entry = Schedule.get(word) or {'Ease': 2.5, 'Interval': 0, 'Repetitions': 0, 'Due': Today}
+        Rows.append((Id, word, definition, Entry['Ease'], Entry['Interval'], Entry['Repetitions'], Entry['Due']))
+    Connection.executemany("INSERT OR REPLACE INTO LearntWords VALUES (?, ?, ?, ?, ?, ?, ?)", Rows)
+
+    Rows = []
+    Days = set()
+    try:
+        with open(TestScoresFile, 'r') as f:
+            for row in csv.reader(f):
+                if len(row) != 4:
+                    continue
+                TestName, Score, TimeTaken, TimeStamp = row
+                Correct, Total = Score.split("/")
+                Hours, Minutes, Seconds = TimeTaken.split(":")
+                TakenAt = datetime.datetime.strptime(TimeStamp, "%d/%m/%Y %I:%M %p")
+                Rows.append((Id, TestName, int(Correct), int(Total), int(Hours) * 3600 + int(Minutes) * 60 + int(Seconds), TakenAt.strftime("%Y-%m-%d %H:%M")))
+                Days.add(TakenAt.date().isoformat())
+    except FileNotFoundError:
+        pass
+    Connection.executemany("INSERT INTO TestResults (Profile, TestName, Correct, Total, Seconds, TakenAt) VALUES (?, ?, ?, ?, ?, ?)", Rows)
+
+    # Stats.txt only knows the days of the last streak, the other days with a test are known from the scores
+    if LastDay is not None:
+        Days.update((LastDay - datetime.timedelta(days=i)).isoformat() for i in range(StatsStreak))
+    Activity = ActivityBitmap(ProfileStart, MaxStreak=StatsMaxStreak)
+    # In date order, so no streak has to be counted again
+    for Day in sorted(Days):
+        Activity.Mark(datetime.date.fromisoformat(Day))
+    SaveActivity(Connection, Id, Activity)
+
+def UpgradeActivityDays(Connection):
+    # progress.db used to keep one row per day with practice, they are folded into the bitmaps of the profiles
+    with Connection:
+        Connection.execute("BEGIN IMMEDIATE")
+        if 'Activity' in [Row[1] for Row in Connection.execute("PRAGMA table_info(Profiles)")]:
+            return
+        for Column in ("Activity BLOB NOT NULL DEFAULT x''", "LastActive TEXT", "Streak INTEGER NOT NULL DEFAULT 0"):
+            Connection.execute("ALTER TABLE Profiles ADD COLUMN " + Column)
+        for Id, ProfileStart, MaxStreak in Connection.execute("SELECT Id, StartDate, MaxStreak FROM Profiles").fetchall():
+            Activity = ActivityBitmap(datetime.date.fromisoformat(ProfileStart), MaxStreak=MaxStreak)
+            for Day, in Connection.execute("SELECT Day FROM ActivityDays WHERE Profile = ? ORDER BY Day", (Id,)):
+                Activity.Mark(datetime.date.fromisoformat(Day))
+            SaveActivity(Connection, Id, Activity)
+        Connection.execute("DROP TABLE ActivityDays")
+
+class ActivityBitmap():
+    '''
+    The days with practice of a profile, one bit per day since Start (bit i % 8 of byte i // 8 is Start + i days).
+    The current streak, its last day and the highest streak are kept next to it, so streak queries are O(1)
+    and marking today only touches the end of the history. A year of history is 46 bytes.
+    '''
+    def __init__(self, Start, Bits=b"", LastDay=None, Streak=0, MaxStreak=0):
+        self.Start = Start
+        self.Bits = bytearray(Bits)
+        self.LastDay = LastDay
+        self.Streak = Streak
+        self.MaxStreak = MaxStreak
+
+    def IsActive(self, Day):
+        Index = (Day - self.Start).days
+        return 0 <= Index < len(self.Bits) * 8 and self.Bits[Index >> 3] >> (Index & 7) & 1 == 1
+
+    def Mark(self, Day):
+        # Returns False when the day was already marked
+        if self.IsActive(Day):
+            return False
+        Index = (Day - self.Start).days
+        if Index < 0:
+            # A day before the start, only happens when importing old progress
+            Value = int.from_bytes(self.Bits, 'little') << -Index
+            self.Bits = bytearray(Value.to_bytes((Value.bit_length() + 7) // 8, 'little'))
+            self.Start = Day
+            Index = 0
+        if Index >> 3 >= len(self.Bits):
+            self.Bits.extend(bytes((Index >> 3) + 1 - len(self.Bits)))
+        self.Bits[Index >> 3] |= 1 << (Index & 7)
+
+        if self.LastDay is None or Day > self.LastDay:
+            self.Streak = self.Streak + 1 if self.LastDay is not None and (Day - self.LastDay).days == 1 else 1
+            self.LastDay = Day
+            self.MaxStreak = max(self.MaxStreak, self.Streak)
+        else:
+            # A day in the past can join two streaks, so count them again
+            self.Recount()
+        return True
+
+    def Recount(self):
+        Streak = 0
+        for Index in range(len(self.Bits) * 8):
+            if self.Bits[Index >> 3] >> (Index & 7) & 1:
+                Streak += 1
+                self.MaxStreak = max(self.MaxStreak, Streak)
+            else:
+                Streak = 0
+        # Counting stopped at the end of the last byte, not at the last day
+        LastIndex = (self.LastDay - self.Start).days
+        Streak = 0
+        while LastIndex - Streak >= 0 and self.Bits[(LastIndex - Streak) >> 3] >> ((LastIndex - Streak) & 7) & 1:
+            Streak += 1
+        self.Streak = Streak
+
+    def CurrentStreak(self, Today):
+        # A streak stays alive until a whole day is missed
+        if self.LastDay is None or (Today - self.LastDay).days > 1:
+            return 0
+        return self.Streak
+
+    def Count(self, First=None, Last=None):
+        # Number of days with practice from First to Last, both included
+        First = max(0, (First - self.Start).days) if First is not None else 0
+        Last = min(len(self.Bits) * 8 - 1, (Last - self.Start).days) if Last is not None else len(self.Bits) * 8 - 1
+        if Last < First:
+            return 0
+        Value = int.from_bytes(self.Bits[First >> 3:(Last >> 3) + 1], 'little') >> (First & 7)
+        return bin(Value & ((1 << (Last - First + 1)) - 1)).count("1")
+
+    def Days(self, First=None, Last=None):
+        # The days with practice from First to Last
+        First = max(self.Start, First) if First is not None else self.Start
+        Last = Last if Last is not None else self.Start + datetime.timedelta(days=len(self.Bits) * 8 - 1)
+        Days = []
+        Day = First
+        while Day <= Last:
+            if self.IsActive(Day):
+                Days.append(Day)
+            Day += datetime.timedelta(days=1)
+        return Days
+
+def LoadActivity():
+    ProfileStart, Bits, LastActive, Streak, MaxStreak = GetProgressStore().execute(
+        "SELECT StartDate, Activity, LastActive, Streak, MaxStreak FROM Profiles WHERE Id = ?", (GetProfileId(),)).fetchone()
+    return ActivityBitmap(datetime.date.fromisoformat(ProfileStart), Bits, datetime.date.fromisoformat(LastActive) if LastActive else None, Streak, MaxStreak)
+
+def SaveActivity(Connection, Id, Activity):
+    Connection.execute("UPDATE Profiles SET StartDate = ?, Activity = ?, LastActive = ?, Streak = ?, MaxStreak = ? WHERE Id = ?",
+                       (Activity.Start.isoformat(), bytes(Activity.Bits), Activity.LastDay.isoformat() if Activity.LastDay else None, Activity.Streak, Activity.MaxStreak, Id))
+
+def MarkActive(Day):
+    # Record Day as a day the current profile practiced
+    Id = GetProfileId()
+    with GetProgressStore() as Connection:
+        Connection.execute("BEGIN IMMEDIATE")
+        Activity = LoadActivity()
+        if Activity.Mark(Day):
+            SaveActivity(Connection, Id, Activity)
+
+# Event name -> functions called with every event of that name, "*" for all events
+Hooks = {}
+
+def AddHook(Event, Callback):
+    '''
+    Call Callback(Event, Data) for every event of that name, or for all of them with "*". The events are
+      answer : a test question was answered (test, type, word, correct, seconds)
+      test   : a test was finished (test, score, questions, seconds)
+      menu   : a menu action finished (action, seconds)
+    and every event also has its name, the time and the profile.
+    Modules named in GRE_HOOKS (comma separated) are imported at startup and their Setup(AddHook) is called,
+    so profilers and exporters can be attached without changing this file.
+    '''
+    Hooks.setdefault(Event, []).append(Callback)
+
+def RemoveHook(Event, Callback):
+    Hooks.get(Event, []).remove(Callback)
+
+def Emit(Event, Data):
+    Data = dict(Data, event=Event, time=round(time.time(), 3), profile=ProfileName)
+    for Callback in Hooks.get(Event, []) + Hooks.get("*", []):
+        try:
+            Callback(Event, Data)
+        except Exception as Error:
+            # A broken exporter must not stop a test
+            print("\nHook {} failed on {}: {!r}".format(getattr(Callback, '__name__', Callback), Event, Error), file=sys.stderr)
+
+def WriteEventLog(Event, Data):
+    # Default hook, every event is one JSON line appended to events.jsonl
+    with open(EventLogFile, 'a') as f:
+        f.write(json.dumps(Data, ensure_ascii=False) + "\n")
+
+AddHook("*", WriteEventLog)
+
+def ReadEvents(Event=None):
+    # Events of the log in the order they happened, only those named Event if given
+    try:
+        f = open(EventLogFile, 'r')
+    except FileNotFoundError:
+        return
+    for line in f:
+        try:
+            Data = json.loads(line)
+        except ValueError:
+            # Last line of a crashed write
+            continue
+        if Event is None or Data.get('event') == Event:
+            yield Data
+    f.close()
+
+def LoadHookModules():
+    import importlib
+
+    for Name in os.environ.get("GRE_HOOKS", "").split(","):
+        if Name.strip() == "":
+            continue
+        try:
+            importlib.import_module(Name.strip()).Setup(AddHook)
+        except Exception as Error:
+            print("Unable to load the hooks in {}: {!r}".format(Name.strip(), Error), file=sys.stderr)
+
+def RecordAnswer(TestName, Question, Answer, Correct, Seconds):
+    # Seconds is None when the answer was not timed (answers graded from a file)
+    Emit("answer", {'test': TestName, 'type': Question['Type'], 'word': Question['Word'], 'choice': Answer if isinstance(Answer, int) else 0,
+                    'correct': Correct, 'seconds': round(Seconds, 4) if Seconds is not None else None})
+
+# answers.log is a series of these records, each followed by the word in UTF-8:
+# time answered (unix seconds), seconds taken (NaN if not timed), profile, test, question type, option chosen (0 for written), correct, word length
+AnswerRecord = struct.Struct("<IfHBBBBB")
+# The numbers stored for the test and question type are positions in these lists, new names must go at the end
+AnswerTests = ["MCQ (Learnt Words)", "MCQ (Random Words)", "Written Test (Learnt Words)", "Written Test (Random Words)"]
+AnswerTypes = ["Synonym To Meaning", "Meaning To Synonym", "Written"]
+# Bytes appended by this program before a finished test starts a background compaction
+AnswerLogCompactSize = 64 * 1024
+AnswerLogLock = threading.Lock()
+AnswerLogCompactor = None
+AnswerLogPending = 0
+
+def AppendAnswerLog(Event, Data):
+    global AnswerLogPending
+
+    word = Data['word'].encode('utf-8')[:255]
+    # Out of range choices are clamped instead of losing the record, 0 is also the choice of written answers
+    Record = AnswerRecord.pack(int(Data['time']), math.nan if Data['seconds'] is None else Data['seconds'], GetProfileId(), AnswerTests.index(Data['test']),
+                               AnswerTypes.index(Data['type']), max(0, min(Data['choice'], 255)), bool(Data['correct']), len(word)) + word
+    # One unbuffered write per answer, so answers of programs running together are not mixed up
+    with open(AnswerLogFile, 'ab', buffering=0) as f:
+        f.write(Record)
+    AnswerLogPending += len(Record)
+
+def ReadAnswerLog(Data):
+    # The answers in the bytes of answers.log, stops before a record that is still being written
+    Position = 0
+    while Position + AnswerRecord.size <= len(Data):
+        TakenAt, Seconds, Profile, Test, Type, Choice, Correct, Length = AnswerRecord.unpack_from(Data, Position)
+        End = Position + AnswerRecord.size + Length
+        if End > len(Data):
+            break
+        yield End, (TakenAt, None if math.isnan(Seconds) else Seconds, Profile, AnswerTests[Test], AnswerTypes[Type], Choice, bool(Correct),
+                    Data[Position + AnswerRecord.size:End].decode('utf-8'))
+        Position = End
+
+def CompactAnswerLog(Connection):
+    '''
+    Add the answers appended to answers.log since the last compaction to the totals of every word in WordStats.
+    The log position reached is saved in the same transaction, so an interrupted compaction is just done again.
+    '''
+    with AnswerLogLock, Connection:
+        Connection.execute("BEGIN IMMEDIATE")
+        Row = Connection.execute("SELECT Offset FROM AnswerLogState").fetchone()
+        Offset = Row[0] if Row else 0
+        try:
+            with open(AnswerLogFile, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < Offset:
+                    # The log was deleted and started again
+                    Offset = 0
+                f.seek(Offset)
+                Data = f.read()
+        except FileNotFoundError:
+            return 0
+        Totals = {}
+        Position = 0
+        for Position, (TakenAt, _, Profile, _, _, _, Correct, word) in ReadAnswerLog(Data):
+            Total = Totals.setdefault((Profile, word), [0, 0, 0])
+            Total[0] += 1
+            Total[1] += Correct
+            Total[2] = max(Total[2], TakenAt)
+        Connection.executemany("""INSERT INTO WordStats VALUES (?, ?, ?, ?, ?) ON CONFLICT (Profile, Word) DO UPDATE SET
+            Answers = Answers + excluded.Answers, Correct = Correct + excluded.Correct, LastAnswered = max(LastAnswered, excluded.LastAnswered)""",
+            [Key + tuple(Total) for Key, Total in Totals.items()])
+        Connection.execute("INSERT OR REPLACE INTO AnswerLogState VALUES (0, ?)", (Offset + Position,))
+    return sum(Total[0] for Total in Totals.values())
+
+def StartAnswerLogCompaction(Event=None, Data=None):
+    '''
+    Compact in a thread with its own connection once a finished test leaves enough new answers,
+    so neither the test nor the server waits for it. Smaller tails are compacted by HardestWords.
+    '''
+    global AnswerLogCompactor, AnswerLogPending
+    import sqlite3
+
+    if AnswerLogPending < AnswerLogCompactSize:
+        return
+
+    def Compact():
+        Connection = sqlite3.connect(str(ProgressDatabaseFile), timeout=10)
+        try:
+            CompactAnswerLog(Connection)
+        except Exception as Error:
+            print("\nUnable to compact {}: {!r}".format(AnswerLogFile.name, Error), file=sys.stderr)
+        finally:
+            Connection.close()
+
+    # The answers it misses are picked up by the next compaction, or by HardestWords
+    if AnswerLogCompactor is None or not AnswerLogCompactor.is_alive():
+        AnswerLogPending = 0
+        AnswerLogCompactor = threading.Thread(target=Compact, daemon=True)
+        AnswerLogCompactor.start()
+
+AddHook("answer", AppendAnswerLog)
+AddHook("test", StartAnswerLogCompaction)
+
+def HardestWords(N=50, MinAnswers=3):
+    '''
+    The N words of this profile answered wrong most often, as (word, answers, correct) tuples.
+    Words are ranked by (correct + 1) / (answers + 2), so one unlucky answer does not outrank a word missed many times.
+    '''
+    Connection = GetProgressStore()
+    # Only the answers since the last background compaction are read here
+    CompactAnswerLog(Connection)
+    return Connection.execute("""SELECT Word, Answers, Correct FROM WordStats WHERE Profile = ? AND Answers >= ?
+        ORDER BY (Correct + 1.0) / (Answers + 2), Answers DESC, Word LIMIT ?""", (GetProfileId(), MinAnswers, N)).fetchall()
+
+def GetProgressStore():
+    global ProgressConnection
+    if ProgressConnection is None:
+        ProgressConnection = OpenProgressStore()
+    return ProgressConnection
+
+def GetProfileId():
+    # Id of the current profile, a profile that does not exist yet is created starting today
+    global ProfileId
+    if ProfileId is None:
+        Connection = GetProgressStore()
+        Row = Connection.execute("SELECT Id FROM Profiles WHERE Name = ?", (ProfileName,)).fetchone()
+        if Row is None:
+            with Connection:
+                Connection.execute("INSERT OR IGNORE INTO Profiles (Name, StartDate) VALUES (?, ?)", (ProfileName, TodayDate().isoformat()))
+            Row = Connection.execute("SELECT Id FROM Profiles WHERE Name = ?", (ProfileName,)).fetchone()
+        ProfileId = Row[0]
+    return ProfileId
+
+def UseProfile(Name):
+    global ProfileName, ProfileId
+    ProfileName = Name
+    ProfileId = None
+
+def LoadTestedWords():
+    # The learnt words of the current profile and their definitions
+    Rows = GetProgressStore().execute("SELECT Word, Definition FROM LearntWords WHERE Profile = ?", (GetProfileId(),))
+    return dict(Rows.fetchall())
+
+def SaveTestedWords(Changes):
+    # Changes are (word, definition) pairs to add, with None as definition for removed words
+    # A new word is due for review straight away
+    Today = datetime.date.today().isoformat()
+    Id = GetProfileId()
+    with GetProgressStore() as Connection:
+        for word, definition in Changes:
+            if definition is None:
+                Connection.execute("DELETE FROM LearntWords WHERE Profile = ? AND Word = ?", (Id, word))
+            else:
+                Connection.execute("INSERT OR IGNORE INTO LearntWords (Profile, Word, Definition, Due) VALUES (?, ?, ?, ?)", (Id, word, definition, Today))
+    AdaptiveSamplers.pop(ProfileName, None)
+
+# Header of vocabulary.idx : magic, number of words, size of the key table, size and mtime of vocabulary.json
+VocabularyIndexHeader = struct.Struct("<4sIIqq")
+VocabularyIndexMagic = b"GVI1"
+
+def EntryChecksum(Entry):
+    # CRC32 of an entry as it is written to vocabulary.dat, tells the search index which entries changed
+    import zlib
+
+    return zlib.crc32(json.dumps(Entry).encode('utf-8'))
+
+def BuildVocabularyStore(SourcePath, IndexPath, DataPath):
+    '''
+    Convert vocabulary.json into the compact on-disk store
+    1. vocabulary.dat holds every entry as JSON, one after the other in sorted word order
+    2. vocabulary.idx holds the sorted word table and the byte offset of every entry in vocabulary.dat
+    '''
+    SourceStat = os.stat(SourcePath)
+    with open(SourcePath, 'r') as f:
+        Vocabulary = json.load(f)
+
+    Keys = sorted(Vocabulary.keys())
+    Offsets = array('q', [0])
+    TempDataPath = str(DataPath) + ".tmp"
+    with open(TempDataPath, 'wb') as f:
+        for key in Keys:
+            f.write(json.dumps(Vocabulary[key]).encode('utf-8'))
+            Offsets.append(f.tell())
+
+    KeyTable = "\n".join(Keys).encode('utf-8')
+    TempIndexPath = str(IndexPath) + ".tmp"
+    with open(TempIndexPath, 'wb') as f:
+        f.write(VocabularyIndexHeader.pack(VocabularyIndexMagic, len(Keys), len(KeyTable), SourceStat.st_size, SourceStat.st_mtime_ns))
+        f.write(Offsets.tobytes())
+        f.write(KeyTable)
+
+    os.replace(TempDataPath, DataPath)
+    os.replace(TempIndexPath, IndexPath)
+
+class VocabularyStore(MutableMapping):
+    '''
+    Read-only view of vocabulary.json backed by vocabulary.idx and a memory-mapped vocabulary.dat.
+    Only the sorted word table is kept in memory, entries are decoded when they are looked up.
+    Changes are appended to the vocabulary journal and kept in memory until the journal is compacted.
+    '''
+    def __init__(self, SourcePath, IndexPath, DataPath, JournalPath):
+        self.SourcePath = Path(SourcePath)
+        self.IndexPath = Path(IndexPath)
+        self.DataPath = Path(DataPath)
+        self.JournalPath = Path(JournalPath)
+        self.Open()
+
+    def Open(self):
+        self.Keys = []
+        self.Offsets = array('q', [0])
+        self.Data = None
+        self.Pending = {}
+        self.Deleted = set()
+        if not hasattr(self, 'Listeners'):
+            self.Listeners = []
+
+        if self.SourcePath.exists():
+            self.OpenStore()
+        for key, value in ReadJournal(self.JournalPath):
+            self.Apply(key, value)
+
+    def OpenStore(self):
+        if self.IsStale():
+            BuildVocabularyStore(self.SourcePath, self.IndexPath, self.DataPath)
+
+        with open(self.IndexPath, 'rb') as f:
+            _, Count, KeyTableSize, _, _ = VocabularyIndexHeader.unpack(f.read(VocabularyIndexHeader.size))
+            self.Offsets = array('q')
+            self.Offsets.frombytes(f.read(8 * (Count + 1)))
+            KeyTable = f.read(KeyTableSize).decode('utf-8')
+        self.Keys = KeyTable.split("\n") if Count > 0 else []
+
+        if self.Offsets[-1] > 0:
+            with open(self.DataPath, 'rb') as f:
+                self.Data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def IsStale(self):
+        if not self.IndexPath.exists() or not self.DataPath.exists():
+            return True
+        SourceStat = os.stat(self.SourcePath)
+        try:
+            with open(self.IndexPath, 'rb') as f:
+                Magic, _, _, SourceSize, SourceMTime = VocabularyIndexHeader.unpack(f.read(VocabularyIndexHeader.size))
+        except struct.error:
+            return True
+        return Magic != VocabularyIndexMagic or SourceSize != SourceStat.st_size or SourceMTime != SourceStat.st_mtime_ns
+
+    def Close(self):
+        if self.Data is not None:
+            self.Data.close()
+            self.Data = None
+
+    def Reload(self):
+        self.Close()
+        self.Open()
+
+    def Find(self, key):
+        Position = bisect.bisect_left(self.Keys, key)
+        if Position < len(self.Keys) and self.Keys[Position] == key:
+            return Position
+        return -1
+
+    def __getitem__(self, key):
+        if key in self.Pending:
+            return self.Pending[key]
+        if key in self.Deleted:
+            raise KeyError(key)
+        Position = self.Find(key)
+        if Position < 0:
+            raise KeyError(key)
+        return json.loads(self.Data[self.Offsets[Position]:self.Offsets[Position + 1]].decode('utf-8'))
+
+    def Checksum(self, key):
+        # EntryChecksum of an entry, stored entries are checked as the JSON bytes they are kept as without decoding them
+        import zlib
+
+        if key in self.Pending:
+            return EntryChecksum(self.Pending[key])
+        Position = self.Find(key)
+        return zlib.crc32(self.Data[self.Offsets[Position]:self.Offsets[Position + 1]])
+
+    def Apply(self, key, value):
+        if value is None:
+            self.Pending.pop(key, None)
+            if self.Find(key) >= 0:
+                self.Deleted.add(key)
+        else:
+            self.Deleted.discard(key)
+            self.Pending[key] = value
+
+    def AddListener(self, Callback):
+        # Callback(word, entry) is called for every committed change, entry is None for removed words
+        self.Listeners.append(Callback)
+
+    def Commit(self, Changes):
+        # Changes is a list of (word, entry) pairs, an entry of None removes the word
+        JournalAppend(self.JournalPath, Changes)
+        for key, value in Changes:
+            self.Apply(key, value)
+            for Callback in self.Listeners:
+                Callback(key, value)
+
+    def Compact(self, Force=False):
+        # Fold the journal into vocabulary.json and the store
+        if not Force and not JournalNeedsCompaction(self.SourcePath, self.JournalPath):
+            return
+        self.Rewrite()
+
+    def Rewrite(self, Added=None, AddedPath=None):
+        '''
+        Write vocabulary.json, vocabulary.dat and vocabulary.idx again with the journal folded in, one entry at a time.
+        Stored entries are copied as the JSON bytes they are kept as, so the vocabulary is never decoded or held in memory.
+        Added maps the words added by Merge to the start and end of their JSON in the file at AddedPath.
+        '''
+        Added = Added or {}
+        Keys = sorted({key for key in self.Keys if key not in self.Deleted} | set(self.Pending) | set(Added))
+        Spill = open(AddedPath, 'rb') if Added else None
+        TempSourcePath, TempDataPath, TempIndexPath = (str(FilePath) + ".tmp" for FilePath in (self.SourcePath, self.DataPath, self.IndexPath))
+        Offsets = array('q', [0])
+        with open(TempSourcePath, 'wb') as Source, open(TempDataPath, 'wb') as Data:
+            Source.write(b"{")
+            for Number, key in enumerate(Keys):
+                if key in self.Pending:
+                    Entry = json.dumps(self.Pending[key]).encode('utf-8')
+                elif key in Added:
+                    Start, End = Added[key]
+                    Spill.seek(Start)
+                    Entry = Spill.read(End - Start)
+                else:
+                    Position = self.Find(key)
+                    Entry = self.Data[self.Offsets[Position]:self.Offsets[Position + 1]]
+                # The same text as json.dumps of the whole vocabulary
+                Source.write((", " if Number > 0 else "").encode('utf-8') + json.dumps(key).encode('utf-8') + b": " + Entry)
+                Data.write(Entry)
+                Offsets.append(Data.tell())
+            Source.write(b"}")
+            for f in (Source, Data):
+                f.flush()
+                os.fsync(f.fileno())
+        if Spill is not None:
+            Spill.close()
+
+        SourceStat = os.stat(TempSourcePath)
+        KeyTable = "\n".join(Keys).encode('utf-8')
+        with open(TempIndexPath, 'wb') as f:
+            f.write(VocabularyIndexHeader.pack(VocabularyIndexMagic, len(Keys), len(KeyTable), SourceStat.st_size, SourceStat.st_mtime_ns))
+            f.write(Offsets.tobytes())
+            f.write(KeyTable)
+
+        # vocabulary.json goes last, until then the index does not match it and is rebuilt from the old one.
+        # The journal is removed after it, replaying it over the new file changes nothing.
+        self.Close()
+        os.replace(TempDataPath, self.DataPath)
+        os.replace(TempIndexPath, self.IndexPath)
+        os.replace(TempSourcePath, self.SourcePath)
+        try:
+            os.remove(self.JournalPath)
+        except FileNotFoundError:
+            pass
+        self.Open()
+
+    def Merge(self, Entries):
+        '''
+        Add the (word, entry) pairs of Entries for words not in the vocabulary yet, returns the number added.
+        Entries can be a generator. The new entries are written to a temporary file and only their positions are kept,
+        so any number of words can be added without holding them in memory.
+        '''
+        Added = {}
+        AddedPath = str(self.DataPath) + ".merge"
+        try:
+            with open(AddedPath, 'wb') as f:
+                for key, value in Entries:
+                    if key in Added or key in self:
+                        continue
+                    Start = f.tell()
+                    f.write(json.dumps(value).encode('utf-8'))
+                    Added[key] = (Start, f.tell())
+                    for Callback in self.Listeners:
+                        Callback(key, value)
+            if Added:
+                self.Rewrite(Added, AddedPath)
+        finally:
+            # Also when Entries raises, a bad deck must not leave the file behind
+            try:
+                os.remove(AddedPath)
+            except FileNotFoundError:
+                pass
+        return len(Added)
+
+    def __setitem__(self, key, value):
+        self.Commit([(key, value)])
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.Commit([(key, None)])
+
+    def __contains__(self, key):
+        if key in self.Pending:
+            return True
+        return key not in self.Deleted and self.Find(key) >= 0
+
+    def __iter__(self):
+        for key in self.Keys:
+            if key not in self.Deleted and key not in self.Pending:
+                yield key
+        yield from self.Pending
+
+    def __len__(self):
+        Added = sum(1 for key in self.Pending if self.Find(key) < 0)
+        return len(self.Keys) - len(self.Deleted) + Added
+
+def LoadVocabulary():
+    if not VocabularyList.exists():
+        print("\nUnable to find vocabulary.json file. Please check the address again")
+    return VocabularyStore(VocabularyList, VocabularyIndexFile, VocabularyDataFile, VocabularyJournalFile)
+
+VocabDictionary = LazyDictionary(LoadVocabulary)
+
+def EditDistance(First, Second, MaxDistance):
+    '''
+    Damerau-Levenshtein (optimal string alignment) distance between two strings.
+    Only a band of MaxDistance cells around the diagonal is filled and the search stops
+    as soon as every cell of a row is over MaxDistance, in which case MaxDistance + 1 is returned.
+    '''
+    if abs(len(First) - len(Second)) > MaxDistance:
+        return MaxDistance + 1
+    if First == Second:
+        return 0
+    # Letters shared at the start and the end never change the distance
+    Start = 0
+    while Start < len(First) and Start < len(Second) and First[Start] == Second[Start]:
+        Start += 1
+    End = 0
+    while End < len(First) - Start and End < len(Second) - Start and First[-1 - End] == Second[-1 - End]:
+        End += 1
+    First = First[Start:len(First) - End]
+    Second = Second[Start:len(Second) - End]
+    Large = MaxDistance + 1
+    PreviousRow = None
+    Row = list(range(len(Second) + 1))
+    for i in range(1, len(First) + 1):
+        TwoRowsBack, PreviousRow = PreviousRow, Row
+        Row = [Large] * (len(Second) + 1)
+        Row[0] = i
+        RowMinimum = i
+        for j in range(max(1, i - MaxDistance), min(len(Second), i + MaxDistance) + 1):
+            Cost = 0 if First[i - 1] == Second[j - 1] else 1
+            Value = min(PreviousRow[j] + 1, Row[j - 1] + 1, PreviousRow[j - 1] + Cost)
+            if i > 1 and j > 1 and First[i - 1] == Second[j - 2] and First[i - 2] == Second[j - 1]:
+                Value = min(Value, TwoRowsBack[j - 2] + 1)
+            Row[j] = Value
+            RowMinimum = min(RowMinimum, Value)
+        if RowMinimum > MaxDistance:
+            return Large
+    return min(Row[len(Second)], Large)
+
+class SearchIndex():
+    '''
+    Prefix and typo tolerant lookup over the vocabulary words.
+    1. Prefix completions come from a sorted list of the lowercase words
+    2. Misspellings are matched with a SymSpell style index of every word with up to MaxDistance letters deleted
+    '''
+    MaxDistance = 2
+    PrefixLength = 7 # Only the first letters of a word go in the deletion index
+
+    def __init__(self, Words=()):
+        self.Words = {}
+        self.Sorted = []
+        self.Deletes = {}
+        for word in Words:
+            self.Add(word)
+
+    def Variants(self, word):
+        Variants = {word}
+        Edges = {word}
+        for _ in range(self.MaxDistance):
+            Edges = {edge[:i] + edge[i + 1:] for edge in Edges for i in range(len(edge))}
+            Variants |= Edges
+        return Variants
+
+    def Add(self, word):
+        key = word.lower()
+        if key in self.Words:
+            return
+        self.Words[key] = word
+        bisect.insort(self.Sorted, key)
+        for Variant in self.Variants(key[:self.PrefixLength]):
+            self.Deletes.setdefault(Variant, set()).add(key)
+
+    def Remove(self, word):
+        key = word.lower()
+        if key not in self.Words:
+            return
+        del self.Words[key]
+        del self.Sorted[bisect.bisect_left(self.Sorted, key)]
+        for Variant in self.Variants(key[:self.PrefixLength]):
+            self.Deletes[Variant].discard(key)
+
+    def Update(self, word, Entry):
+        # Listener for VocabularyStore.Commit
+        if Entry is None:
+            self.Remove(word)
+        else:
+            self.Add(word)
+
+    def Get(self, word):
+        # The vocabulary key of a word, whatever its case
+        return self.Words.get(word.strip().lower())
+
+    def Prefix(self, Prefix, Limit=10):
+        # Words starting with Prefix, shortest first
+        Prefix = Prefix.strip().lower()
+        Start = bisect.bisect_left(self.Sorted, Prefix)
+        End = bisect.bisect_left(self.Sorted, Prefix + "\uffff", Start)
+        Matches = sorted(self.Sorted[Start:End], key=lambda key: (len(key), key))
+        return [self.Words[key] for key in Matches[:Limit]]
+
+    def Fuzzy(self, word, Limit=10):
+        # Words within MaxDistance edits of word, closest first. Short words only allow one typo.
+        word = word.strip().lower()
+        Allowed = 1 if len(word) <= 4 else self.MaxDistance
+        Candidates = set()
+        for Variant in self.Variants(word[:self.PrefixLength]):
+            Candidates |= self.Deletes.get(Variant, set())
+        Matches = []
+        for key in Candidates:
+            Distance = EditDistance(word, key, Allowed)
+            if Distance <= Allowed:
+                Matches.append((Distance, abs(len(key) - len(word)), key))
+        Matches.sort()
+        return [(self.Words[key], Distance) for Distance, _, key in Matches[:Limit]]
+
+    def Suggest(self, word, Limit=10):
+        # Close misspellings first, then completions of what was typed
+        Suggestions = [Match for Match, _ in self.Fuzzy(word, Limit)]
+        for Match in self.Prefix(word, Limit):
+            if Match not in Suggestions:
+                Suggestions.append(Match)
+        return Suggestions[:Limit]
+
+VocabularySearchIndex = None
+
+def GetSearchIndex():
+    # Built on first use and kept current by the vocabulary store afterwards
+    global VocabularySearchIndex
+    if VocabularySearchIndex is None:
+        VocabularySearchIndex = SearchIndex(VocabDictionary.keys())
+        VocabDictionary.AddListener(VocabularySearchIndex.Update)
+    return VocabularySearchIndex
+
+def DisplayAllLists():
+    Heading("GRE Word Lists")
+    print()
+    for ListName in GlobalDictionary.keys():
+        print("-----------------------------------")
+        print("List: ", ListName)
+        print("Length: ", len(GlobalDictionary[ListName]))
+        print("-----------------------------------")
+        print()
+    input()
+    ClearOutput()
+    return
+
+class ListPageParser(HTMLParser):
+    '''
+    Streaming parser for vocabulary.com list pages.
+    The page can be fed in chunks as it downloads, every link with a title inside an
+    <li id="entryN"> is collected in Words as {'word': link text, 'Definition': title}.
+    '''
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.Words = []
+        self.EntryDepth = 0 # Depth of open <li> tags, counted from the entry <li>
+        self.Definition = None
+        self.Text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "li":
+            if self.EntryDepth > 0:
+                self.EntryDepth += 1
+            elif (dict(attrs).get("id") or "").startswith("entry"):
+                self.EntryDepth = 1
+        elif tag == "a" and self.EntryDepth > 0:
+            self.Definition = dict(attrs).get("title")
+            self.Text = []
+
+    def handle_endtag(self, tag):
+        if tag == "li" and self.EntryDepth > 0:
+            self.EntryDepth -= 1
+        elif tag == "a" and self.Definition is not None:
+            self.Words.append({'word': "".join(self.Text).strip(), 'Definition': self.Definition.strip()})
+            self.Definition = None
+
+    def handle_data(self, data):
+        if self.Definition is not None:
+            self.Text.append(data)
+
+def ParseListPageWithLxml(Chunks):
+    # Same as ListPageParser with lxml's incremental parser, several times faster on long lists
+    from lxml import etree
+
+    Parser = etree.HTMLPullParser(events=("start", "end"))
+    Words = []
+    EntryDepth = 0
+    for Chunk in Chunks:
+        Parser.feed(Chunk)
+        for Event, Element in Parser.read_events():
+            if Element.tag == "li":
+                if Event == "start":
+                    if EntryDepth > 0 or (Element.get("id") or "").startswith("entry"):
+                        EntryDepth += 1
+                else:
+                    if EntryDepth > 0:
+                        EntryDepth -= 1
+                    # Entries already read are dropped so the tree never holds the whole list
+                    if EntryDepth == 0:
+                        Element.clear()
+            elif Element.tag == "a" and Event == "end" and EntryDepth > 0 and Element.get("title") is not None:
+                Words.append({'word': "".join(Element.itertext()).strip(), 'Definition': Element.get("title").strip()})
+    Parser.close()
+    return Words
+
+def ParseListPage(Content, Backend=None):
+    '''
+    Returns the words and definitions of a vocabulary.com list page in one pass.
+    Content is the page as a string or an iterable of chunks of it.
+    Backend is "lxml" or "html.parser", by default lxml is used when it is installed.
+    '''
+    Chunks = [Content] if isinstance(Content, str) else Content
+    if Backend is None or Backend == "lxml":
+        try:
+            return ParseListPageWithLxml(Chunks)
+        except ImportError:
+            if Backend == "lxml":
+                raise
+    Parser = ListPageParser()
+    for Chunk in Chunks:
+        Parser.feed(Chunk)
+    Parser.close()
+    return Parser.Words
+
+def FetchListPage(url, Session=None, Limiter=None):
+    # Words and definitions of the list page at url, from the response cache when it is current, or None
+    import codecs
+    import requests
+
+    Session = requests if Session is None else Session
+    Cache = GetResponseCache()
+    Cached = Cache.Get(url)
+    FinalWordsList = None
+    if not Cache.IsFresh(Cached) and not OfflineMode:
+        Req = RequestPage(Session, url, Limiter, Cache.ConditionalHeaders(Cached), Stream=True)
+        if Req is not None and Req.status_code == 304 and Cached is not None:
+            Cache.Revalidated(url)
+        elif Req is not None and Req.status_code == 200:
+            # Parse the page while it downloads, and keep the bytes for the cache
+            Encoding = Req.encoding or "utf-8"
+            Decoder = codecs.getincrementaldecoder(Encoding)(errors='replace')
+            Raw = []
+            def Chunks():
+                for Chunk in Req.iter_content(chunk_size=65536):
+                    Raw.append(Chunk)
+                    yield Decoder.decode(Chunk)
+                yield Decoder.decode(b"", final=True)
+            FinalWordsList = ParseListPage(Chunks())
+            Cache.Put(url, b"".join(Raw), Req.headers.get('ETag'), Req.headers.get('Last-Modified'), Encoding)
+        if Req is not None:
+            Req.close()
+    if FinalWordsList is None:
+        if Cached is None:
+            print("\nUnable to fetch {}{}".format(url, ", it is not in the cache and you are offline" if OfflineMode else ""))
+            return None
+        FinalWordsList = ParseListPage(Cached['Content'].decode(Cached['Encoding'] or "utf-8", errors='replace'))
+    return FinalWordsList
+
+def ScrapeAListFromVocabulary(url, ListName):
+    FinalWordsList = FetchListPage(url)
+    if FinalWordsList is None:
+        return
+
+    print("\nNumber of words added : {}".format(len(FinalWordsList)))
+
+    if len(FinalWordsList) > 0:
+        GlobalDictionary[ListName] = FinalWordsList
+        InvalidateQuestionBank()
+        print("\nList succesfully added!")
+        input("\nPress Enter to continue")
+        UpdateVocabulary()
+    else:
+        print("Unsuccessful! No words added!")
+
+def ReadListManifest(FilePath):
+    '''
+    The (URL, list name) pairs of a manifest file: one list per line, its URL then its name after a space.
+    Blank lines and lines starting with # are skipped.
+    '''
+    Lists = []
+    with open(FilePath, 'r', encoding='utf-8') as f:
+        for LineNo, Line in enumerate(f, 1):
+            Line = Line.strip()
+            if Line == "" or Line.startswith("#"):
+                continue
+            Fields = Line.split(None, 1)
+            if len(Fields) < 2:
+                raise ValueError("line {} has no list name after the URL".format(LineNo))
+            Lists.append((Fields[0], Fields[1].strip()))
+    return Lists
+
+def ImportLists(Lists):
+    '''
+    Add many vocabulary.com lists at once. Lists is a list of (URL, list name) pairs.
+    The pages are fetched and parsed by ScrapeWorkers threads sharing one session and rate limit, the lists are
+    saved to GREWordList.json once, and only the words of these lists missing from the vocabulary are scraped.
+    Returns the lists added, the words in them, the URLs that could not be fetched and the vocabulary entries added.
+    '''
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    Counts = {'lists': 0, 'words': 0, 'failed': [], 'added': 0}
+    if len(Lists) == 0:
+        return Counts
+
+    Session = CreateSession()
+    Limiter = RateLimiter(ScrapeRequestsPerSecond)
+    Pages = {}
+    with ThreadPoolExecutor(max_workers=ScrapeWorkers) as Executor:
+        Futures = {Executor.submit(FetchListPage, url, Session, Limiter): (url, ListName) for url, ListName in Lists}
+        for Done, Future in enumerate(as_completed(Futures), 1):
+            url, ListName = Futures[Future]
+            try:
+                Pages[url] = Future.result()
+            except Exception as Error:
+                # A list that fails to parse is counted as failed instead of stopping the others
+                Pages[url] = None
+                print("{} could not be read: {!r}".format(url, Error))
+            print("[{}/{}] {} : {} words".format(Done, len(Lists), ListName, "no" if Pages[url] is None else len(Pages[url])))
+    Session.close()
+
+    # Added in the order of Lists, so a name given twice keeps the last list like adding them one by one would
+    Added = []
+    for url, ListName in Lists:
+        if not Pages[url]:
+            Counts['failed'].append(url)
+            continue
+        GlobalDictionary[ListName] = Pages[url]
+        Added.append(ListName)
+        Counts['words'] += len(Pages[url])
+    Counts['lists'] = len(set(Added))
+    if len(Added) > 0:
+        SaveWordLists()
+        InvalidateQuestionBank()
+        Counts['added'] = AddMissingVocabulary(Added)
+    return Counts
+
+class RateLimiter():
+    '''
+    Spaces out requests made from several threads so that at most Rate requests are sent per second
+    '''
+    def __init__(self, Rate):
+        self.Interval = 1.0 / Rate if Rate > 0 else 0.0
+        self.NextTime = 0.0
+        self.Lock = threading.Lock()
+
+    def Wait(self):
+        with self.Lock:
+            Now = time.monotonic()
+            WaitTime = self.NextTime - Now
+            self.NextTime = max(Now, self.NextTime) + self.Interval
+        if WaitTime > 0:
+            time.sleep(WaitTime)
+
+class ResponseCache():
+    '''
+    On-disk cache of fetched pages keyed by URL.
+    Bodies are stored zlib compressed under the SHA-256 of their content (cache/objects/ab/abcd...), so identical pages
+    are stored once, and cache.db keeps the URL, body hash, validators and times of every response.
+    Once the bodies take more than MaxBytes the least recently used responses are dropped.
+    Safe to use from the scraper threads.
+    '''
+    Schema = """
+    CREATE TABLE IF NOT EXISTS Blobs (
+        Hash TEXT PRIMARY KEY,
+        Size INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS Responses (
+        URL TEXT PRIMARY KEY,
+        Hash TEXT NOT NULL REFERENCES Blobs (Hash),
+        ETag TEXT,
+        LastModified TEXT,
+        Encoding TEXT,
+        Fetched REAL NOT NULL,
+        Used REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS ResponsesUsed ON Responses (Used);
+    """
+
+    def __init__(self, Folder, MaxBytes):
+        import sqlite3
+
+        self.Folder = Path(Folder)
+        self.MaxBytes = MaxBytes
+        self.Lock = threading.Lock()
+        (self.Folder / "objects").mkdir(parents=True, exist_ok=True)
+        self.Connection = sqlite3.connect(str(self.Folder / "cache.db"), timeout=10, check_same_thread=False)
+        self.Connection.execute("PRAGMA journal_mode = WAL")
+        self.Connection.execute("PRAGMA synchronous = NORMAL")
+        self.Connection.executescript(self.Schema)
+        self.TotalSize = self.Connection.execute("SELECT IFNULL(SUM(Size), 0) FROM Blobs").fetchone()[0]
+
+    def BlobPath(self, Hash):
+        return self.Folder / "objects" / Hash[:2] / Hash
+
+    def Get(self, URL):
+        # The cached response as a dict with its Content, ETag, LastModified, Encoding and Fetched time, or None
+        import zlib
+
+        with self.Lock:
+            Row = self.Connection.execute("SELECT Hash, ETag, LastModified, Encoding, Fetched FROM Responses WHERE URL = ?", (URL,)).fetchone()
+            if Row is None:
+                return None
+            try:
+                with open(self.BlobPath(Row[0]), 'rb') as f:
+                    Content = zlib.decompress(f.read())
+            except (OSError, zlib.error):
+                # Removed or damaged by hand, fetched again
+                self.Connection.execute("DELETE FROM Responses WHERE URL = ?", (URL,))
+                self.DropBlob(Row[0])
+                self.Connection.commit()
+                return None
+            self.Connection.execute("UPDATE Responses SET Used = ? WHERE URL = ?", (time.time(), URL))
+            self.Connection.commit()
+        return {'Content': Content, 'ETag': Row[1], 'LastModified': Row[2], 'Encoding': Row[3], 'Fetched': Row[4]}
+
+    def IsFresh(self, Cached):
+        return Cached is not None and (OfflineMode or time.time() - Cached['Fetched'] < CacheMaxAge)
+
+    def ConditionalHeaders(self, Cached):
+        # Headers that let the server answer 304 Not Modified when the cached page is still current
+        Headers = {}
+        if Cached is not None and Cached['ETag']:
+            Headers['If-None-Match'] = Cached['ETag']
+        if Cached is not None and Cached['LastModified']:
+            Headers['If-Modified-Since'] = Cached['LastModified']
+        return Headers
+
+    def Put(self, URL, Content, ETag=None, LastModified=None, Encoding=None):
+        import hashlib
+        import zlib
+
+        Hash = hashlib.sha256(Content).hexdigest()
+        BlobFile = self.BlobPath(Hash)
+        with self.Lock:
+            if self.Connection.execute("SELECT 1 FROM Blobs WHERE Hash = ?", (Hash,)).fetchone() is None:
+                BlobFile.parent.mkdir(exist_ok=True)
+                Compressed = zlib.compress(Content)
+                TempPath = str(BlobFile) + ".tmp"
+                with open(TempPath, 'wb') as f:
+                    f.write(Compressed)
+                os.replace(TempPath, BlobFile)
+                self.Connection.execute("INSERT INTO Blobs VALUES (?, ?)", (Hash, len(Compressed)))
+                self.TotalSize += len(Compressed)
+            Previous = self.Connection.execute("SELECT Hash FROM Responses WHERE URL = ?", (URL,)).fetchone()
+            Now = time.time()
+            self.Connection.execute("INSERT OR REPLACE INTO Responses VALUES (?, ?, ?, ?, ?, ?, ?)", (URL, Hash, ETag, LastModified, Encoding, Now, Now))
+            if Previous is not None and Previous[0] != Hash:
+                # The page changed, its old body is not reachable from Responses any more
+                self.DropBlob(Previous[0])
+            self.Evict()
+            self.Connection.commit()
+
+    def Revalidated(self, URL):
+        # The server answered 304, the cached page counts as just fetched
+        with self.Lock:
+            self.Connection.execute("UPDATE Responses SET Fetched = ?, Used = ? WHERE URL = ?", (time.time(), time.time(), URL))
+            self.Connection.commit()
+
+    def Evict(self, MaxBytes=None):
+        # Drop least recently used responses, and the bodies no other response shares, until the bodies fit in MaxBytes
+        MaxBytes = self.MaxBytes if MaxBytes is None else MaxBytes
+        while self.TotalSize > MaxBytes:
+            Row = self.Connection.execute("SELECT URL, Hash FROM Responses ORDER BY Used LIMIT 1").fetchone()
+            if Row is None:
+                break
+            URL, Hash = Row
+            self.Connection.execute("DELETE FROM Responses WHERE URL = ?", (URL,))
+            self.DropBlob(Hash)
+
+    def DropBlob(self, Hash):
+        # Remove a body once no response refers to it any more
+        if self.Connection.execute("SELECT 1 FROM Responses WHERE Hash = ? LIMIT 1", (Hash,)).fetchone() is not None:
+            return
+        Row = self.Connection.execute("SELECT Size FROM Blobs WHERE Hash = ?", (Hash,)).fetchone()
+        if Row is None:
+            return
+        self.TotalSize -= Row[0]
+        self.Connection.execute("DELETE FROM Blobs WHERE Hash = ?", (Hash,))
+        try:
+            os.remove(self.BlobPath(Hash))
+        except FileNotFoundError:
+            pass
+
+    def Clear(self):
+        with self.Lock:
+            self.Evict(-1)
+            self.Connection.commit()
+
+    def URLs(self, Prefix=""):
+        with self.Lock:
+            return [URL for URL, in self.Connection.execute("SELECT URL FROM Responses WHERE URL >= ? AND URL < ? ORDER BY URL", (Prefix, Prefix + "\uffff"))]
+
+    def Stats(self):
+        with self.Lock:
+            return {'responses': self.Connection.execute("SELECT COUNT(*) FROM Responses").fetchone()[0],
+                    'bodies': self.Connection.execute("SELECT COUNT(*) FROM Blobs").fetchone()[0],
+                    'bytes': self.TotalSize, 'max_bytes': self.MaxBytes}
+
+ResponseCacheStore = None
+# The scrape workers all ask for the cache at once, only the first one opens it
+ResponseCacheLock = threading.Lock()
+
+def GetResponseCache():
+    global ResponseCacheStore
+    if ResponseCacheStore is None:
+        with ResponseCacheLock:
+            if ResponseCacheStore is None:
+                ResponseCacheStore = ResponseCache(CacheFolder, CacheMaxBytes)
+    return ResponseCacheStore
+
+def CreateSession():
+    # One session shared by every worker so connections are kept alive and reused
+    import requests
+
+    Session = requests.Session()
+    Adapter = requests.adapters.HTTPAdapter(pool_connections=ScrapeWorkers, pool_maxsize=ScrapeWorkers)
+    Session.mount("http://", Adapter)
+    Session.mount("https://", Adapter)
+    return Session
+
+def FetchPage(Session, URL, Limiter=None):
+    '''
+    Content of the page at URL, from the response cache when it is fresh or the server says it has not changed.
+    Returns None when the page cannot be fetched and is not cached, a stale cached page is better than nothing.
+    '''
+    Cache = GetResponseCache()
+    Cached = Cache.Get(URL)
+    if Cache.IsFresh(Cached):
+        return Cached['Content']
+    if OfflineMode:
+        return None
+    Req = RequestPage(Session, URL, Limiter, Cache.ConditionalHeaders(Cached))
+    if Req is not None and Req.status_code == 304 and Cached is not None:
+        Cache.Revalidated(URL)
+        return Cached['Content']
+    if Req is None or Req.status_code != 200:
+        # 404s and block pages are not word pages, the word is reported as failed instead of saved empty
+        return Cached['Content'] if Cached is not None else None
+    Cache.Put(URL, Req.content, Req.headers.get('ETag'), Req.headers.get('Last-Modified'), Req.encoding)
+    return Req.content
+
+def RequestPage(Session, URL, Limiter=None, Headers=None, Stream=False):
+    # Retry connection errors, rate limiting and server errors with exponential backoff
+    import requests
+
+    Delay = ScrapeBackoff
+    for Attempt in range(ScrapeRetries + 1):
+        if Limiter is not None:
+            Limiter.Wait()
+        try:
+            Req = Session.get(URL, timeout=30, headers=Headers, stream=Stream)
+            if Req.status_code != 429 and Req.status_code < 500:
+                return Req
+        except requests.RequestException:
+            pass
+        if Attempt < ScrapeRetries:
+            time.sleep(Delay)
+            Delay *= 2
+    return None
+
+def ParseWordMeaning(word, Content):
+    from bs4 import BeautifulSoup
+
+    # Parse the content
+    Soup = BeautifulSoup(Content, 'html.parser')
+
+    # Create a dict which will be returned
+    ReturnDictionary = {}
+
+    try:
+        ReturnDictionary['Short Explanation'] = Soup.find("p", class_="short").text  # type: ignore
+    except:
+        print("Short explanation not found for {}".format(word.strip()))
+    
+    try:
+        ReturnDictionary['Long Explanation'] = Soup.find("p", class_="long").text    # type: ignore
+    except:
+        print("Long Explanation not found for {}".format(word.strip()))
+    
+    try:
+        ReturnDictionary['Synonyms'] = Soup.find("dd").text  # type: ignore
+    except:
+        print("Synonyms not found for {}".format(word.strip()))
+
+    return ReturnDictionary
+
+def ScrapWordMeaning(word, Session=None, Limiter=None):
+    URL = ScrapeBaseURL + str(word).strip()
+    
+    # Get the html content using requests
+    if Session is None:
+        import requests
+        Session = requests
+    Content = FetchPage(Session, URL, Limiter)
+    if Content is None:
+        return
+
+    return ParseWordMeaning(word, Content)
+
+def ScrapeWords(Definitions):
+    '''
+    Scrape the meaning of every word in Definitions (word -> definition) with a pool of ScrapeWorkers threads.
+    Every finished entry is committed to the vocabulary journal, so an interrupted run resumes where it stopped.
+    Returns the number of words that were scraped successfully.
+    '''
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    Words = list(Definitions.keys())
+    Added = 0
+    Failed = []
+    if len(Words) == 0:
+        return Added
+
+    Session = CreateSession()
+    Limiter = RateLimiter(ScrapeRequestsPerSecond)
+    Executor = ThreadPoolExecutor(max_workers=ScrapeWorkers)
+    StartTime = time.time()
+    try:
+        Futures = {Executor.submit(ScrapWordMeaning, word, Session, Limiter): word for word in Words}
+        for Done, Future in enumerate(as_completed(Futures), 1):
+            word = Futures[Future]
+            Entry = Future.result()
+            if Entry is None:
+                Failed.append(word)
+            else:
+                Entry['Definition'] = Definitions[word]
+                VocabDictionary.Commit([(word, Entry)])
+                Added += 1
+            Elapsed = time.time() - StartTime
+            print("\r[{}/{}] {:5.1f}%  {:.1f} words/s  Word Added : {:<25}".format(Done, len(Words), 100 * Done / len(Words), Done / max(Elapsed, 1e-6), word), end='', flush=True)
+    except KeyboardInterrupt:
+        Executor.shutdown(wait=False, cancel_futures=True)
+        Session.close()
+        print("\n\nInterrupted! {} words were saved and will be skipped on the next update.".format(Added))
+        raise
+    Executor.shutdown()
+    Session.close()
+    print()
+
+    if len(Failed) > 0:
+        print("\nUnable to fetch {} words : {}".format(len(Failed), ", ".join(Failed)))
+    return Added
+
+DeckVersion = 1
+# Learnt words saved together while importing a deck
+DeckBatchSize = 1000
+# Fields every record of a known type must have, with their types
+DeckFields = {
+    'word': {'list': str, 'word': str, 'Definition': str},
+    'entry': {'word': str, 'entry': dict},
+    'learnt': {'word': str, 'definition': str, 'ease': (int, float), 'interval': int, 'repetitions': int, 'due': str},
+}
+
+def ExportDeck(FilePath, Lists=None, Vocabulary=True, Progress=True):
+    '''
+    Write word lists (all of them by default), the vocabulary entries of their words and the learnt words of this profile
+    to a deck: gzip compressed JSON, one record per line after a header line, written as it is read from the stores.
+      {"type": "deck", "version": 1, "created": ..., "profile": ...}
+      {"type": "word", "list": ..., "word": ..., "Definition": ..., and any other field of the list entry}
+      {"type": "entry", "word": ..., "entry": {...}}
+      {"type": "learnt", "word": ..., "definition": ..., "ease": ..., "interval": ..., "repetitions": ..., "due": ...}
+    Returns the number of records of each type.
+    '''
+    import gzip
+
+    Lists = list(GlobalDictionary.keys()) if Lists is None else Lists
+    Counts = {'word': 0, 'entry': 0, 'learnt': 0}
+    with gzip.open(FilePath, 'wt', encoding='utf-8') as f:
+        def Write(Record):
+            f.write(json.dumps(Record, ensure_ascii=False) + "\n")
+            Counts[Record['type']] = Counts.get(Record['type'], 0) + 1
+
+        Write({'type': "deck", 'version': DeckVersion, 'created': datetime.datetime.now().isoformat(timespec='seconds'), 'profile': ProfileName})
+        Words = set()
+        for ListName in Lists:
+            for Item in GlobalDictionary[ListName]:
+                Write(dict({'type': "word", 'list': ListName}, **Item))
+                Words.add(Item['word'])
+        if Vocabulary:
+            for word in sorted(Words):
+                if word in VocabDictionary:
+                    Write({'type': "entry", 'word': word, 'entry': VocabDictionary[word]})
+        if Progress:
+            for word, definition, Ease, Interval, Repetitions, Due in GetProgressStore().execute(
+                    "SELECT Word, Definition, Ease, Interval, Repetitions, Due FROM LearntWords WHERE Profile = ? ORDER BY Word", (GetProfileId(),)):
+                Write({'type': "learnt", 'word': word, 'definition': definition, 'ease': Ease, 'interval': Interval, 'repetitions': Repetitions, 'due': Due})
+    del Counts['deck']
+    return Counts
+
+def ImportDeck(FilePath, Progress=True):
+    '''
+    Merge a deck written by ExportDeck record by record, only one list and a batch of learnt words are held in memory
+    and the vocabulary entries go through VocabularyStore.Merge. Words missing from a list of the same name are added
+    at its end, vocabulary entries and learnt words already here are kept as they are.
+    Returns the number of records of each type that changed something.
+    '''
+    import gzip
+
+    Counts = {'list': 0, 'word': 0, 'entry': 0, 'learnt': 0}
+    ListName = None
+    Items = []
+    Learnt = []
+
+    def SaveList():
+        if ListName is None:
+            return
+        if ListName in GlobalDictionary:
+            Existing = list(GlobalDictionary[ListName])
+            Known = {Item['word'] for Item in Existing}
+            Added = [Item for Item in Items if Item['word'] not in Known]
+            if Added:
+                GlobalDictionary[ListName] = Existing + Added
+        else:
+            Added = Items
+            GlobalDictionary[ListName] = Items
+        Counts['list'] += 1 if Added else 0
+        Counts['word'] += len(Added)
+
+    def SaveLearnt():
+        if not Learnt:
+            return
+        Id = GetProfileId()
+        with GetProgressStore() as Connection:
+            Before = Connection.total_changes
+            Connection.executemany("INSERT OR IGNORE INTO LearntWords VALUES (?, ?, ?, ?, ?, ?, ?)", [(Id,) + Row for Row in Learnt])
+            Counts['learnt'] += Connection.total_changes - Before
+        Learnt.clear()
+
+    def Entries(f):
+        # The vocabulary entries of the deck for VocabularyStore.Merge, the other records are saved on the way
+        nonlocal ListName, Items
+        for Number, line in enumerate(f, 2):
+            Record = ReadDeckRecord(FilePath, Number, line)
+            Type = Record.pop('type')
+            if Type == "word":
+                Name = Record.pop('list')
+                if Name != ListName:
+                    SaveList()
+                    ListName, Items = Name, []
+                Items.append(Record)
+            elif Type == "entry":
+                yield Record['word'], Record['entry']
+            elif Type == "learnt" and Progress:
+                Learnt.append((Record['word'], Record['definition'], Record['ease'], Record['interval'], Record['repetitions'], Record['due']))
+                if len(Learnt) >= DeckBatchSize:
+                    SaveLearnt()
+            # Records of types added by later versions are skipped
+
+    with gzip.open(FilePath, 'rt', encoding='utf-8') as f:
+        Header = ReadDeckRecord(FilePath, 1, f.readline())
+        if Header.get('type') != "deck" or not isinstance(Header.get('version', 0), int) or Header.get('version', 0) > DeckVersion:
+            raise ValueError("{} is not a deck this version can read".format(FilePath))
+        Counts['entry'] = VocabDictionary.Merge(Entries(f))
+    SaveList()
+    SaveLearnt()
+
+    if Counts['word'] > 0:
+        SaveWordLists()
+        InvalidateQuestionBank()
+    if Counts['entry'] > 0:
+        SaveFullTextIndex()
+    if Counts['learnt'] > 0:
+        AdaptiveSamplers.pop(ProfileName, None)
+    return Counts
+
+def ReadDeckRecord(FilePath, Number, line):
+    # A line of a deck as a dict, a ValueError naming the line if it is not a record ImportDeck can use
+    try:
+        Record = json.loads(line)
+    except ValueError:
+        raise ValueError("{} line {} is not JSON".format(FilePath, Number)) from None
+    if not isinstance(Record, dict) or not isinstance(Record.get('type'), str):
+        raise ValueError("{} line {} is not a deck record".format(FilePath, Number))
+    for Field, Type in DeckFields.get(Record['type'], {}).items():
+        if not isinstance(Record.get(Field), Type) or isinstance(Record.get(Field), bool):
+            raise ValueError("{} line {} has no valid '{}' in its {} record".format(FilePath, Number, Field, Record['type']))
+    return Record
+
+def IsDeckFile(FilePath):
+    # Decks are gzip files, anything else is read as a list manifest
+    with open(FilePath, 'rb') as f:
+        return f.read(2) == b"\x1f\x8b"
+
+def AddAList():
+    url = str(input("\nEnter URL (or the path of a deck or list manifest file) : "))
+    if os.path.isfile(url):
+        try:
+            if IsDeckFile(url):
+                Counts = ImportDeck(url)
+            else:
+                Counts = ImportLists(ReadListManifest(url))
+        except (OSError, ValueError) as Error:
+            print("\nUnable to import {} : {}".format(url, Error))
+        else:
+            if 'learnt' in Counts:
+                print("\nAdded {} words to {} lists, {} vocabulary entries and {} learnt words".format(Counts['word'], Counts['list'], Counts['entry'], Counts['learnt']))
+            else:
+                print("\nAdded {} lists with {} words and {} vocabulary entries".format(Counts['lists'], Counts['words'], Counts['added']))
+        input()
+        ClearOutput()
+        return
+    ListName = str(input("\nEnter List Name : "))
+
+    ScrapeAListFromVocabulary(url, ListName)
+    SaveWordLists()
+    
+    input()
+    ClearOutput()  
+
+def InteractiveLearner(ListName = "Miscellaneous", NoOfWords = 20, OrderChoice = 1):
+    '''
+    1. Randomly choose words from the mentioned list
+    2. Choose words in a serial order from the mentioned list
+    '''
+    ClearOutput()
+    print("Type 'exp' or 'e' for explanation")
+
+    if OrderChoice == 1:
+        RandomWordList = random.sample(GlobalDictionary[ListName], NoOfWords)
+    else:
+        print('\nThe length of the "{}" is {}.'.format(ListName, len(GlobalDictionary[ListName])))
+        print('\nYou can start your revision from 1 to {} (inclusive).'.format(len(GlobalDictionary[ListName]) - NoOfWords + 1))
+
+        StartChoice = input("\nWhere do you want to start from (Leave empty for beginning or 1): ")
+        while True:
+            if StartChoice == "":
+                RandomWordList = GlobalDictionary[ListName][:NoOfWords]
+                break
+            elif StartChoice.isnumeric():
+                StartChoice = int(StartChoice)
+                if StartChoice == 0 or StartChoice == 1:
+                    RandomWordList = GlobalDictionary[ListName][:NoOfWords]
+                    break
+                elif(StartChoice > 1 and ((StartChoice + NoOfWords - 1) <= len(GlobalDictionary[ListName]))):
+                    RandomWordList = GlobalDictionary[ListName][StartChoice-1:StartChoice+NoOfWords-1]
+                    break
+                else:
+                    print("\nInvalid choice! Enter a number less than or equal to {}".format((len(GlobalDictionary[ListName]) - NoOfWords + 1)))
+                    StartChoice = input("\nWhere do you want to start from (Leave empty for beginning): ")
+            else:
+                print("\nInvalid choice! Enter numerical input or blank.")
+                StartChoice = input("\nWhere do you want to start from (Leave empty for beginning): ")
+    
+    TestedWords = LoadTestedWords()
+    NewWords = []
+
+    # Number of words learnt
+    count = 0
+
+    for WordDictionary in RandomWordList:
+        count += 1
+        print("--------------------------------------------------------")
+        print("\n" + str(count) + ". " + WordDictionary['word'].strip() + '  ::  ' + WordDictionary['Definition'].strip())
+
+        # Save the word in tested words
+        if WordDictionary['word'] not in TestedWords:
+            TestedWords[WordDictionary['word']] = WordDictionary['Definition']
+            NewWords.append((WordDictionary['word'], WordDictionary['Definition']))
+
+        while(True):
+            String = str(input())
+            if String == 'e' or String == 'exp':
+                for key, value in VocabDictionary[WordDictionary['word']].items():
+                    print("\n" + key.strip() + " : " + value.strip()) 
+            elif String == 'q':
+                SaveTestedWords(NewWords)
+                ClearOutput()
+                return
+            elif len(String) <= 1:
+                break
+            else:
+                print("\nInvalid Choice! Press Enter to continue.")
+                input()
+    
+    ClearOutput()
+    print("--------------------------------------------------------")
+    print("\nWords we learnt today")
+    index = 0
+    for WordDictionary in RandomWordList:
+        index += 1
+        print("\n" + str(index) + ". " + WordDictionary['word'].strip() + '  ::  ' + WordDictionary['Definition'].strip())
+
+    SaveTestedWords(NewWords)
+    
+    input()
+    ClearOutput()
+    return
+
+def Learn():
+    Heading("Learn From A List")
+    Lists = list(GlobalDictionary.keys())
+    print("\nWhich list do you want to prepare from? Here are the options:\n")
+    
+    for i in range(len(Lists)):
+        print(str(i+1) + ". " + Lists[i])
+    print(str(len(Lists) + 1) + ". Exit")
+    
+    ListChoice = input("\nEnter your choice: ")
+    while True:
+        if ListChoice.isnumeric():
+            ListChoice = int(ListChoice)
+            if(ListChoice > 0 and ListChoice <= (len(Lists) + 1)):
+                if(ListChoice == len(Lists) + 1):
+                    ClearOutput()
+                    return
+                else:
+                    break
+            else:
+                print("\nInvalid choice! Enter a number less than or equal to {}".format((len(Lists) + 1)))
+                ListChoice = input("\nEnter your choice: ")
+        else:
+            print("\nInvalid choice! Enter numerical input.")
+            ListChoice = input("\nEnter your choice: ")
+    
+    print("\nSelect order of words:\n\n1. Random Order\n2. Serial Order")
+    
+    OrderChoice = input("\nEnter your choice: ")
+    while True:
+        if OrderChoice.isnumeric():
+            OrderChoice = int(OrderChoice)
+            if(OrderChoice > 0 and OrderChoice <= 2):
+                break
+            else:
+                print("\nInvalid choice! Enter a number less than or equal to {}".format(2))
+                OrderChoice = input("\nEnter your choice: ")
+        else:
+            print("\nInvalid choice! Enter numerical input.")
+            OrderChoice = input("\nEnter your choice: ")
+    
+    NoOfWords = input("\nHow many words do you want to revise : ")
+    while True:
+        if NoOfWords.isnumeric():
+            NoOfWords = int(NoOfWords)
+            if(NoOfWords > GlobalDictionary[Lists[ListChoice-1]].__len__()):
+                print("\nInvalid choice! Enter a number less than or equal to {}".format(GlobalDictionary[Lists[ListChoice-1]].__len__()))
+                NoOfWords = input("\nHow many words do you want to revise : ")
+            else:
+                break
+        else:
+            print("\nInvalid choice! Enter numerical input.")
+            NoOfWords = input("\nHow many words do you want to revise : ")
+
+    InteractiveLearner(Lists[ListChoice-1], NoOfWords, OrderChoice)
+    return
+
+def TestAggregateKeys(TestName, TakenAt):
+    # The (scope, key) of every aggregate a test counts towards, TakenAt is "yyyy-mm-dd hh:mm"
+    Year, Week, _ = datetime.date.fromisoformat(TakenAt[:10]).isocalendar()
+    return [('All', ""), ('Types', TestName), ('Days', TakenAt[:10]), ('Weeks', "{}-W{:02d}".format(Year, Week))]
+
+def ScorePercent(Correct, Total):
+    return 100.0 * Correct / Total if Total > 0 else 0.0
+
+def AddTestToAggregates(Connection, Id, TestName, Correct, Total, Seconds, TakenAt):
+    # Called in the transaction that saves the test, so the aggregates always match TestResults
+    Percent = ScorePercent(Correct, Total)
+    Connection.executemany("""INSERT INTO TestAggregates VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+        ON CONFLICT (Profile, Scope, Key) DO UPDATE SET Count = Count + 1, Sum = Sum + excluded.Sum,
+        Min = MIN(Min, excluded.Min), Max = MAX(Max, excluded.Max), Seconds = Seconds + excluded.Seconds""",
+        [(Id, Scope, Key, Percent, Percent, Percent, Seconds) for Scope, Key in TestAggregateKeys(TestName, TakenAt)])
+
+def RebuildTestAggregates(Connection):
+    # Sum up every test of every profile again, in one pass over TestResults
+    Aggregates = {}
+    for Id, TestName, Correct, Total, Seconds, TakenAt in Connection.execute("SELECT Profile, TestName, Correct, Total, Seconds, TakenAt FROM TestResults"):
+        Percent = ScorePercent(Correct, Total)
+        for Scope, Key in TestAggregateKeys(TestName, TakenAt):
+            Aggregate = Aggregates.get((Id, Scope, Key))
+            if Aggregate is None:
+                Aggregates[(Id, Scope, Key)] = [1, Percent, Percent, Percent, Seconds]
+            else:
+                Aggregate[0] += 1
+                Aggregate[1] += Percent
+                Aggregate[2] = min(Aggregate[2], Percent)
+                Aggregate[3] = max(Aggregate[3], Percent)
+                Aggregate[4] += Seconds
+    Connection.execute("DELETE FROM TestAggregates")
+    Connection.executemany("INSERT INTO TestAggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [Group + tuple(Aggregate) for Group, Aggregate in Aggregates.items()])
+
+def LoadAggregates():
+    '''
+    Number of tests, sum, lowest and highest of the score percentages and total time taken of the current profile,
+    for all tests ('All'), per test type ('Types'), per day ('Days') and per ISO week ('Weeks', e.g. "2022-W35").
+    They are kept up to date by SaveTestScores, so this reads one row per day and week whatever the number of tests.
+    '''
+    Aggregates = {'All': {}, 'Types': {}, 'Days': {}, 'Weeks': {}}
+    for Scope, Key, Count, Sum, Minimum, Maximum, Seconds in GetProgressStore().execute(
+            "SELECT Scope, Key, Count, Sum, Min, Max, Seconds FROM TestAggregates WHERE Profile = ?", (GetProfileId(),)):
+        Aggregate = {'Count': Count, 'Sum': Sum, 'Min': Minimum, 'Max': Maximum, 'Seconds': Seconds}
+        if Scope == 'All':
+            Aggregates['All'] = Aggregate
+        else:
+            Aggregates[Scope][Key] = Aggregate
+    return Aggregates
+
+def RollingAverages(Aggregates, Window=7):
+    # Average score of every day with a test and the average over the last Window days with a test
+    import numpy as np
+
+    Days = sorted(Aggregates['Days'].keys())
+    Averages = np.array([Aggregates['Days'][Day]['Sum'] / Aggregates['Days'][Day]['Count'] for Day in Days])
+    if len(Days) == 0:
+        return Days, Averages, Averages
+    Cumulative = np.cumsum(np.insert(Averages, 0, 0.0))
+    Lengths = np.minimum(np.arange(1, len(Days) + 1), Window)
+    Rolling = (Cumulative[1:] - Cumulative[np.arange(1, len(Days) + 1) - Lengths]) / Lengths
+    return Days, Averages, Rolling
+
+def SaveTestScores(TestName, Correct, Total, Seconds):
+    TakenAt = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    Id = GetProfileId()
+    with GetProgressStore() as Connection:
+        Connection.execute("INSERT INTO TestResults (Profile, TestName, Correct, Total, Seconds, TakenAt) VALUES (?, ?, ?, ?, ?, ?)", (Id, TestName, Correct, Total, int(Seconds), TakenAt))
+        AddTestToAggregates(Connection, Id, TestName, Correct, Total, int(Seconds), TakenAt)
+    # Tests taken with the commands count towards the streak too
+    MarkActive(TodayDate())
+    Emit("test", {'test': TestName, 'score': Correct, 'questions': Total, 'seconds': round(Seconds, 3)})
+    return
+
+def ReadScores(Last = None):
+    # All the scores of the current profile, or only the Last ones, oldest first
+    Rows = GetProgressStore().execute("SELECT TestName, Correct, Total, Seconds, TakenAt FROM TestResults WHERE Profile = ? ORDER BY TakenAt DESC, Id DESC LIMIT ?",
+                                      (GetProfileId(), -1 if Last is None else Last)).fetchall()
+    scores = []
+    for TestName, Correct, Total, Seconds, TakenAt in reversed(Rows):
+        TakenAt = datetime.datetime.strptime(TakenAt, "%Y-%m-%d %H:%M")
+        scores.append([TestName, "{}/{}".format(Correct, Total), time.strftime("%H:%M:%S", time.gmtime(Seconds)), TakenAt.strftime("%d/%m/%Y"), TakenAt.strftime("%I:%M %p")])
+    return scores
+ 
+# Seed for the random generator of the tests, None gives a different test every time
+TestSeed = None
+NoOfChoices = 5
+QuestionTypes = ["Synonym To Meaning", "Meaning To Synonym"]
+
+class QuestionBank():
+    '''
+    Flat arrays of every distinct word and its definition across all the lists,
+    built once and shared by every test until the lists change
+    '''
+    def __init__(self, Lists):
+        self.Words = []
+        self.Definitions = []
+        self.Positions = {}
+        self.Neighbours = None
+        self.Grader = None
+        for ListName in Lists.keys():
+            for WordDictionary in Lists[ListName]:
+                if WordDictionary['word'] not in self.Positions:
+                    self.Positions[WordDictionary['word']] = len(self.Words)
+                    self.Words.append(WordDictionary['word'])
+                    self.Definitions.append(WordDictionary['Definition'])
+
+    def __len__(self):
+        return len(self.Words)
+
+    def Sample(self, NoOfWords, Rng):
+        # (word, definition) pairs of NoOfWords distinct random words
+        return [(self.Words[i], self.Definitions[i]) for i in Rng.sample(range(len(self.Words)), NoOfWords)]
+
+    def Fingerprint(self):
+        import hashlib
+
+        return hashlib.sha1("\n".join(self.Words).encode('utf-8')).hexdigest()
+
+    def LoadNeighbours(self):
+        '''
+        Load the nearest neighbour table used for hard distractors, building it first if the lists changed.
+        Returns False when the table can not be built (NumPy is not installed).
+        '''
+        if self.Neighbours is not None:
+            return True
+        try:
+            with open(DistractorIndexFile, 'r') as f:
+                Data = json.load(f)
+            if Data['Fingerprint'] != self.Fingerprint():
+                raise ValueError("Distractor index is out of date")
+        except (FileNotFoundError, ValueError, KeyError):
+            try:
+                Data = BuildDistractorIndex(self)
+            except ImportError:
+                return False
+            WriteFileAtomically(DistractorIndexFile, json.dumps(Data, separators=(',', ':')))
+        self.Neighbours = Data['Neighbours']
+        return True
+
+    def Distractors(self, word, definition, NoOfDistractors, Rng, Hard=False):
+        # Indices of distinct words whose words and definitions all differ from the answer and from each other
+        Chosen = []
+        Words = {word}
+        Definitions = {definition}
+        if Hard and self.Neighbours is not None and word in self.Positions:
+            # Confusable words first, shuffled so the same word does not always get the same options
+            Candidates = list(self.Neighbours[self.Positions[word]])
+            Rng.shuffle(Candidates)
+            for i in Candidates:
+                if len(Chosen) == NoOfDistractors:
+                    break
+                if self.Words[i] not in Words and self.Definitions[i] not in Definitions:
+                    Chosen.append(i)
+                    Words.add(self.Words[i])
+                    Definitions.add(self.Definitions[i])
+        while len(Chosen) < NoOfDistractors:
+            Needed = NoOfDistractors - len(Chosen)
+            for i in Rng.sample(range(len(self.Words)), min(len(self.Words), Needed + 2)):
+                if self.Words[i] not in Words and self.Definitions[i] not in Definitions:
+                    Chosen.append(i)
+                    Words.add(self.Words[i])
+                    Definitions.add(self.Definitions[i])
+                    if len(Chosen) == NoOfDistractors:
+                        break
+        return Chosen
+
+    def BuildTestForm(self, Items, Choices=NoOfChoices, Rng=None, Hard=False):
+        '''
+        Build every question of a test in one pass before the test starts.
+        Items is a list of (word, definition) pairs to ask about.
+        With Choices = 0 the questions are written questions without options.
+        With Hard = True the distractors are taken from the words with the most similar definitions.
+        Each question is a dict with the Type, Word, Definition, the Choices shown and the Answer (1 based index).
+        '''
+        if Rng is None:
+            Rng = random.Random(TestSeed)
+        if Choices > 0 and len(set(self.Definitions)) < Choices:
+            raise ValueError("Not enough distinct words in the lists for {} choices".format(Choices))
+        Form = []
+        for word, definition in Items:
+            Question = {'Word': word, 'Definition': definition}
+            if Choices == 0:
+                Question['Type'] = "Written"
+                Question['Choices'] = []
+                Question['Answer'] = None
+                Form.append(Question)
+                continue
+            Question['Type'] = Rng.choice(QuestionTypes)
+            Options = self.Distractors(word, definition, Choices - 1, Rng, Hard)
+            Answer = Rng.randrange(Choices)
+            if Question['Type'] == "Synonym To Meaning":
+                Question['Choices'] = [self.Definitions[i] for i in Options]
+                Question['Choices'].insert(Answer, definition)
+            else:
+                Question['Choices'] = [self.Words[i] for i in Options]
+                Question['Choices'].insert(Answer, word)
+            Question['Answer'] = Answer + 1
+            Form.append(Question)
+        return Form
+
+# Number of similar words stored for every word in distractors.json
+NoOfNeighbours = 12
+# Pairs of definitions more similar than this are treated as synonyms and never used as distractors
+NeighbourMaxSimilarity = 0.9
+
+def BuildDistractorIndex(QuestionWords):
+    '''
+    Find the NoOfNeighbours most similar definitions of every word with TF-IDF vectors and cosine similarity.
+    Similarities are computed in blocks of rows so memory stays bounded on large lists.
+    '''
+    import numpy as np
+
+    Documents = [Tokenize(definition) for definition in QuestionWords.Definitions]
+    DocumentFrequency = {}
+    for Tokens in Documents:
+        for Token in set(Tokens):
+            DocumentFrequency[Token] = DocumentFrequency.get(Token, 0) + 1
+    # Terms used by a single definition can not make two words look alike
+    Terms = {Token: i for i, Token in enumerate(sorted(Token for Token, Count in DocumentFrequency.items() if Count > 1))}
+
+    NoOfWords = len(Documents)
+    Vectors = np.zeros((NoOfWords, max(1, len(Terms))), dtype=np.float32)
+    for Row, Tokens in enumerate(Documents):
+        for Token in Tokens:
+            if Token in Terms:
+                Vectors[Row, Terms[Token]] += 1.0
+    IDF = np.zeros(Vectors.shape[1], dtype=np.float32)
+    for Token, Column in Terms.items():
+        IDF[Column] = math.log(NoOfWords / DocumentFrequency[Token])
+    Vectors *= IDF
+    Norms = np.linalg.norm(Vectors, axis=1, keepdims=True)
+    Vectors /= np.where(Norms == 0, 1, Norms)
+
+    K = min(NoOfNeighbours, NoOfWords - 1)
+    Neighbours = []
+    for Start in range(0, NoOfWords, 1024):
+        Similarity = Vectors[Start:Start + 1024] @ Vectors.T
+        Similarity[Similarity > NeighbourMaxSimilarity] = -1
+        Rows = np.arange(Similarity.shape[0])
+        Similarity[Rows, Rows + Start] = -1
+        Top = np.argpartition(-Similarity, K, axis=1)[:, :K]
+        Order = np.argsort(-Similarity[Rows[:, None], Top], axis=1)
+        for Row in range(Similarity.shape[0]):
+            Best = Top[Row][Order[Row]]
+            Neighbours.append([int(i) for i in Best if Similarity[Row, i] > 0])
+
+    return {'Fingerprint': QuestionWords.Fingerprint(), 'Neighbours': Neighbours}
+
+Bank = None
+
+def GetQuestionBank():
+    global Bank
+    if Bank is None:
+        Bank = QuestionBank(GlobalDictionary)
+    return Bank
+
+# Endings of inflected forms (plurals, tenses, comparatives) accepted as the word itself
+InflectionEndings = [("ies", "y"), ("ied", "y"), ("ier", "y"), ("iest", "y"), ("es", ""), ("s", ""), ("ed", ""), ("ed", "e"),
+                     ("ing", ""), ("ing", "e"), ("er", ""), ("er", "e"), ("est", ""), ("est", "e")]
+# Endings of words derived from another one (morosely from morose), only a near-miss
+DerivationEndings = [("ily", "y"), ("iness", "y"), ("ly", ""), ("ness", ""), ("ment", "")]
+
+class AnswerGrader():
+    '''
+    Grade written answers as "correct", "near-miss" or "wrong".
+    The normalized form of every word (lowercase letters only, no accents) is computed once, so an answer is
+    correct when it or the word it is an inflection of (abased, abeyances) has the normalized form of the word asked.
+    An answer that is the form of another word is wrong however close it is (affect for effect), otherwise
+    it is a near-miss when it is derived from the word (morosely for morose) or within one typo of a word
+    of up to 5 letters or two typos of a longer one.
+    '''
+    NonLetters = re.compile("[^a-z]+")
+
+    def __init__(self, Words):
+        # Normalized form -> word, and word -> normalized form
+        self.Forms = {}
+        self.Normalized = {}
+        for word in Words:
+            Form = self.Normalize(word)
+            self.Forms.setdefault(Form, word)
+            self.Normalized[word] = Form
+
+    def Normalize(self, Text):
+        import unicodedata
+
+        # Accented letters lose their accents, everything that is not a letter is dropped
+        return self.NonLetters.sub("", unicodedata.normalize('NFKD', Text.lower()).encode('ascii', 'ignore').decode('ascii'))
+
+    def BaseForms(self, Form):
+        # The form and the words it could be an inflection of, abetted and abetting give abet, madder gives mad
+        Bases = [Form]
+        for Ending, Replacement in InflectionEndings:
+            if Form.endswith(Ending) and len(Form) - len(Ending) >= 3:
+                Base = Form[:len(Form) - len(Ending)]
+                Bases.append(Base + Replacement)
+                if Ending in ("ed", "ing", "er", "est") and Replacement == "" and Base[-1] == Base[-2]:
+                    Bases.append(Base[:-1])
+        return Bases
+
+    def Grade(self, word, Answer):
+        Expected = self.Normalized.get(word) or self.Normalize(word)
+        Given = self.Normalize(str(Answer))
+        if Given == "":
+            return "wrong"
+        Bases = self.BaseForms(Given)
+        if Expected in Bases:
+            return "correct"
+        # Checked before the other words, the lists have morosely as well as morose
+        for Base in Bases:
+            for Ending, Replacement in DerivationEndings:
+                if Base.endswith(Ending) and Base[:len(Base) - len(Ending)] + Replacement == Expected:
+                    return "near-miss"
+        if any(Base in self.Forms for Base in Bases):
+            return "wrong"
+        Allowed = 1 if len(Expected) <= 5 else 2
+        if any(EditDistance(Base, Expected, Allowed) <= Allowed for Base in Bases):
+            return "near-miss"
+        return "wrong"
+
+def GetAnswerGrader():
+    # Built with the question bank the first time a written answer is graded
+    QuestionWords = GetQuestionBank()
+    if QuestionWords.Grader is None:
+        QuestionWords.Grader = AnswerGrader(QuestionWords.Words)
+    return QuestionWords.Grader
+
+def InvalidateQuestionBank():
+    # Call after changing GlobalDictionary
+    global Bank
+    Bank = None
+
+def AskNumberOfQuestions(Total, Prompt):
+    NoOfQuestions = Terminal.Ask(Prompt)
+    while True:
+        if NoOfQuestions.isnumeric():
+            NoOfQuestions = int(NoOfQuestions)
+            
+            # Verify that length of words in more than number of questions
+            if NoOfQuestions <= Total:
+                return NoOfQuestions
+            else:
+                Terminal.Print("\nPlease Enter a number less than or equal to {}".format(Total))
+                NoOfQuestions = Terminal.Ask(Prompt)
+        else:
+            Terminal.Print("\nInvalid choice! Enter numerical input.")
+            NoOfQuestions = Terminal.Ask(Prompt)
+
+def AskDifficulty():
+    # Returns True for hard mode
+    Terminal.Print("\nSelect difficulty:\n\n1. Normal\n2. Hard (similar meanings as options)")
+    Difficulty = Terminal.Ask("\nEnter your choice: ")
+    while Difficulty not in ["1", "2"]:
+        Terminal.Print("\nInvalid choice! Enter 1 or 2.")
+        Difficulty = Terminal.Ask("\nEnter your choice: ")
+    if Difficulty == "1":
+        return False
+    if not GetQuestionBank().LoadNeighbours():
+        Terminal.Print("\nHard mode needs NumPy (pip install numpy). Continuing in normal mode.")
+        Terminal.Show()
+        return False
+    return True
+
+def AskAnswer(NoOfOptions):
+    Options = list(range(1, NoOfOptions + 1))
+    Answer = Terminal.Ask("\nAnswer: ")
+    while True:
+        if Answer.isnumeric():
+            if int(Answer) in Options:
+                return int(Answer)
+            else:
+                Terminal.Print("\nValid options are {} & {}. Enter again".format(", ".join(map(str, Options[:-1])), Options[-1]))
+                Answer = Terminal.Ask("\nAnswer: ")
+        else:
+            Terminal.Print("\nInvalid choice! Enter numerical input.")
+            Answer = Terminal.Ask("\nAnswer: ")
+
+def PrintFinalScore(Correct, Total, TimeTaken):
+    Terminal.Print("\n-------------------------------------\n")
+    Terminal.Print("        Final Score: {} / {}".format(Correct, Total))
+    if Correct >= Total / 2:
+        Terminal.Print("\n      You passed the test 🤩")
+    else:
+        Terminal.Print("\n     You scored less than 50% 😢")
+        Terminal.Print("\n       Try retaking the test 😊")
+    Terminal.Print("\n-------------------------------------\n")
+    Terminal.Print("\n       Time Taken: {}".format(TimeTaken))
+    Terminal.Print("\n-------------------------------------\n")
+    Terminal.Ask()
+
+class ReviewScheduler():
+    '''
+    SM-2 spaced repetition over the learnt words of the current profile.
+    Every learnt word has an ease factor, an interval in days and a due date in progress.db,
+    indexed by due date so the next N due words are one query.
+    A word is due from the day it is learnt until its first review.
+    '''
+    def __init__(self, Today=None):
+        self.Today = Today if Today is not None else datetime.date.today()
+        self.Changes = {}
+
+    def DueWords(self, NoOfWords=None):
+        # Words due today or earlier, most overdue first
+        Rows = GetProgressStore().execute("SELECT Word FROM LearntWords WHERE Profile = ? AND Due <= ? ORDER BY Due, Word LIMIT ?",
+                                          (GetProfileId(), self.Today.isoformat(), -1 if NoOfWords is None else NoOfWords))
+        return [word for word, in Rows]
+
+    def NoOfDueWords(self):
+        return GetProgressStore().execute("SELECT COUNT(*) FROM LearntWords WHERE Profile = ? AND Due <= ?", (GetProfileId(), self.Today.isoformat())).fetchone()[0]
+
+    def Review(self, word, Quality):
+        # Quality from 0 (complete blackout) to 5 (perfect recall), 3 or more counts as remembered
+        Entry = self.Changes.get(word)
+        if Entry is None:
+            Row = GetProgressStore().execute("SELECT Ease, Interval, Repetitions FROM LearntWords WHERE Profile = ? AND Word = ?", (GetProfileId(), word)).fetchone()
+            if Row is None:
+                return
+            Entry = {'Ease': Row[0], 'Interval': Row[1], 'Repetitions': Row[2]}
+        Entry = dict(Entry)
+        Entry['Ease'] = max(1.3, Entry['Ease'] + 0.1 - (5 - Quality) * (0.08 + (5 - Quality) * 0.02))
+        if Quality < 3:
+            Entry['Repetitions'] = 0
+            Entry['Interval'] = 1
+        else:
+            Entry['Repetitions'] += 1
+            if Entry['Repetitions'] == 1:
+                Entry['Interval'] = 1
+            elif Entry['Repetitions'] == 2:
+                Entry['Interval'] = 6
+            else:
+                Entry['Interval'] = int(round(Entry['Interval'] * Entry['Ease']))
+        Entry['Due'] = (self.Today + datetime.timedelta(days=Entry['Interval'])).isoformat()
+        self.Changes[word] = Entry
+
+    def Save(self):
+        Id = GetProfileId()
+        with GetProgressStore() as Connection:
+            Connection.executemany("UPDATE LearntWords SET Ease = ?, Interval = ?, Repetitions = ?, Due = ? WHERE Profile = ? AND Word = ?",
+                                   [(Entry['Ease'], Entry['Interval'], Entry['Repetitions'], Entry['Due'], Id, word) for word, Entry in self.Changes.items()])
+        self.Changes = {}
+
+class FenwickSampler():
+    '''
+    Weighted random positions 0 to n-1, kept as a Fenwick tree of the weights,
+    so drawing a position and changing the weight of one are both O(log n).
+    '''
+    def __init__(self, Weights):
+        self.Weights = list(Weights)
+        self.Build()
+
+    def Build(self):
+        # Every node holds the sum of the weights below it, filled in O(n)
+        self.Tree = [0.0] + self.Weights
+        for i in range(1, len(self.Tree)):
+            Parent = i + (i & -i)
+            if Parent < len(self.Tree):
+                self.Tree[Parent] += self.Tree[i]
+        self.TopStep = 1 << (len(self.Weights).bit_length() - 1) if self.Weights else 0
+
+    def Total(self):
+        Total = 0.0
+        i = len(self.Weights)
+        while i > 0:
+            Total += self.Tree[i]
+            i -= i & -i
+        return Total
+
+    def Update(self, Position, Weight):
+        Change = Weight - self.Weights[Position]
+        self.Weights[Position] = Weight
+        i = Position + 1
+        while i < len(self.Tree):
+            self.Tree[i] += Change
+            i += i & -i
+
+    def Sample(self, Rng):
+        # Walk down the tree to the first position whose running sum passes a random point of the total
+        Target = Rng.random() * self.Total()
+        Position = 0
+        Step = self.TopStep
+        while Step > 0:
+            if Position + Step < len(self.Tree) and self.Tree[Position + Step] <= Target:
+                Position += Step
+                Target -= self.Tree[Position]
+            Step >>= 1
+        if Position >= len(self.Weights) or self.Weights[Position] <= 0:
+            # Rounding errors from many updates, sum the tree again
+            self.Build()
+            return self.Sample(Rng)
+        return Position
+
+# Days since a word was last answered that a word never answered counts as
+AdaptiveNewWordDays = 7
+# Seconds after which the days since every word was answered are worked out again
+AdaptiveRebuildSeconds = 3600
+
+def AdaptiveWeight(Answers, Correct, DaysSinceAnswered):
+    # Error rate counting one right and one wrong answer extra, so an unanswered word counts as half missed,
+    # grown slowly with the days since the word was last answered
+    return (Answers - Correct + 1) / (Answers + 2) * (1 + math.log1p(DaysSinceAnswered))
+
+class AdaptiveSampler():
+    '''
+    Learnt words of a profile drawn with a weight growing with how often they were answered wrong
+    and how long ago they were last answered. The weights come from WordStats once and are then
+    updated one word at a time as answers come in.
+    '''
+    def __init__(self, Now=None):
+        Connection = GetProgressStore()
+        CompactAnswerLog(Connection)
+        self.Now = Now if Now is not None else time.time()
+        Rows = Connection.execute("""SELECT LearntWords.Word, IFNULL(Answers, 0), IFNULL(Correct, 0), LastAnswered FROM LearntWords
+            LEFT JOIN WordStats ON WordStats.Profile = LearntWords.Profile AND WordStats.Word = LearntWords.Word
+            WHERE LearntWords.Profile = ? ORDER BY LearntWords.Word""", (GetProfileId(),)).fetchall()
+        self.Words = [Row[0] for Row in Rows]
+        self.Positions = {word: Position for Position, word in enumerate(self.Words)}
+        self.Counts = [[Answers, Correct] for _, Answers, Correct, _ in Rows]
+        self.Sampler = FenwickSampler(AdaptiveWeight(Answers, Correct, self.DaysSince(LastAnswered)) for _, Answers, Correct, LastAnswered in Rows)
+
+    def DaysSince(self, When):
+        return AdaptiveNewWordDays if When is None else max(0.0, (self.Now - When) / 86400)
+
+    def __len__(self):
+        return len(self.Words)
+
+    def Draw(self, NoOfWords, Rng):
+        # NoOfWords different words, each drawn with the weights of the words not drawn yet
+        Drawn = []
+        for _ in range(min(NoOfWords, len(self.Words))):
+            Position = self.Sampler.Sample(Rng)
+            Drawn.append((Position, self.Sampler.Weights[Position]))
+            self.Sampler.Update(Position, 0.0)
+        for Position, Weight in Drawn:
+            self.Sampler.Update(Position, Weight)
+        return [self.Words[Position] for Position, _ in Drawn]
+
+    def Answered(self, word, Correct, When):
+        Position = self.Positions.get(word)
+        if Position is None:
+            return
+        Counts = self.Counts[Position]
+        Counts[0] += 1
+        Counts[1] += bool(Correct)
+        self.Sampler.Update(Position, AdaptiveWeight(Counts[0], Counts[1], self.DaysSince(When)))
+
+# Profile name -> its AdaptiveSampler, kept up to date by the answer hook
+AdaptiveSamplers = {}
+
+def GetAdaptiveSampler():
+    # Built again when the learnt words changed or the days since the words were answered are out of date
+    Sampler = AdaptiveSamplers.get(ProfileName)
+    if Sampler is None or time.time() - Sampler.Now > AdaptiveRebuildSeconds or \
+            len(Sampler) != GetProgressStore().execute("SELECT COUNT(*) FROM LearntWords WHERE Profile = ?", (GetProfileId(),)).fetchone()[0]:
+        Sampler = AdaptiveSamplers[ProfileName] = AdaptiveSampler()
+    return Sampler
+
+def UpdateAdaptiveSampler(Event, Data):
+    Sampler = AdaptiveSamplers.get(Data['profile'])
+    if Sampler is not None:
+        Sampler.Answered(Data['word'], Data['correct'], Data['time'])
+
+AddHook("answer", UpdateAdaptiveSampler)
+
+def ChooseLearntWords(WordDictionary, Rng):
+    '''
+    Ask whether to test all learnt words or only the due reviews, then how many questions.
+    Returns the (word, definition) pairs to ask and the scheduler to record the answers in.
+    '''
+    Scheduler = ReviewScheduler()
+    NoOfDue = Scheduler.NoOfDueWords()
+
+    Terminal.Print("\nSelect words:\n\n1. All learnt words\n2. Due reviews ({} due)\n3. Adaptive (mostly words you miss or have not seen for a while)".format(NoOfDue))
+    Mode = Terminal.Ask("\nEnter your choice: ")
+    while Mode not in ["1", "2", "3"]:
+        Terminal.Print("\nInvalid choice! Enter 1, 2 or 3.")
+        Mode = Terminal.Ask("\nEnter your choice: ")
+
+    if Mode == "3":
+        NoOfQuestions = AskNumberOfQuestions(len(WordDictionary), "\nHow many words do you want in the test from a total of {} words : ".format(len(WordDictionary)))
+        TestWords = [(word, WordDictionary[word]) for word in GetAdaptiveSampler().Draw(NoOfQuestions, Rng)]
+    elif Mode == "2":
+        NoOfQuestions = AskNumberOfQuestions(NoOfDue, "\nHow many words do you want in the test from a total of {} due words : ".format(NoOfDue))
+        TestWords = [(word, WordDictionary[word]) for word in Scheduler.DueWords(NoOfQuestions)]
+    else:
+        NoOfQuestions = AskNumberOfQuestions(len(WordDictionary), "\nHow many words do you want in the test from a total of {} words : ".format(len(WordDictionary)))
+        # Sample random words
+        TestWords = Rng.sample(list(WordDictionary.items()), NoOfQuestions)
+    return TestWords, Scheduler
+
+def GradeAnswer(Question, Answer):
+    # Answer is the option number for MCQ questions and the typed word for written questions
+    if Question['Type'] == "Written":
+        return GetAnswerGrader().Grade(Question['Word'], Answer)
+    return "correct" if Answer == Question['Answer'] else "wrong"
+
+def IsCorrectAnswer(Question, Answer):
+    return GradeAnswer(Question, Answer) == "correct"
+
+def AnswerQuality(Question, Grade):
+    # SM-2 quality of an answer, a near-miss was remembered with difficulty
+    if Grade == "correct":
+        return 4 if Question['Type'] != "Written" else 5
+    return 3 if Grade == "near-miss" else 1
+
+def RunMCQTest(TestName, Form, Scheduler=None):
+    # Every question and its result are one frame each, the next question replaces the result
+    Correct = 0
+    Incorrect = 0
+    StartTime = time.time()
+    for Question in Form:
+        QuestionStart = time.perf_counter()
+        Terminal.Print("\n------------------------------------------------")
+        if Question['Type'] == "Synonym To Meaning":
+            Terminal.Print("\nWhat is the meaning of {}?\n".format(Question['Word'].strip()))
+        else:
+            Terminal.Print('\nWhat word descibes "{}"?\n'.format(Question['Definition'].strip()))
+
+        Count = 0
+        for Choice in Question['Choices']:
+            Count += 1
+            Terminal.Print("{}. {}".format(Count, Choice.strip()))
+
+        Answer = AskAnswer(len(Question['Choices']))
+        RecordAnswer(TestName, Question, Answer, IsCorrectAnswer(Question, Answer), time.perf_counter() - QuestionStart)
+
+        if Scheduler is not None:
+            Scheduler.Review(Question['Word'], 4 if IsCorrectAnswer(Question, Answer) else 1)
+
+        # increase the scores
+        if IsCorrectAnswer(Question, Answer):
+            Correct += 1
+            Terminal.Print("\nCorrect ✅")
+        else:
+            Incorrect += 1
+            Terminal.Print("\nIncorrect ❌")
+            if Question['Type'] == "Synonym To Meaning":
+                Terminal.Print("\nThe correct answer is : {}".format(Question['Definition']))
+            else:
+                Terminal.Print("\nThe correct answer is : {}".format(Question['Word']))
+
+        Terminal.Print("\n\n-------------------------------------\n")
+        Terminal.Print("          Score: {} / {}".format(Correct, Correct + Incorrect))
+        Terminal.Print("\n-------------------------------------")
+        Terminal.Print()
+        Terminal.Ask()
+        Terminal.Clear()
+    
+    EndTime = time.time()
+    if Scheduler is not None:
+        Scheduler.Save()
+    
+    TimeTaken = time.strftime("%H:%M:%S", time.gmtime(EndTime - StartTime))
+    SaveTestScores(TestName, Correct, Correct + Incorrect, EndTime - StartTime)
+    
+    PrintFinalScore(Correct, Correct + Incorrect, TimeTaken)
+    ClearOutput()
+    return
+
+def RunWrittenTest(TestName, Form, Scheduler=None):
+    Score = 0
+    Count = 0
+    WrongAnswers = {}
+
+    StartTime = time.time()
+    for Question in Form:
+        word = Question['Word']
+        QuestionStart = time.perf_counter()
+        Terminal.Print("\n-------------------------------------")
+        Terminal.Print('\nWhat word descibes "{}"?'.format(Question['Definition'].strip()))
+        InputWord = str(Terminal.Ask("\nAnswer: "))
+        Grade = GradeAnswer(Question, InputWord)
+        RecordAnswer(TestName, Question, InputWord, Grade == "correct", time.perf_counter() - QuestionStart)
+
+        if Scheduler is not None:
+            Scheduler.Review(word, AnswerQuality(Question, Grade))
+
+        if Grade == "correct":
+            Terminal.Print("\nCorrect ✅")
+            Score += 1
+
+        elif Grade == "near-miss":
+            Terminal.Print("\nAlmost ✳️  Check the spelling")
+            Terminal.Print("\nThe correct answer is : {}".format(word.strip()))
+            WrongAnswers[word] = Question['Definition']
+
+        else:
+            Terminal.Print("\nIncorrect ❌")
+            Terminal.Print("\nThe correct answer is : {}".format(word.strip()))
+            WrongAnswers[word] = Question['Definition']
+
+        Count += 1
+
+        Terminal.Print("\n\n-------------------------------------\n")
+        Terminal.Print("          Score: {} / {}".format(Score, Count))
+        Terminal.Print("\n-------------------------------------")
+        Terminal.Print()
+        Terminal.Ask()
+        Terminal.Clear()
+
+    EndTime = time.time()
+    if Scheduler is not None:
+        Scheduler.Save()
+    
+    TimeTaken = time.strftime("%H:%M:%S", time.gmtime(EndTime - StartTime))
+    SaveTestScores(TestName, Score, Count, EndTime - StartTime)
+    
+    PrintFinalScore(Score, Count, TimeTaken)
+    
+    # print the wrong answers
+    Terminal.Print("\nRemember these words 📖")
+
+    for word, meaning in WrongAnswers.items():
+        Terminal.Print("\n{} : {}".format(word.strip(), meaning))
+    
+    Terminal.Ask()
+    ClearOutput()
+    return
+
+def MCQTestLearnt():
+    Heading("MCQ Test Revision")
+    Rng = random.Random(TestSeed)
+    WordDictionary = LoadTestedWords()
+
+    TestWords, Scheduler = ChooseLearntWords(WordDictionary, Rng)
+    Hard = AskDifficulty()
+
+    RunMCQTest("MCQ (Learnt Words)", GetQuestionBank().BuildTestForm(TestWords, NoOfChoices, Rng, Hard), Scheduler)
+
+def MCQTestRandom():
+    Heading("MCQ Test Random")
+    Rng = random.Random(TestSeed)
+    QuestionWords = GetQuestionBank()
+
+    NoOfQuestions = AskNumberOfQuestions(len(QuestionWords), "\nHow many words do you want in the test : ")
+    Hard = AskDifficulty()
+
+    RunMCQTest("MCQ (Random Words)", QuestionWords.BuildTestForm(QuestionWords.Sample(NoOfQuestions, Rng), NoOfChoices, Rng, Hard))
+
+def WrittenTestLearnt():
+    Heading("Written Test Revision")
+    Rng = random.Random(TestSeed)
+    WordDictionary = LoadTestedWords()
+
+    TestWords, Scheduler = ChooseLearntWords(WordDictionary, Rng)
+
+    RunWrittenTest("Written Test (Learnt Words)", GetQuestionBank().BuildTestForm(TestWords, 0, Rng), Scheduler)
+
+def WrittenTestRandom():
+    Heading("Written Test Random")
+    Rng = random.Random(TestSeed)
+    QuestionWords = GetQuestionBank()
+
+    NoOfQuestions = AskNumberOfQuestions(len(QuestionWords), "\nHow many words do you want in the test : ")
+
+    RunWrittenTest("Written Test (Random Words)", QuestionWords.BuildTestForm(QuestionWords.Sample(NoOfQuestions, Rng), 0, Rng))
+
+def AddMissingVocabulary(Lists=None):
+    # Scrape every word of the lists (all of them by default) that is not in the vocabulary yet, returns the number of words added
+    # Words scraped by an interrupted update are already in the journal and are skipped here
+    Definitions = {}
+    for key in (GlobalDictionary.keys() if Lists is None else Lists):
+        for WordDictionary in GlobalDictionary[key]:
+            if WordDictionary['word'] not in VocabDictionary and WordDictionary['word'] not in Definitions:
+                Definitions[WordDictionary['word']] = WordDictionary['Definition']
+
+    Added = ScrapeWords(Definitions)
+    VocabDictionary.Compact()
+    SaveFullTextIndex()
+    return Added
+
+def ReparseCachedWords():
+    # Parse the cached page of every vocabulary word again, so a parser fix applies without fetching anything
+    Cache = GetResponseCache()
+    Changes = []
+    for URL in Cache.URLs(ScrapeBaseURL):
+        word = URL[len(ScrapeBaseURL):]
+        Cached = Cache.Get(URL)
+        if word not in VocabDictionary or Cached is None:
+            continue
+        Old = VocabDictionary[word]
+        Entry = ParseWordMeaning(word, Cached['Content'])
+        if 'Definition' in Old:
+            Entry['Definition'] = Old['Definition']
+        if Entry != Old:
+            Changes.append((word, Entry))
+    VocabDictionary.Commit(Changes)
+    VocabDictionary.Compact()
+    SaveFullTextIndex()
+    return len(Changes)
+
+def UpdateVocabulary():
+    ClearOutput()
+    print("\nUpdating the local vocabulary...")
+    print("\n-----------------------------------")
+    print("\n        {}".format("Update Vocabulary"))
+    print("\n-----------------------------------")
+    try:
+        AddMissingVocabulary()
+    except KeyboardInterrupt:
+        input("\nPress Enter to continue")
+        ClearOutput()
+        return
+
+    print("\nLocal vocabulary successfully updated. Current length is {}".format(len(VocabDictionary)))
+    input("\nPress Enter to continue")
+    ClearOutput()
+    return
+
+def RemoveTestedWords():
+    Heading("Remove Tested Words")
+    print("\nIf you feel like you have completely memorized a word in the Tested Words list, you can remove it here.")
+    word = input("\nWhich word would you like to remove (Type L for the entire list): ").lower()
+    
+    data = LoadTestedWords()
+
+    if word == "l":
+        for word in data.keys():
+            print(word.strip())
+        word = input("\nWhich word would you like to remove (Type L for the entire list): ").lower()
+    
+    if word in data.keys():
+        SaveTestedWords([(word, None)])
+        print('\n"{}" was successfully removed.'.format(word))
+        input()
+    else:
+        print('\n"{}" was not found in the list.'.format(word))
+        print('\nPlease check the spelling and try again.')
+        input()
+
+    ClearOutput()
+    return
+
+# Fields searched by ReverseLookup and how much a match in each of them counts
+FullTextFields = {"Definition": 3.0, "Synonyms": 2.0, "Short Explanation": 1.0, "Long Explanation": 0.5}
+StopWords = set("""a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had has have having he
+her here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not now of
+off on once only or other our ours out over own same she should so some such than that the their theirs them then
+there these they this those through to too under until up very was we were what when where which while who whom why
+will with would you your yours someone something one ones""".split())
+# Suffixes stripped by Stem and what replaces them, the first one that matches is used
+StemSuffixes = (("ingly", ""), ("edly", ""), ("ness", ""), ("ment", ""), ("ings", ""), ("ing", ""), ("ies", ""), ("ied", ""),
+                ("ity", ""), ("ive", ""), ("ous", ""), ("ed", ""), ("ly", ""), ("es", ""), ("cy", "t"), ("s", ""))
+# "es" is only a suffix after these, "secretes" is "secrete" + "s"
+SibilantEndings = ("s", "x", "z", "ch", "sh")
+
+def Stem(Token):
+    # Light suffix stripping, good enough to match "secretive" and "secrecy" with "secret" or "hides" with "hide"
+    for Suffix, Replacement in StemSuffixes:
+        if Token.endswith(Suffix) and len(Token) - len(Suffix) >= 4:
+            if Suffix == "es" and not Token[:-2].endswith(SibilantEndings):
+                continue
+            return Token[:-len(Suffix)] + Replacement
+    return Token
+
+def Tokenize(Text):
+    return [Stem(Token) for Token in re.findall(r"[a-z]+", Text.lower()) if Token not in StopWords and len(Token) > 1]
+
+class FullTextIndex():
+    '''
+    Inverted index over the explanations, synonyms and definitions of the vocabulary, ranked with BM25.
+    Term frequencies are weighted by the field they appear in (see FullTextFields).
+    '''
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        self.DocWords = []
+        self.DocIds = {}
+        self.DocLengths = []
+        self.TotalLength = 0.0
+        self.Postings = {}
+        self.Terms = None
+        self.Checksums = {}
+        self.Changed = False
+
+    def Add(self, word, Entry):
+        if word in self.DocIds:
+            self.Remove(word)
+        self.Checksums[word] = EntryChecksum(Entry)
+        Frequencies = {}
+        for Field, Weight in FullTextFields.items():
+            for Token in Tokenize(str(Entry.get(Field, ""))):
+                Frequencies[Token] = Frequencies.get(Token, 0.0) + Weight
+        DocId = len(self.DocWords)
+        self.DocWords.append(word)
+        self.DocIds[word] = DocId
+        Length = sum(Frequencies.values())
+        self.DocLengths.append(Length)
+        self.TotalLength += Length
+        for Token, Frequency in Frequencies.items():
+            if Token not in self.Postings:
+                self.Postings[Token] = {}
+                self.Terms = None
+            self.Postings[Token][DocId] = Frequency
+        self.Changed = True
+
+    def Remove(self, word):
+        DocId = self.DocIds.pop(word, None)
+        if DocId is None:
+            return
+        self.Checksums.pop(word, None)
+        # Document ids are never reused, the slot stays empty until the index is rebuilt
+        self.DocWords[DocId] = None
+        self.TotalLength -= self.DocLengths[DocId]
+        self.DocLengths[DocId] = 0.0
+        for Token in list(self.Postings.keys()):
+            Posting = self.Postings[Token]
+            if DocId in Posting:
+                del Posting[DocId]
+                if len(Posting) == 0:
+                    del self.Postings[Token]
+                    self.Terms = None
+        self.Changed = True
+
+    def Update(self, word, Entry):
+        # Listener for VocabularyStore.Commit
+        if Entry is None:
+            self.Remove(word)
+        else:
+            self.Add(word, Entry)
+
+    def ExpandTerm(self, Term):
+        # A query term that is not in the index (a word typed in part) matches the index terms starting with it, at half the weight.
+        # Whole words are not expanded, "secret" would match "secrete" otherwise.
+        if Term in self.Postings:
+            return [(Term, 1.0)]
+        if self.Terms is None:
+            self.Terms = sorted(self.Postings.keys())
+        Expansions = []
+        if len(Term) >= 4:
+            Start = bisect.bisect_right(self.Terms, Term)
+            for Other in self.Terms[Start:Start + 20]:
+                if not Other.startswith(Term):
+                    break
+                Expansions.append((Other, 0.5))
+        return Expansions
+
+    def Search(self, Query, Limit=10):
+        # Returns [(word, score)] best match first
+        NoOfDocuments = len(self.DocIds)
+        if NoOfDocuments == 0:
+            return []
+        AverageLength = self.TotalLength / NoOfDocuments
+        Scores = {}
+        for Term in set(Tokenize(Query)):
+            for IndexTerm, QueryWeight in self.ExpandTerm(Term):
+                Posting = self.Postings[IndexTerm]
+                IDF = math.log(1 + (NoOfDocuments - len(Posting) + 0.5) / (len(Posting) + 0.5))
+                for DocId, Frequency in Posting.items():
+                    Norm = self.K1 * (1 - self.B + self.B * self.DocLengths[DocId] / AverageLength)
+                    Scores[DocId] = Scores.get(DocId, 0.0) + QueryWeight * IDF * Frequency * (self.K1 + 1) / (Frequency + Norm)
+        Best = sorted(Scores.items(), key=lambda item: -item[1])[:Limit]
+        return [(self.DocWords[DocId], Score) for DocId, Score in Best]
+
+    def Save(self, FilePath):
+        # Postings are stored flat as [doc id, frequency, doc id, frequency, ...]
+        Data = {
+            'Version': 2,
+            'Words': self.DocWords,
+            'Checksums': [self.Checksums.get(word) for word in self.DocWords],
+            'Lengths': [round(Length, 2) for Length in self.DocLengths],
+            'Postings': {Token: [Value for DocId, Frequency in Posting.items() for Value in (DocId, Frequency)] for Token, Posting in self.Postings.items()},
+        }
+        WriteFileAtomically(FilePath, json.dumps(Data, separators=(',', ':')))
+        self.Changed = False
+
+    @classmethod
+    def Load(cls, FilePath):
+        Index = cls()
+        with open(FilePath, 'r') as f:
+            Data = json.load(f)
+        if Data.get('Version') != 2:
+            raise ValueError("Unknown index version")
+        Index.DocWords = Data['Words']
+        Index.DocIds = {word: DocId for DocId, word in enumerate(Index.DocWords) if word is not None}
+        Index.Checksums = {word: Checksum for word, Checksum in zip(Index.DocWords, Data['Checksums']) if word is not None}
+        Index.DocLengths = Data['Lengths']
+        Index.TotalLength = sum(Index.DocLengths)
+        Index.Postings = {Token: dict(zip(Flat[0::2], Flat[1::2])) for Token, Flat in Data['Postings'].items()}
+        return Index
+
+    def Synchronize(self, Vocabulary):
+        # Index the words added or changed (e.g. by cache --reparse) since the index was saved and drop the removed ones
+        Indexed = set(self.DocIds.keys())
+        for word in Vocabulary.keys():
+            Stale = word not in Indexed or self.Checksums.get(word) != Vocabulary.Checksum(word)
+            Indexed.discard(word)
+            if Stale:
+                self.Add(word, Vocabulary[word])
+        for word in Indexed:
+            self.Remove(word)
+
+VocabularyFullTextIndex = None
+
+def GetFullTextIndex():
+    # Loaded from vocabulary.fts.json on first use, brought up to date with the vocabulary and saved if anything changed
+    global VocabularyFullTextIndex
+    if VocabularyFullTextIndex is None:
+        try:
+            Index = FullTextIndex.Load(FullTextIndexFile)
+        except (FileNotFoundError, ValueError, KeyError):
+            Index = FullTextIndex()
+        Index.Synchronize(VocabDictionary)
+        VocabDictionary.AddListener(Index.Update)
+        VocabularyFullTextIndex = Index
+    SaveFullTextIndex()
+    return VocabularyFullTextIndex
+
+def SaveFullTextIndex():
+    if VocabularyFullTextIndex is not None and VocabularyFullTextIndex.Changed:
+        VocabularyFullTextIndex.Save(FullTextIndexFile)
+
+def ReverseLookup(String = None):
+    Heading("Reverse Lookup")
+    print("\nDescribe the meaning you are looking for, e.g. \"keeping something secret\"")
+    if String is None:
+        Query = str(input("\nEnter the meaning : "))
+    else:
+        Query = String
+
+    Results = GetFullTextIndex().Search(Query)
+    if len(Results) == 0:
+        print("\nNo words found for that meaning.")
+    else:
+        print()
+        for i in range(len(Results)):
+            word = Results[i][0]
+            print(str(i+1) + ". " + word + '  ::  ' + str(VocabDictionary[word].get('Definition', '')).strip())
+    
+    input()
+    ClearOutput()
+    return
+
+def SearchInVocabulary(String = None):
+    Heading("Search In Vocabulary")
+    if String is None:
+        WordToSearch = str(input("\nEnter the word : ")).lower()
+    else:
+        WordToSearch = String.lower()
+
+    Index = GetSearchIndex()
+    Match = Index.Get(WordToSearch)
+    if Match is None:
+        Suggestions = Index.Suggest(WordToSearch)
+        if len(Suggestions) == 0:
+            print("\nWord not found in vocabulary lists.")
+        else:
+            print("\nWord not found in vocabulary lists. Did you mean:\n")
+            for i in range(len(Suggestions)):
+                print(str(i+1) + ". " + Suggestions[i])
+            Choice = input("\nEnter a number to see the word (Leave empty to go back): ")
+            if Choice.isnumeric() and 0 < int(Choice) <= len(Suggestions):
+                Match = Suggestions[int(Choice) - 1]
+                print()
+
+    if Match is not None:
+        for key, value in VocabDictionary[Match].items():
+            print("\n" + key + " : " + value)
+    
+    input()
+    ClearOutput()
+    return
+
+def VocabularyLength():
+    ClearOutput()
+    print("\n-----------------------------------")
+    print("\n        {}".format("Vocabulary Length"))
+    print("\n-----------------------------------")
+    print("\nThe current vocabulary length is : {}".format(len(VocabDictionary)))
+    input()
+    ClearOutput()
+    return
+
+def MonthCalendarLines(Activity, Year, Month):
+    # A month with the days with practice marked, as lines 35 characters wide
+    import calendar
+
+    Lines = ["{:^35}".format("{} {}".format(calendar.month_name[Month], Year)), "", "Mon  Tue  Wed  Thu  Fri  Sat  Sun  "]
+    for Week in calendar.Calendar().monthdayscalendar(Year, Month):
+        line = ""
+        for x in Week:
+            if x == 0:
+                line += "     "
+            elif Activity.IsActive(datetime.date(Year, Month, x)):
+                line += "{:>3}  ".format("•" + str(x))
+            else:
+                line += "{:>3}  ".format(x)
+        Lines.append(line)
+    return Lines
+
+def StreakCalendar(Activity, Year=None, Month=None):
+    # This month, or any month since the profile started
+    Today = TodayDate()
+    Year = Year or Today.year
+    Month = Month or Today.month
+    First = datetime.date(Year, Month, 1)
+    Last = datetime.date(Year + Month // 12, Month % 12 + 1, 1) - datetime.timedelta(days=1)
+    Terminal.Print("  Streak Calendar - {}".format(First.strftime("%B %Y")))
+    Terminal.Print()
+    for line in MonthCalendarLines(Activity, Year, Month)[2:]:
+        Terminal.Print(line)
+    Terminal.Print("\n  {} days of practice in {}".format(Activity.Count(First, Last), First.strftime("%B %Y")))
+
+def YearCalendar(Activity, Year):
+    # The twelve months of a year, three side by side
+    Terminal.Print("  Streak Calendar - {}\n".format(Year))
+    for Row in range(4):
+        Months = [MonthCalendarLines(Activity, Year, Row * 3 + i) for i in range(1, 4)]
+        for i in range(max(len(Lines) for Lines in Months)):
+            Terminal.Print("   ".join(Lines[i] if i < len(Lines) else " " * 35 for Lines in Months).rstrip())
+        Terminal.Print()
+    Terminal.Print("  {} days of practice in {}".format(Activity.Count(datetime.date(Year, 1, 1), datetime.date(Year, 12, 31)), Year))
+
+def AskCalendar(Activity):
+    # Show the calendar of other months or years until an empty answer
+    while True:
+        When = Terminal.Ask("\nEnter a month (mm/yyyy) or a year (yyyy) to see its calendar, or press Enter to continue: ").strip()
+        if When == "":
+            return
+        try:
+            if "/" in When:
+                Month, Year = When.split("/")
+                Terminal.Print()
+                StreakCalendar(Activity, int(Year), int(Month))
+            else:
+                Terminal.Print()
+                YearCalendar(Activity, int(When))
+        except ValueError:
+            Terminal.Print("\nInvalid choice! Enter a month like 08/2022 or a year like 2022.")
+
+# Number of recent tests shown in the Stats table
+StatsTableLength = 20
+
+def Stats():
+    from tabulate import tabulate
+
+    Terminal.Clear()
+    headers = ["Test Type", "Score", "Time Taken", "Date", "Time"]
+    Aggregates = LoadAggregates()
+    DaysPassed, streak, max_streak, DaysPracticed = StreakInfo(TodayDate())
+    Activity = LoadActivity()
+    
+    Terminal.Print("\n-----------------------------------")
+    Terminal.Print("\n  {} | Days Passed {} | Current Streak {}".format(ProfileName, DaysPassed, streak))
+    Terminal.Print("\n-----------------------------------")
+    Terminal.Print("\n  Your highest streak is {} days.".format(max_streak))
+    Terminal.Print("\n  You practiced on {} days.".format(DaysPracticed))
+    Terminal.Print("\n-----------------------------------\n")
+    StreakCalendar(Activity)
+    AskCalendar(Activity)
+    if Aggregates['All'] != {}:
+        scores = ReadScores(StatsTableLength)
+        Summary = []
+        for TestName, Aggregate in Aggregates['Types'].items():
+            Summary.append([TestName, Aggregate['Count'], round(Aggregate['Sum'] / Aggregate['Count'], 2), round(Aggregate['Min'], 2), round(Aggregate['Max'], 2)])
+        Terminal.Print("\n-----------------------------------\n")
+        Terminal.Print("Your last {} tests\n".format(len(scores)))
+        Terminal.Print(tabulate(scores, headers=headers, tablefmt='fancy_grid'))
+        Terminal.Print("\n-----------------------------------\n")
+        Terminal.Print(tabulate(Summary, headers=["Test Type", "Tests", "Average %", "Lowest %", "Highest %"], tablefmt='fancy_grid'))
+        Terminal.Print("\n-----------------------------------\n")
+        Terminal.Print("Your average score is {}% over {} tests".format(round(Aggregates['All']['Sum'] / Aggregates['All']['Count'], 2), Aggregates['All']['Count']))
+        Year, Week, _ = TodayDate().isocalendar()
+        ThisWeek = Aggregates['Weeks'].get("{}-W{:02d}".format(Year, Week))
+        if ThisWeek is not None:
+            Terminal.Print("This week it is {}% over {} tests".format(round(ThisWeek['Sum'] / ThisWeek['Count'], 2), ThisWeek['Count']))
+        Hardest = HardestWords(StatsTableLength)
+        if Hardest:
+            Terminal.Print("\n-----------------------------------\n")
+            Terminal.Print("Your hardest words\n")
+            Terminal.Print(tabulate([[word, "{}/{}".format(Correct, Answers)] for word, Answers, Correct in Hardest], headers=["Word", "Correct"], tablefmt='fancy_grid'))
+        Terminal.Ask()
+        choice = Terminal.Ask("\nWould you like to see your scores in a graph? (Y/N) : ").lower()
+        if choice == "y":
+            import plotext as plt
+
+            Days, Averages, Rolling = RollingAverages(Aggregates)
+            X = list(range(1, len(Days) + 1))
+            plt.theme('dark')
+            plt.scatter(X, list(Averages), marker='☯',color=118, label="Daily average")
+            plt.plot(X, list(Rolling), color=45, label="7 day average")
+            plt.title("Performance Chart")
+            plt.ylim(min(Averages), 1.05 * max(Averages))
+            plt.xlim(0, len(Days) + 1)
+            plt.xlabel('Scores from {} to {}'.format(Days[0], Days[-1]))
+            Step = max(1, len(Days) // 8)
+            xticks = X[::Step]
+            xlabels = [datetime.date.fromisoformat(Days[x - 1]).strftime("%d/%m") for x in xticks]
+            plt.xticks(xticks, xlabels)
+            plt.show()
+            input("\nPress Enter to continue")
+        else:
+            ClearOutput()
+            return
+    ClearOutput()
+    return
+
+# Names of the menu actions in the menu events, in the order of PrintMenu
+MenuActions = ["lists", "add_list", "learn", "test", "update_vocabulary", "remove_tested", "search", "vocabulary_length",
+               "stats", "search_by_meaning", "switch_profile"]
+
+def PrintMenu():
+    Terminal.Print("------------------------------------")
+    Terminal.Print("Please enter a number: ")
+    Terminal.Print("1. Display all available lists")
+    Terminal.Print("2. Add a list from Vocabulary.com")
+    Terminal.Print("3. Learn from a list")
+    Terminal.Print("4. Take a test")
+    Terminal.Print("5. Update the local vocabulary")
+    Terminal.Print("6. Remove words from Tested Words")
+    Terminal.Print("7. Search for a word")
+    Terminal.Print("8. Vocabulary length")
+    Terminal.Print("9. Statistics")
+    Terminal.Print("10. Search by meaning")
+    Terminal.Print("11. Switch profile")
+    Terminal.Print("12. Exit")
+    Terminal.Print("------------------------------------")
+
+def ReadValues():
+    StatsStartDate = ""
+    StatsCount = 0
+    StatsTodayDateString = ""
+    StatsStreak = 0
+    StatsMaxStreak = 0
+    StatsStreakDaysString = ""
+    StatsStreakDays = []
+    f = open(StatsFile, 'r')
+    for line in f.readlines():
+        if line.startswith("StartDate"):
+            StatsStartDate = line.split("=")[1].strip().strip('"')
+        elif line.startswith("Count"):
+            StatsCount = line.split("=")[1].strip()
+        elif line.startswith("Today"):
+            StatsTodayDateString = line.split("=")[1].strip().strip('"')
+        elif line.startswith("Streak = "):
+            StatsStreak = line.split("=")[1].strip()
+        elif line.startswith("MaxStreak"):
+            StatsMaxStreak = line.split("=")[1].strip()
+        elif line.startswith("StreakDays"):
+            StatsStreakDaysString = line.split("=")[1].strip()
+            for i in StatsStreakDaysString.split(","):
+                if(i != "") and (i != " "):
+                    StatsStreakDays.append(int(i))
+        else:
+            continue
+    f.close()
+    
+    return str(StatsStartDate),int(StatsCount),str(StatsTodayDateString),int(StatsStreak),int(StatsMaxStreak),StatsStreakDays
+
+def StreakInfo(Today):
+    '''
+    Returns the days passed since the current profile started (counting its first day),
+    the current and highest streak and the number of days with practice.
+    '''
+    Activity = LoadActivity()
+    DaysPassed = (Today - Activity.Start).days + 1
+    return DaysPassed, Activity.CurrentStreak(Today), Activity.MaxStreak, Activity.Count()
+
+def StartSession():
+    # Open the progress of the current profile and mark today as a day of practice
+    MarkActive(TodayDate())
+
+def SwitchProfile():
+    ClearOutput()
+    print("\n-----------------------------------")
+    print("\n        {}".format("Switch Profile"))
+    print("\n-----------------------------------")
+    Profiles = [Name for Name, in GetProgressStore().execute("SELECT Name FROM Profiles ORDER BY Name")]
+    print("\nCurrent profile : {}\n".format(ProfileName))
+    for i in range(len(Profiles)):
+        print(str(i+1) + ". " + Profiles[i])
+
+    Choice = input("\nEnter a profile number or a new name (Leave empty to go back): ").strip()
+    if Choice == "":
+        ClearOutput()
+        return
+    if Choice.isnumeric() and 0 < int(Choice) <= len(Profiles):
+        Choice = Profiles[int(Choice) - 1]
+    UseProfile(Choice)
+    StartSession()
+    print('\nWelcome, {}!'.format(ProfileName))
+    input()
+    ClearOutput()
+    return
+
+def main():
+    ClearOutput()
+    print("\nWelcome to the GRE World!")
+    StartSession()
+
+    while(True):    
+        Terminal.Print("\nTell us what would you like to do")
+        Terminal.Print()
+        PrintMenu()
+        choice = Terminal.Ask("\nEnter your choice: ")
+        
+        if choice.isnumeric():
+            choice = int(choice)
+            StartTime = time.perf_counter()
+            if choice == 1:
+                DisplayAllLists()
+            elif choice == 2:
+                AddAList()
+            elif choice == 3:
+                Learn()
+            elif choice == 4:
+                while(True):
+                    print("\n1. MCQ (Learnt Words)\n2. MCQ (Random Words)\n3. Written Test (Learnt Words)\n4. Written Test (Random Words)\n5. Exit")
+                    TestOption = input("\nSelect Test : ")
+                    if TestOption.isnumeric():
+                        TestOption = int(TestOption)
+                        if TestOption == 1:
+                            MCQTestLearnt()
+                            ClearOutput()
+                            break
+                        elif TestOption == 2:
+                            MCQTestRandom()
+                            ClearOutput()
+                            break
+                        elif TestOption == 3:
+                            WrittenTestLearnt()
+                            ClearOutput()
+                            break
+                        elif TestOption == 4:
+                            WrittenTestRandom()
+                            ClearOutput()
+                            break
+                        elif TestOption == 5:
+                            ClearOutput()
+                            break
+                        else:
+                            print("\nInvalid Choice! Press Enter to continue.")
+                            input()
+                            ClearOutput()
+                    else:
+                        print("\nInvalid Choice! Press Enter to continue.")
+                        input()
+                        ClearOutput()
+                    continue
+            elif choice == 5:
+                UpdateVocabulary()
+            elif choice == 6:
+                RemoveTestedWords()
+            elif choice == 7:
+                SearchInVocabulary()
+            elif choice == 8:
+                VocabularyLength()
+            elif choice == 9:
+                Stats()
+            elif choice == 10:
+                ReverseLookup()
+            elif choice == 11:
+                SwitchProfile()
+            elif choice == 12:
+                ClearOutput()
+                sys.exit()
+            else:
+                print("\nInvalid Choice! Press Enter to continue.")
+                input()
+                ClearOutput()
+            if 1 <= choice <= len(MenuActions):
+                Emit("menu", {'action': MenuActions[choice - 1], 'seconds': round(time.perf_counter() - StartTime, 4)})
+        else:
+            print("\nInvalid Choice! Press Enter to continue.")
+            input()
+            ClearOutput()
+            continue
+
+def PrintOutput(Arguments, Data, Text):
+    # Print Data as JSON with --json, otherwise the plain text lines
+    if Arguments.json:
+        print(json.dumps(Data, indent=2, ensure_ascii=False))
+    else:
+        print("\n".join(Text))
+
+def CommandSearch(Arguments):
+    Index = GetSearchIndex()
+    Match = Index.Get(Arguments.word)
+    if Match is None:
+        Suggestions = Index.Suggest(Arguments.word)
+        PrintOutput(Arguments, {'word': Arguments.word, 'found': False, 'suggestions': Suggestions},
+                    ["Word not found in vocabulary lists."] + (["Did you mean: " + ", ".join(Suggestions)] if Suggestions else []))
+        return 1
+    Entry = VocabDictionary[Match]
+    PrintOutput(Arguments, {'word': Match, 'found': True, 'entry': Entry}, [Match] + [key + " : " + value for key, value in Entry.items()])
+    return 0
+
+def CommandMeaning(Arguments):
+    Results = GetFullTextIndex().Search(Arguments.query, Arguments.n)
+    Data = [{'word': word, 'score': round(Score, 3), 'definition': VocabDictionary[word].get('Definition', '')} for word, Score in Results]
+    PrintOutput(Arguments, Data, [Item['word'] + "  ::  " + Item['definition'] for Item in Data])
+    return 0
+
+def CommandLists(Arguments):
+    if Arguments.containing is not None:
+        Data = GlobalDictionary.ListsContaining(Arguments.containing)
+        PrintOutput(Arguments, Data, Data)
+        return 0 if Data else 1
+    if Arguments.lists is not None or Arguments.without is not None:
+        for ListName in (Arguments.lists or []) + (Arguments.without or []):
+            if ListName not in GlobalDictionary:
+                print("No list named {}".format(ListName), file=sys.stderr)
+                return 1
+        Data = GlobalDictionary.WordsIn(Arguments.lists or GlobalDictionary.keys(), Arguments.without or [])
+        PrintOutput(Arguments, Data, Data)
+        return 0
+    Data = {ListName: len(GlobalDictionary[ListName]) for ListName in GlobalDictionary.keys()}
+    PrintOutput(Arguments, Data, ["{}\t{}".format(Length, ListName) for ListName, Length in Data.items()])
+    return 0
+
+def CommandExport(Arguments):
+    for ListName in Arguments.lists or []:
+        if ListName not in GlobalDictionary:
+            print("No list named {}".format(ListName), file=sys.stderr)
+            return 1
+    Counts = ExportDeck(Arguments.file, Arguments.lists, not Arguments.no_vocabulary, not Arguments.no_progress)
+    PrintOutput(Arguments, Counts, ["Exported {} list words, {} vocabulary entries and {} learnt words to {}".format(Counts['word'], Counts['entry'], Counts['learnt'], Arguments.file)])
+    return 0
+
+def CommandImport(Arguments):
+    try:
+        Counts = ImportDeck(Arguments.file, not Arguments.no_progress)
+    except (OSError, ValueError) as Error:
+        print("Unable to import {} : {}".format(Arguments.file, Error), file=sys.stderr)
+        return 1
+    PrintOutput(Arguments, Counts, ["Added {} words to {} lists, {} vocabulary entries and {} learnt words".format(Counts['word'], Counts['list'], Counts['entry'], Counts['learnt'])])
+    return 0
+
+def CommandAddLists(Arguments):
+    try:
+        Lists = (ReadListManifest(Arguments.manifest) if Arguments.manifest else []) + [tuple(Pair) for Pair in Arguments.list or []]
+    except (OSError, ValueError) as Error:
+        print("Unable to read {} : {}".format(Arguments.manifest, Error), file=sys.stderr)
+        return 1
+    if len(Lists) == 0:
+        print("No lists given, name a manifest file or use --list URL NAME", file=sys.stderr)
+        return 1
+    Counts = ImportLists(Lists)
+    PrintOutput(Arguments, Counts, ["Added {} lists with {} words and {} vocabulary entries".format(Counts['lists'], Counts['words'], Counts['added'])]
+                + ["Unable to fetch {}".format(url) for url in Counts['failed']])
+    return 0 if len(Counts['failed']) == 0 else 1
+
+def CommandCache(Arguments):
+    Cache = GetResponseCache()
+    if Arguments.clear:
+        Cache.Clear()
+    Data = dict(Cache.Stats())
+    Text = ["{} pages, {} bodies, {:.1f} of {:.1f} MB".format(Data['responses'], Data['bodies'], Data['bytes'] / 2**20, Data['max_bytes'] / 2**20)]
+    if Arguments.reparse:
+        Data['reparsed'] = ReparseCachedWords()
+        Text.append("Updated {} vocabulary entries from the cached pages".format(Data['reparsed']))
+    PrintOutput(Arguments, Data, Text)
+    return 0
+
+def CommandVocabularySize(Arguments):
+    PrintOutput(Arguments, {'vocabulary': len(VocabDictionary)}, [str(len(VocabDictionary))])
+    return 0
+
+def CommandStats(Arguments):
+    Aggregates = LoadAggregates()
+    Data = {'profile': ProfileName, 'tests': Aggregates['All'].get('Count', 0)}
+    if Data['tests'] > 0:
+        Data['average'] = round(Aggregates['All']['Sum'] / Aggregates['All']['Count'], 2)
+        Data['types'] = {TestName: {'tests': Aggregate['Count'], 'average': round(Aggregate['Sum'] / Aggregate['Count'], 2), 'min': Aggregate['Min'], 'max': Aggregate['Max']} for TestName, Aggregate in Aggregates['Types'].items()}
+        Data['days'] = {Day: {'tests': Aggregate['Count'], 'average': round(Aggregate['Sum'] / Aggregate['Count'], 2)} for Day, Aggregate in Aggregates['Days'].items()}
+        Data['weeks'] = {Week: {'tests': Aggregate['Count'], 'average': round(Aggregate['Sum'] / Aggregate['Count'], 2)} for Week, Aggregate in Aggregates['Weeks'].items()}
+    _, Data['streak'], Data['max_streak'], Data['days_used'] = StreakInfo(TodayDate())
+    Text = ["Profile: {}".format(ProfileName), "Tests taken: {}".format(Data['tests'])]
+    if Data['tests'] > 0:
+        Text.append("Average score: {}%".format(Data['average']))
+        for TestName, Summary in Data['types'].items():
+            Text.append("{}: {} tests, average {}%".format(TestName, Summary['tests'], Summary['average']))
+    Text.append("Current streak: {} | Highest streak: {}".format(Data['streak'], Data['max_streak']))
+    PrintOutput(Arguments, Data, Text)
+    return 0
+
+def CommandCalendar(Arguments):
+    # The days with practice of a month (yyyy-mm) or a year (yyyy), this month by default
+    Activity = LoadActivity()
+    Today = TodayDate()
+    try:
+        Parts = [int(Part) for Part in (Arguments.when or "{}-{}".format(Today.year, Today.month)).split("-")]
+        First = datetime.date(Parts[0], Parts[1] if len(Parts) > 1 else 1, 1)
+        Last = datetime.date(Parts[0], 12, 31) if len(Parts) == 1 else datetime.date(Parts[0] + Parts[1] // 12, Parts[1] % 12 + 1, 1) - datetime.timedelta(days=1)
+    except (ValueError, IndexError):
+        print("Enter a month like 2022-08 or a year like 2022", file=sys.stderr)
+        return 1
+    if Arguments.json:
+        PrintOutput(Arguments, {'from': First.isoformat(), 'to': Last.isoformat(), 'active_days': Activity.Count(First, Last), 'days': [Day.isoformat() for Day in Activity.Days(First, Last)]}, [])
+    elif First.month == Last.month:
+        StreakCalendar(Activity, First.year, First.month)
+    else:
+        YearCalendar(Activity, First.year)
+    Terminal.Show()
+    return 0
+
+def CommandProfiles(Arguments):
+    Rows = GetProgressStore().execute("""SELECT Name, StartDate,
+        (SELECT COUNT(*) FROM LearntWords WHERE Profile = Profiles.Id),
+        (SELECT COUNT(*) FROM TestResults WHERE Profile = Profiles.Id)
+        FROM Profiles ORDER BY Name""").fetchall()
+    Data = [{'name': Name, 'start_date': Start, 'learnt_words': Learnt, 'tests': Tests, 'current': Name == ProfileName} for Name, Start, Learnt, Tests in Rows]
+    PrintOutput(Arguments, Data, ["{} {}\tsince {}, {} learnt words, {} tests".format("*" if Item['current'] else " ", Item['name'], Item['start_date'], Item['learnt_words'], Item['tests']) for Item in Data])
+    return 0
+
+def Percentile(SortedValues, P):
+    # Nearest rank percentile of values sorted in ascending order
+    return SortedValues[max(0, -(-len(SortedValues) * P // 100) - 1)]
+
+def LatencySummary(Times):
+    Times = sorted(Times)
+    return {'count': len(Times), 'p50': Percentile(Times, 50), 'p95': Percentile(Times, 95), 'p99': Percentile(Times, 99)}
+
+def CommandReport(Arguments):
+    # Answer times per test type and per word, and menu action times, from the event log of this profile
+    ByType, ByWord, ByAction = {}, {}, {}
+    for Event in ReadEvents():
+        if Event.get('profile') != ProfileName:
+            continue
+        if Event['event'] == "answer" and Event['seconds'] is not None:
+            ByType.setdefault(Event['test'], []).append(Event['seconds'])
+            ByWord.setdefault(Event['word'], []).append(Event['seconds'])
+        elif Event['event'] == "menu":
+            ByAction.setdefault(Event['action'], []).append(Event['seconds'])
+
+    Types = {Name: LatencySummary(Times) for Name, Times in sorted(ByType.items())}
+    Actions = {Name: LatencySummary(Times) for Name, Times in sorted(ByAction.items())}
+    # Slowest words first, only those answered often enough for the percentiles to mean something
+    Words = sorted(((word, LatencySummary(Times)) for word, Times in ByWord.items() if len(Times) >= Arguments.min_answers),
+                   key=lambda Item: (-Item[1]['p95'], Item[0]))[:Arguments.n]
+
+    Row = "{:<32}{:>8}{:>10}{:>10}{:>10}"
+    Text = []
+    for Title, Items in (("Test type", Types.items()), ("Word", Words), ("Menu action", Actions.items())):
+        Text += ["", Row.format(Title, "count", "p50 s", "p95 s", "p99 s")]
+        Text += [Row.format(Name, Summary['count'], "{:.2f}".format(Summary['p50']), "{:.2f}".format(Summary['p95']), "{:.2f}".format(Summary['p99'])) for Name, Summary in Items]
+        if not Items:
+            Text.append("No events yet")
+    PrintOutput(Arguments, {'profile': ProfileName, 'types': Types, 'words': dict(Words), 'menu': Actions}, Text[1:])
+    return 0
+
+def CommandHardest(Arguments):
+    Rows = HardestWords(Arguments.n, Arguments.min_answers)
+    Data = [{'word': word, 'answers': Answers, 'correct': Correct, 'accuracy': round(Correct / Answers, 3)} for word, Answers, Correct in Rows]
+    PrintOutput(Arguments, Data, ["{:<24}{:>4}/{:<4}{:>6.0f}%".format(Item['word'], Item['correct'], Item['answers'], Item['accuracy'] * 100) for Item in Data]
+                or ["No word has been answered {} times yet".format(Arguments.min_answers)])
+    return 0
+
+def CommandUpdateVocabulary(Arguments):
+    Added = AddMissingVocabulary()
+    PrintOutput(Arguments, {'added': Added, 'vocabulary': len(VocabDictionary)}, ["Added {} words. Current length is {}".format(Added, len(VocabDictionary))])
+    return 0
+
+TestNames = {
+    'mcq-learnt': "MCQ (Learnt Words)",
+    'mcq-random': "MCQ (Random Words)",
+    'written-learnt': "Written Test (Learnt Words)",
+    'written-random': "Written Test (Random Words)",
+}
+
+def BuildTest(TestType, NoOfQuestions, Rng, Hard=False, Due=False, Adaptive=False):
+    '''
+    Form of a test named as in TestNames, and the scheduler to record the answers in (None for random words).
+    Used by the test command and the server.
+    '''
+    QuestionWords = GetQuestionBank()
+    Scheduler = None
+    if TestType.endswith("learnt"):
+        WordDictionary = LoadTestedWords()
+        Scheduler = ReviewScheduler()
+        if Due:
+            Items = [(word, WordDictionary[word]) for word in Scheduler.DueWords(NoOfQuestions)]
+        elif Adaptive:
+            Items = [(word, WordDictionary[word]) for word in GetAdaptiveSampler().Draw(NoOfQuestions, Rng)]
+        else:
+            Items = Rng.sample(list(WordDictionary.items()), min(NoOfQuestions, len(WordDictionary)))
+    else:
+        Items = QuestionWords.Sample(min(NoOfQuestions, len(QuestionWords)), Rng)
+    Hard = Hard and QuestionWords.LoadNeighbours()
+    return QuestionWords.BuildTestForm(Items, NoOfChoices if TestType.startswith("mcq") else 0, Rng, Hard), Scheduler
+
+def QuestionPrompt(Question):
+    # A question without its answer, as shown to another program
+    return {'type': Question['Type'], 'prompt': Question['Word'] if Question['Type'] == "Synonym To Meaning" else Question['Definition'], 'choices': Question['Choices']}
+
+def CommandTest(Arguments):
+    '''
+    Build a test form and, with --answers, grade the answers in the file (one per line, in question order).
+    Without --answers the questions are printed so they can be answered by another program.
+    '''
+    Rng = random.Random(Arguments.seed if Arguments.seed is not None else TestSeed)
+    Form, Scheduler = BuildTest(Arguments.type, Arguments.n, Rng, Arguments.hard, Arguments.due, Arguments.adaptive)
+
+    if Arguments.answers is None:
+        Data = [QuestionPrompt(Question) for Question in Form]
+        Text = []
+        for Number, Item in enumerate(Data, 1):
+            Text.append("{}. {}".format(Number, Item['prompt']))
+            Text.extend("   {}. {}".format(i, Choice) for i, Choice in enumerate(Item['choices'], 1))
+        PrintOutput(Arguments, Data, Text)
+        return 0
+
+    f = sys.stdin if Arguments.answers == "-" else open(Arguments.answers, 'r')
+    Answers = [line.strip() for line in f.readlines()]
+    if f is not sys.stdin:
+        f.close()
+
+    Results = []
+    StartTime = time.time()
+    for Number, Question in enumerate(Form):
+        Answer = Answers[Number] if Number < len(Answers) else ""
+        if Question['Type'] != "Written":
+            Answer = int(Answer) if Answer.isnumeric() else Answer
+        Grade = GradeAnswer(Question, Answer)
+        Correct = Grade == "correct"
+        if Scheduler is not None and not Arguments.no_save:
+            Scheduler.Review(Question['Word'], AnswerQuality(Question, Grade))
+        if not Arguments.no_save:
+            RecordAnswer(TestNames[Arguments.type], Question, Answer, Correct, None)
+        Results.append({'word': Question['Word'], 'answer': Answer, 'correct': Correct, 'grade': Grade})
+    EndTime = time.time()
+    if Scheduler is not None and not Arguments.no_save:
+        Scheduler.Save()
+
+    Correct = sum(1 for Result in Results if Result['correct'])
+    if not Arguments.no_save:
+        SaveTestScores(TestNames[Arguments.type], Correct, len(Results), EndTime - StartTime)
+    Text = ["{} {}".format({'correct': "✅", 'near-miss': "✳️", 'wrong': "❌"}[Result['grade']], Result['word']) for Result in Results]
+    Text.append("Score: {}/{}".format(Correct, len(Results)))
+    PrintOutput(Arguments, {'test': TestNames[Arguments.type], 'score': Correct, 'questions': len(Results), 'results': Results}, Text)
+    return 0
+
+ServerHost = "127.0.0.1"
+ServerPort = 8080
+ServerSessionTimeout = 3600        # Seconds an unused learning or test session is kept
+ServerMaxRequestSize = 1024 * 1024 # Largest request body accepted, in bytes
+
+class HTTPError(Exception):
+    def __init__(self, Status, Message):
+        super().__init__(Message)
+        self.Status = Status
+
+class QuizServer():
+    '''
+    HTTP JSON API for many learners at once, started with python main.py serve (routes are in the README).
+    The word lists, vocabulary and indexes are loaded once and shared by every client. Requests are
+    handled one at a time on a single asyncio event loop, so they never need locks, and learning and
+    test sessions are kept in memory until they finish or are unused for ServerSessionTimeout seconds.
+    Every request can name a profile with the profile query parameter or field, "default" otherwise.
+    '''
+    def __init__(self):
+        self.Sessions = {}
+        self.Routes = [
+            ("GET", re.compile(r"/lists"), self.Lists),
+            ("GET", re.compile(r"/lists/(?P<ListName>[^/]+)"), self.ListWords),
+            ("GET", re.compile(r"/search"), self.Search),
+            ("GET", re.compile(r"/meaning"), self.Meaning),
+            ("POST", re.compile(r"/learn"), self.StartLearning),
+            ("POST", re.compile(r"/learn/(?P<SessionId>\w+)/next"), self.NextWord),
+            ("POST", re.compile(r"/tests"), self.StartTest),
+            ("POST", re.compile(r"/tests/(?P<SessionId>\w+)/answer"), self.Answer),
+        ]
+
+    def Load(self):
+        # Everything a request could need, so the first clients do not wait for it
+        GlobalDictionary.Load()
+        GetSearchIndex()
+        GetFullTextIndex()
+        GetQuestionBank()
+        GetProgressStore()
+
+    def NewSession(self, Session):
+        Now = time.monotonic()
+        for SessionId in [SessionId for SessionId, Old in self.Sessions.items() if Now - Old['Used'] > ServerSessionTimeout]:
+            del self.Sessions[SessionId]
+        SessionId = os.urandom(8).hex()
+        Session['Used'] = Now
+        self.Sessions[SessionId] = Session
+        return SessionId
+
+    def GetSession(self, SessionId, Kind):
+        Session = self.Sessions.get(SessionId)
+        if Session is None or Session['Kind'] != Kind:
+            raise HTTPError(404, "No such {} session".format(Kind))
+        Session['Used'] = time.monotonic()
+        UseProfile(Session['Profile'])
+        return Session
+
+    def Lists(self, Request):
+        return {ListName: len(GlobalDictionary[ListName]) for ListName in GlobalDictionary.keys()}
+
+    def ListWords(self, Request, ListName):
+        if ListName not in GlobalDictionary:
+            raise HTTPError(404, "No such list")
+        # Clamped, a negative n would slice from the end of the list
+        Start = max(Request.Integer('start', 1), 1)
+        return GlobalDictionary[ListName][Start - 1:Start - 1 + max(Request.Integer('n', 20), 0)]
+
+    def Search(self, Request):
+        Index = GetSearchIndex()
+        word = Request.Text('word')
+        Match = Index.Get(word)
+        if Match is None:
+            return {'word': word, 'found': False, 'suggestions': Index.Suggest(word), 'completions': Index.Prefix(word)}
+        return {'word': Match, 'found': True, 'entry': VocabDictionary[Match]}
+
+    def Meaning(self, Request):
+        Results = GetFullTextIndex().Search(Request.Text('q'), Request.Integer('n', 10))
+        return [{'word': word, 'score': round(Score, 3), 'definition': VocabDictionary[word].get('Definition', '')} for word, Score in Results]
+
+    def StartLearning(self, Request):
+        # Like Learn from a list: n words of a list in random or serial order, from position start
+        ListName = Request.Text('list')
+        if ListName not in GlobalDictionary:
+            raise HTTPError(404, "No such list")
+        Words = GlobalDictionary[ListName]
+        NoOfWords = min(Request.Integer('n', 20), len(Words))
+        if NoOfWords < 1:
+            raise HTTPError(400, "n must be at least 1")
+        if Request.Text('order', "random") == "random":
+            Words = random.Random(Request.Integer('seed', None)).sample(Words, NoOfWords)
+        else:
+            Start = max(Request.Integer('start', 1), 1)
+            Words = Words[Start - 1:Start - 1 + NoOfWords]
+        SessionId = self.NewSession({'Kind': "learn", 'Profile': ProfileName, 'Words': Words, 'Position': 0})
+        return {'session': SessionId, 'words': len(Words)}
+
+    def NextWord(self, Request, SessionId):
+        # The next word of the session with its explanation, it is saved as learnt
+        Session = self.GetSession(SessionId, "learn")
+        if Session['Position'] >= len(Session['Words']):
+            del self.Sessions[SessionId]
+            return {'done': True}
+        Item = Session['Words'][Session['Position']]
+        Session['Position'] += 1
+        SaveTestedWords([(Item['word'], Item['Definition'])])
+        Entry = VocabDictionary[Item['word']] if Item['word'] in VocabDictionary else {}
+        return {'done': False, 'number': Session['Position'], 'word': Item['word'], 'definition': Item['Definition'], 'entry': Entry}
+
+    def StartTest(self, Request):
+        TestType = Request.Text('type')
+        if TestType not in TestNames:
+            raise HTTPError(400, "type must be one of " + ", ".join(TestNames))
+        NoOfQuestions = Request.Integer('n', 10)
+        if NoOfQuestions < 1:
+            raise HTTPError(400, "n must be at least 1")
+        Rng = random.Random(Request.Integer('seed', TestSeed))
+        Form, Scheduler = BuildTest(TestType, NoOfQuestions, Rng, Request.Boolean('hard'), Request.Boolean('due'), Request.Boolean('adaptive'))
+        if len(Form) == 0:
+            raise HTTPError(400, "There are no words for this test, learn some words first" if TestType.endswith("learnt") else "There are no words for this test")
+        SessionId = self.NewSession({'Kind': "test", 'Profile': ProfileName, 'Type': TestType, 'Form': Form, 'Scheduler': Scheduler,
+                                     'Answered': 0, 'Correct': 0, 'StartTime': time.time(), 'QuestionStart': time.perf_counter()})
+        return {'session': SessionId, 'questions': [QuestionPrompt(Question) for Question in Form]}
+
+    def Answer(self, Request, SessionId):
+        # Grade the answer to the next question, the score is saved after the last one
+        Session = self.GetSession(SessionId, "test")
+        if Session['Answered'] >= len(Session['Form']):
+            raise HTTPError(409, "Every question of this test has been answered")
+        Question = Session['Form'][Session['Answered']]
+        Answer = Request.Value('answer', "")
+        if Question['Type'] != "Written":
+            # Choices are numbered from 1, JSON true is not choice 1
+            Answer = int(Answer) if isinstance(Answer, str) and Answer.isdecimal() else Answer
+            if type(Answer) is not int or not 1 <= Answer <= len(Question['Choices']):
+                raise HTTPError(400, "answer must be a choice from 1 to {}".format(len(Question['Choices'])))
+        Grade = GradeAnswer(Question, Answer)
+        Correct = Grade == "correct"
+        # From sending the question (or the previous answer) to getting the answer, network time included
+        RecordAnswer(TestNames[Session['Type']], Question, Answer, Correct, time.perf_counter() - Session['QuestionStart'])
+        Session['QuestionStart'] = time.perf_counter()
+        if Session['Scheduler'] is not None:
+            Session['Scheduler'].Review(Question['Word'], AnswerQuality(Question, Grade))
+        Session['Answered'] += 1
+        Session['Correct'] += 1 if Correct else 0
+        Data = {'correct': Correct, 'grade': Grade, 'word': Question['Word'], 'definition': Question['Definition'], 'score': Session['Correct'], 'answered': Session['Answered'], 'questions': len(Session['Form'])}
+        if Session['Answered'] == len(Session['Form']):
+            # The finished session is kept until it expires, so answering again is a 409 and not a 404
+            if Session['Scheduler'] is not None:
+                Session['Scheduler'].Save()
+                Session['Scheduler'] = None
+            SaveTestScores(TestNames[Session['Type']], Session['Correct'], len(Session['Form']), time.time() - Session['StartTime'])
+        return Data
+
+    def Dispatch(self, Method, Target, Body):
+        from urllib.parse import urlsplit, parse_qsl, unquote
+
+        Parts = urlsplit(Target)
+        Path = Parts.path.rstrip("/") or "/"
+        Allowed = False
+        for RouteMethod, Pattern, Handler in self.Routes:
+            Match = Pattern.fullmatch(Path)
+            if Match is None:
+                continue
+            Allowed = True
+            if RouteMethod != Method:
+                continue
+            try:
+                Fields = json.loads(Body) if Body else {}
+            except ValueError:
+                raise HTTPError(400, "The body is not valid JSON")
+            if not isinstance(Fields, dict):
+                raise HTTPError(400, "The body must be a JSON object")
+            Request = ServerRequest(dict(parse_qsl(Parts.query)), Fields)
+            UseProfile(Request.Text('profile', "default"))
+            return Handler(Request, **{key: unquote(value) for key, value in Match.groupdict().items()})
+        raise HTTPError(405 if Allowed else 404, "Method not allowed" if Allowed else "Not found")
+
+    async def HandleConnection(self, Reader, Writer):
+        # One client connection, kept open between requests unless the client asks to close it
+        import asyncio
+
+        try:
+            while True:
+                RequestLine = await Reader.readline()
+                if not RequestLine:
+                    break
+                Headers = {}
+                while True:
+                    line = await Reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    Name, _, Value = line.decode('latin-1').partition(":")
+                    Headers[Name.strip().lower()] = Value.strip()
+                try:
+                    Method, Target, Version = RequestLine.decode('latin-1').split()
+                    Length = int(Headers.get('content-length', 0))
+                    if Length > ServerMaxRequestSize:
+                        raise HTTPError(413, "Request too large")
+                    Body = await Reader.readexactly(Length)
+                    Status, Data = 200, self.Dispatch(Method, Target, Body)
+                    KeepAlive = Version == "HTTP/1.1" and Headers.get('connection', "").lower() != "close"
+                except HTTPError as Error:
+                    Status, Data, KeepAlive = Error.Status, {'error': str(Error)}, Error.Status != 413
+                except ValueError:
+                    Status, Data, KeepAlive = 400, {'error': "Bad request"}, False
+                except Exception as Error:
+                    print("Error while handling {!r}: {!r}".format(RequestLine, Error), file=sys.stderr)
+                    Status, Data, KeepAlive = 500, {'error': "Internal server error"}, False
+                Content = json.dumps(Data, ensure_ascii=False).encode('utf-8')
+                Writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json; charset=utf-8\r\nContent-Length: {}\r\nConnection: {}\r\n\r\n".format(
+                    Status, ServerStatusNames.get(Status, ""), len(Content), "keep-alive" if KeepAlive else "close").encode('latin-1') + Content)
+                await Writer.drain()
+                if not KeepAlive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            Writer.close()
+
+    async def Serve(self, Host, Port):
+        import asyncio
+
+        Server = await asyncio.start_server(self.HandleConnection, Host, Port, backlog=1024)
+        print("Serving on http://{}:{}".format(Host, Port), flush=True)
+        async with Server:
+            await Server.serve_forever()
+
+ServerStatusNames = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+class ServerRequest():
+    # Query string and JSON body of a request, a field in the body wins over the query string
+    def __init__(self, Query, Fields):
+        self.Query = Query
+        self.Fields = Fields
+
+    def Value(self, Name, Default=None):
+        return self.Fields.get(Name, self.Query.get(Name, Default))
+
+    def Text(self, Name, Default=None):
+        Value = self.Value(Name, Default)
+        if Value is None:
+            raise HTTPError(400, "{} is required".format(Name))
+        return str(Value)
+
+    def Boolean(self, Name, Default=False):
+        # true/false in the body, or 1/0, true/false or yes/no in the query string
+        Value = self.Value(Name, Default)
+        if isinstance(Value, bool):
+            return Value
+        if str(Value).strip().lower() in ("1", "true", "yes"):
+            return True
+        if str(Value).strip().lower() in ("0", "false", "no", ""):
+            return False
+        raise HTTPError(400, "{} must be true or false".format(Name))
+
+    def Integer(self, Name, Default):
+        Value = self.Value(Name, Default)
+        if Value is None:
+            return None
+        try:
+            return int(Value)
+        except (TypeError, ValueError):
+            raise HTTPError(400, "{} must be a number".format(Name))
+
+def CommandServe(Arguments):
+    import asyncio
+
+    Server = QuizServer()
+    Server.Load()
+    try:
+        asyncio.run(Server.Serve(Arguments.host, Arguments.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def RunCommand(Argv):
+    '''
+    Non-interactive entry point, e.g. python main.py search abase
+    Every command prints plain text, or JSON with --json.
+    '''
+    global OfflineMode
+
+    Parser = argparse.ArgumentParser(prog="main.py", description="GRE Preparation Tool. Run without a command for the interactive menu.")
+    Parser.add_argument("--profile", help="whose progress to use, default is $GRE_PROFILE or \"default\"")
+    Parser.add_argument("--offline", action="store_true", help="only use pages from the response cache, also $GRE_OFFLINE=1")
+    Commands = Parser.add_subparsers(dest="command")
+
+    Command = Commands.add_parser("search", help="Show the vocabulary entry of a word")
+    Command.add_argument("word")
+    Command.set_defaults(function=CommandSearch)
+
+    Command = Commands.add_parser("meaning", help="Find words by describing their meaning")
+    Command.add_argument("query")
+    Command.add_argument("--n", type=int, default=10, help="number of words to show")
+    Command.set_defaults(function=CommandMeaning)
+
+    Command = Commands.add_parser("lists", help="Show the word lists and their lengths, or the words in some lists and not others")
+    Command.add_argument("--containing", metavar="WORD", help="show the lists that contain WORD")
+    Command.add_argument("--in", dest="lists", nargs="+", metavar="LIST", help="show the words in any of these lists (all lists by default)")
+    Command.add_argument("--not-in", dest="without", nargs="+", metavar="LIST", help="leave out the words in these lists")
+    Command.set_defaults(function=CommandLists)
+
+    Command = Commands.add_parser("export", help="Save word lists, their vocabulary and your learnt words to a compressed deck file")
+    Command.add_argument("file")
+    Command.add_argument("--lists", nargs="+", metavar="LIST", help="only these lists")
+    Command.add_argument("--no-vocabulary", action="store_true", help="leave out the vocabulary entries")
+    Command.add_argument("--no-progress", action="store_true", help="leave out the learnt words")
+    Command.set_defaults(function=CommandExport)
+
+    Command = Commands.add_parser("import", help="Merge a deck file into the word lists, vocabulary and learnt words")
+    Command.add_argument("file")
+    Command.add_argument("--no-progress", action="store_true", help="do not add the learnt words")
+    Command.set_defaults(function=CommandImport)
+
+    Command = Commands.add_parser("add-lists", help="Fetch many vocabulary.com lists at once and scrape their new words")
+    Command.add_argument("manifest", nargs="?", help="file with one list per line: its URL, a space and its name")
+    Command.add_argument("--list", nargs=2, action="append", metavar=("URL", "NAME"), help="a list to add, can be given several times")
+    Command.set_defaults(function=CommandAddLists)
+
+    Command = Commands.add_parser("cache", help="Show the size of the cache of fetched pages")
+    Command.add_argument("--clear", action="store_true", help="remove every cached page")
+    Command.add_argument("--reparse", action="store_true", help="parse the cached word pages again and update the vocabulary")
+    Command.set_defaults(function=CommandCache)
+
+    Command = Commands.add_parser("vocab-size", help="Show the number of words in the vocabulary")
+    Command.set_defaults(function=CommandVocabularySize)
+
+    Command = Commands.add_parser("stats", help="Show test score statistics and streaks")
+    Command.set_defaults(function=CommandStats)
+
+    Command = Commands.add_parser("calendar", help="Show the days with practice of a month or a year")
+    Command.add_argument("when", nargs="?", help="yyyy-mm or yyyy, this month by default")
+    Command.set_defaults(function=CommandCalendar)
+
+    Command = Commands.add_parser("profiles", help="Show the profiles and their progress")
+    Command.set_defaults(function=CommandProfiles)
+
+    Command = Commands.add_parser("report", help="Show p50/p95/p99 answer times per test type and word, and menu action times")
+    Command.add_argument("--n", type=int, default=20, help="slowest words to show")
+    Command.add_argument("--min-answers", type=int, default=2, help="answers a word needs to be shown")
+    Command.set_defaults(function=CommandReport)
+
+    Command = Commands.add_parser("hardest", help="Show the words you get wrong most often in tests")
+    Command.add_argument("--n", type=int, default=50, help="number of words")
+    Command.add_argument("--min-answers", type=int, default=3, help="answers a word needs to be shown")
+    Command.set_defaults(function=CommandHardest)
+
+    Command = Commands.add_parser("update-vocab", help="Scrape the words missing from the vocabulary")
+    Command.set_defaults(function=CommandUpdateVocabulary)
+
+    Command = Commands.add_parser("test", help="Generate a test, and grade it with --answers")
+    Command.add_argument("type", choices=list(TestNames.keys()))
+    Command.add_argument("--n", type=int, default=10, help="number of questions")
+    Command.add_argument("--answers", help="file with one answer per line (option number or word), - for stdin")
+    Command.add_argument("--seed", type=int, help="seed for a reproducible test")
+    Command.add_argument("--hard", action="store_true", help="use similar meanings as MCQ options")
+    Command.add_argument("--due", action="store_true", help="only ask learnt words that are due for review")
+    Command.add_argument("--adaptive", action="store_true", help="ask mostly the learnt words you miss or have not answered for a while")
+    Command.add_argument("--no-save", action="store_true", help="do not record the score, the answers or the review schedule")
+    Command.set_defaults(function=CommandTest)
+
+    Command = Commands.add_parser("serve", help="Serve search, lists, learning and tests to many clients over HTTP")
+    Command.add_argument("--host", default=ServerHost)
+    Command.add_argument("--port", type=int, default=ServerPort)
+    Command.set_defaults(function=CommandServe)
+
+    for Command in Commands.choices.values():
+        Command.add_argument("--json", action="store_true", help="print JSON instead of text")
+
+    Arguments = Parser.parse_args(Argv)
+    if Arguments.profile is not None:
+        UseProfile(Arguments.profile)
+    if Arguments.offline:
+        OfflineMode = True
+    if Arguments.command is None:
+        main()
+        return 0
+    return Arguments.function(Arguments)
+
+def StartupProfile():
+    '''
+    Report how long it takes to get to the menu and which imports take the longest.
+    The program is started twice in a fresh interpreter: once to time it and once with -X importtime.
+    '''
+    import subprocess
+
+    Command = [sys.executable, str(DataFolder / "main.py"), "--startup-profile-child"]
+    StartTime = time.perf_counter()
+    Child = subprocess.run(Command, capture_output=True, text=True)
+    WallTime = time.perf_counter() - StartTime
+    Timings = json.loads(Child.stdout.strip().splitlines()[-1])
+
+    Child = subprocess.run([sys.executable, "-X", "importtime"] + Command[1:], capture_output=True, text=True)
+    Imports = []
+    Nested = []
+    for line in Child.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, Cumulative, Package = line[len("import time:"):].split("|")
+        # Each level is indented by two more spaces and listed before the package importing it.
+        # The imports of greprep are one level down, deeper ones are already in their parent's cumulative time.
+        Depth = (len(Package) - len(Package.lstrip()) - 1) // 2
+        if Depth == 1:
+            Nested.append((int(Cumulative) / 1000, Package.strip()))
+        elif Depth == 0:
+            if Package.strip() == "greprep":
+                Imports += Nested
+            else:
+                Imports.append((int(Cumulative) / 1000, Package.strip()))
+            Nested = []
+    Imports.sort(reverse=True)
+
+    print("\n-----------------------------------")
+    print("\n        Startup Profile")
+    print("\n-----------------------------------")
+    print("\nTime to menu (process start to menu) : {:8.1f} ms".format(WallTime * 1000))
+    print("  Interpreter startup               : {:8.1f} ms".format(max(0.0, WallTime - Timings['Total']) * 1000))
+    print("  Loading greprep.py                : {:8.1f} ms".format(Timings['Load'] * 1000))
+    print("  Imports in greprep.py             : {:8.1f} ms".format(Timings['Imports'] * 1000))
+    print("  Rest of greprep.py                : {:8.1f} ms".format(Timings['Module'] * 1000))
+    print("  Opening progress.db and menu      : {:8.1f} ms".format(Timings['Menu'] * 1000))
+    print("\nSlowest imports (cumulative, measured with -X importtime):\n")
+    for Milliseconds, Package in Imports[:15]:
+        print("  {:8.1f} ms  {}".format(Milliseconds, Package))
+    print()
+
+def StartupProfileChild():
+    # Time the path to the menu without the side effects of StartSession
+    ModuleTime = time.perf_counter()
+    with open(os.devnull, 'w') as Null:
+        Stdout = sys.stdout
+        sys.stdout = Null
+        GetProgressStore()
+        PrintMenu()
+        Terminal.Show()
+        sys.stdout = Stdout
+    MenuTime = time.perf_counter()
+    print(json.dumps({
+        'Load': ModuleStartTime - ProgramStartTime,
+        'Imports': ImportsDoneTime - ModuleStartTime,
+        'Module': ModuleTime - ImportsDoneTime,
+        'Menu': MenuTime - ModuleTime,
+        'Total': MenuTime - ProgramStartTime,
+    }))
+
+def Start(Arguments, StartTime=None):
+    '''
+    Entry point called by main.py with the command line arguments and the time it started, returns the exit status
+    '''
+    global ProgramStartTime
+    if StartTime is not None:
+        ProgramStartTime = StartTime
+    if Arguments == ["--startup-profile"]:
+        StartupProfile()
+        return 0
+    if Arguments == ["--startup-profile-child"]:
+        StartupProfileChild()
+        return 0
+    LoadHookModules()
+    if len(Arguments) > 0:
+        return RunCommand(Arguments)
+    main()
+    return 0
+
+if __name__=='__main__':
+    sys.exit(Start(sys.argv[1:]))
@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import greprep
+
+def Page(Seed):
+    # Random bytes do not compress, so each page takes about its length in the cache
+    import random
+
+    return random.Random(Seed).randbytes(5000)
+
+def test_replaced_page_drops_its_old_body(tmp_path):
+    Cache = greprep.ResponseCache(tmp_path, 6000)
+    Cache.Put("https://example.com/a", Page(1))
+    Cache.Put("https://example.com/a", Page(2))
+    assert Cache.Stats()['responses'] == 1
+    assert Cache.Stats()['bodies'] == 1
+    assert Cache.TotalSize <= 6000
+    assert Cache.Get("https://example.com/a")['Content'] == Page(2)
+    assert len([File for File in (tmp_path / "objects").rglob("*") if File.is_file()]) == 1
+
+def test_shared_body_is_kept_when_one_url_changes(tmp_path):
+    Cache = greprep.ResponseCache(tmp_path, 10 ** 6)
+    Cache.Put("https://example.com/a", Page(1))
+    Cache.Put("https://example.com/b", Page(1))
+    Cache.Put("https://example.com/a", Page(2))
+    assert Cache.Get("https://example.com/b")['Content'] == Page(1)
+    assert Cache.Stats()['bodies'] == 2
+    Cache.Clear()
+    assert Cache.Stats() == {'responses': 0, 'bodies': 0, 'bytes': 0, 'max_bytes': 10 ** 6}
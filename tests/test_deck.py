@@ -0,0 +1,41 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import greprep
+
+def Store(Folder):
+    (Folder / "vocabulary.json").write_text(json.dumps({'abase': {'Definition': "cause to feel shame"}}))
+    return greprep.VocabularyStore(Folder / "vocabulary.json", Folder / "vocabulary.idx", Folder / "vocabulary.dat", Folder / "vocabulary.journal")
+
+@pytest.mark.parametrize("line", [
+    '["deck"]',
+    '{"type": "entry", "entry": {}}',
+    '{"type": "word", "list": "Barrons 333", "word": "abase"}',
+    '{"type": "learnt", "word": "abase", "definition": "cause to feel shame", "ease": 2.5, "interval": true, "repetitions": 1, "due": "2022-08-15"}',
+    'not json',
+])
+def test_bad_records_name_their_line(line):
+    with pytest.raises(ValueError, match="line 7"):
+        greprep.ReadDeckRecord("barrons.deck.gz", 7, line)
+
+def test_records_of_later_types_are_read():
+    assert greprep.ReadDeckRecord("barrons.deck.gz", 2, '{"type": "note", "text": 1}') == {'type': "note", 'text': 1}
+
+def test_failed_merge_removes_its_file(tmp_path):
+    Vocabulary = Store(tmp_path)
+
+    def Entries():
+        yield 'abet', {'Definition': "assist or encourage"}
+        raise ValueError("line 3")
+
+    with pytest.raises(ValueError):
+        Vocabulary.Merge(Entries())
+    assert not (tmp_path / "vocabulary.dat.merge").exists()
+    assert 'abet' not in Vocabulary
+    assert Vocabulary.Merge([('abet', {'Definition': "assist or encourage"})]) == 1
+    assert Vocabulary['abet'] == {'Definition': "assist or encourage"}
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import greprep
+
+Entries = {
+    'secrete': {
+        'Definition': "generate and separate from cells or bodily fluids",
+        'Short Explanation': "Secrete is all about secrets. It means both \"to hide\" and \"to release.\" When you squeeze a lemon, it secretes juice.",
+        'Long Explanation': "It's easy to remember that secrete's all about secrets when you see the word secret inside secrete. "
+                            "Imagine the first person who squeezed a lemon and secreted the juice.",
+    },
+    'clandestine': {
+        'Definition': "conducted with or marked by hidden aims or methods",
+        'Synonyms': "cloak-and-dagger, hole-and-corner, secret, undercover",
+        'Short Explanation': "Something clandestine is done in secret, often because it is illicit.",
+    },
+    'furtive': {
+        'Definition': "secret and sly or sordid",
+        'Short Explanation': "Furtive describes sneaky, secretive behavior.",
+    },
+    'lemon': {
+        'Definition': "yellow oval fruit with juicy acidic flesh",
+    },
+}
+
+def Build():
+    Index = greprep.FullTextIndex()
+    for word, Entry in Entries.items():
+        Index.Add(word, Entry)
+    return Index
+
+def test_stem():
+    assert greprep.Stem("secrecy") == "secret"
+    assert greprep.Stem("secretive") == "secret"
+    assert greprep.Stem("secrete") == "secrete"
+    assert greprep.Stem("secretes") == "secrete"
+    assert greprep.Stem("hides") == "hide"
+    assert greprep.Stem("brushes") == "brush"
+
+def test_secret_does_not_rank_secrete_first():
+    Index = Build()
+    for Query in ["keeping something secret", "secrecy", "secret"]:
+        Results = [word for word, _ in Index.Search(Query)]
+        assert Results[0] != "secrete", Query
+        assert Results[0] in ("clandestine", "furtive"), Query
+
+def test_partial_words_are_completed():
+    assert [word for word, _ in Build().Search("clandest")] == ["clandestine"]
+
+def test_synchronize_reindexes_changed_entries():
+    Index = Build()
+
+    class Vocabulary(dict):
+        def Checksum(self, key):
+            return greprep.EntryChecksum(self[key])
+
+    Changed = Vocabulary(Entries)
+    Changed['lemon'] = {'Definition': "a piece of equipment that does not work properly"}
+    Index.Synchronize(Changed)
+    assert [word for word, _ in Index.Search("equipment")] == ["lemon"]
+    assert Index.Search("yellow") == []